@@ -1,4 +1,11 @@
 # Assuming you have not changed the general structure of the template no modification is needed in this file.
+from .lib.generalUtils.timing_utils import PhaseTimer
+
+# Fusion's launch time is shared by every add-in, so startup should cost next to nothing. Only the command buttons
+# are registered here, the command modules are imported when a command is first run.
+STARTUP_TIMER = PhaseTimer("Started add-in")
+STARTUP_TIMER.mark("import")
+
 from . import commands
 from .lib import fusionAddInUtils as futil
 
@@ -6,7 +13,10 @@ from .lib import fusionAddInUtils as futil
 def run(context):
     try:
         # This will run the start function in each of your commands as defined in commands/__init__.py
+        STARTUP_TIMER.mark("register")
         commands.start()
+        STARTUP_TIMER.stop()
+        futil.info(STARTUP_TIMER.summary)
 
     except:
         futil.handle_error('run')
@@ -21,4 +31,4 @@ def stop(context):
         commands.stop()
 
     except:
-        futil.handle_error('stop')
\ No newline at end of file
+        futil.handle_error('stop')
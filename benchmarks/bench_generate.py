@@ -0,0 +1,162 @@
+"""Benchmark panel generation against the recording fake adsk package.
+
+Sweeps every panel format, HP widths 2-104, all anchor points and all support types through
+generatePanelComponent, counting every (fake) Fusion API call and the wall time per configuration.
+Call counts are compared against the stored baseline, so changes that add API churn are caught
+without Fusion.
+
+Usage:
+    python benchmarks/bench_generate.py                      # compare against baseline.json
+    python benchmarks/bench_generate.py --update-baseline    # overwrite baseline.json
+    python benchmarks/bench_generate.py --preview --hp 2-12  # reduced-fidelity preview profile, subset of widths
+    python benchmarks/bench_generate.py --hole-map benchmarks/hole_map.json --hp 20-104  # busy panels, 60+ holes
+    python benchmarks/bench_generate.py --baked              # history-free base feature output
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+import types
+from collections import Counter, defaultdict
+from os.path import abspath, dirname, join
+
+BENCHMARKS_DIR = dirname(abspath(__file__))
+ADDIN_DIR = dirname(BENCHMARKS_DIR)
+BASELINE_FILE = join(BENCHMARKS_DIR, "baseline.json")
+ADDIN_PACKAGE = "addin"
+
+# The fake adsk package must win over any real one
+sys.path.insert(0, join(BENCHMARKS_DIR, "fake_adsk"))
+
+import adsk.core  # noqa: E402
+import adsk.fusion  # noqa: E402
+from adsk import recorder  # noqa: E402
+
+
+def loadAddin():
+    # The add-in folder name isn't a valid identifier (and is renamed on release), so mount it under an alias
+    package = types.ModuleType(ADDIN_PACKAGE)
+    package.__path__ = [ADDIN_DIR]
+    sys.modules[ADDIN_PACKAGE] = package
+    return (
+        importlib.import_module(f"{ADDIN_PACKAGE}.lib.panelUtils.panel_options"),
+        importlib.import_module(f"{ADDIN_PACKAGE}.lib.panelUtils.panel_generate"),
+    )
+
+
+def parseRange(value: str):
+    start, _, end = value.partition("-")
+    return range(int(start), int(end or start) + 1)
+
+
+def run(hpRange: range, preview: bool, holeMapFile: str, baked: bool):
+    panel_options, panel_generate = loadAddin()
+    opts = panel_options.PanelOptions("__benchmark_no_defaults__.json")
+    opts.holeMapFile = holeMapFile
+    opts.bakedOutput = baked
+    design = adsk.fusion.Design.cast(adsk.core.Application.get().activeProduct)
+
+    groups = defaultdict(lambda: {"configs": 0, "calls": 0, "solves": 0, "seconds": 0.0})
+    breakdown: Counter[str] = Counter()
+
+    for formatId in opts.formatIds:
+        for supportType in opts.supportTypeIds:
+            for anchorPoint in opts.anchorPointIds:
+                group = groups[f"{formatId}/{supportType}/{anchorPoint}"]
+                for widthInHp in hpRange:
+                    opts.formatId = formatId
+                    opts.supportType = supportType
+                    opts.anchorPoint = anchorPoint
+                    opts.widthInHp = widthInHp
+                    component = adsk.fusion.Component(design)
+
+                    recorder.reset()
+                    start = time.perf_counter()
+                    panel_generate.generatePanelComponent(component, opts, preview)
+                    group["seconds"] += time.perf_counter() - start
+
+                    group["configs"] += 1
+                    group["solves"] += recorder.calls["Sketch.solve"]
+                    group["calls"] += recorder.total() - recorder.calls["Sketch.solve"]
+                    breakdown.update(recorder.calls)
+
+    return dict(groups), breakdown
+
+
+def compare(groups: dict, baseline: dict):
+    regressions = []
+    for key, group in groups.items():
+        expected = baseline.get(key)
+        if not expected or expected["configs"] != group["configs"]:
+            continue
+        for metric in ["calls", "solves"]:
+            if group[metric] > expected[metric]:
+                regressions.append(f"{key}: {metric} {expected[metric]} -> {group[metric]}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hp", default="2-104", help="HP widths to sweep, eg. 2-104 or 6")
+    parser.add_argument("--preview", action="store_true", help="benchmark the reduced-fidelity preview profile")
+    parser.add_argument("--hole-map", default="", help="cut the holes of this hole map file into every panel")
+    parser.add_argument("--baked", action="store_true", help="benchmark baked (history-free) output")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--breakdown", action="store_true", help="print call counts per API method")
+    args = parser.parse_args()
+
+    groups, breakdown = run(parseRange(args.hp), args.preview, abspath(args.hole_map) if args.hole_map else "", args.baked)
+    profile = "preview" if args.preview else "full"
+    if args.hole_map:
+        profile += "Holes"
+    if args.baked:
+        profile += "Baked"
+
+    configs = sum(g["configs"] for g in groups.values())
+    calls = sum(g["calls"] for g in groups.values())
+    solves = sum(g["solves"] for g in groups.values())
+    seconds = sum(g["seconds"] for g in groups.values())
+    print(f"{profile} profile: {configs} configurations, {calls} API calls, {solves} sketch solves, {seconds:.3f}s")
+    print(f"per configuration: {calls / configs:.1f} calls, {solves / configs:.1f} solves, {seconds / configs * 1000:.3f}ms")
+
+    if args.breakdown:
+        for name, count in breakdown.most_common():
+            print(f"  {count / configs:8.1f}  {name}")
+
+    try:
+        with open(BASELINE_FILE) as file:
+            baselines = json.load(file)
+    except FileNotFoundError:
+        baselines = {}
+
+    if args.update_baseline:
+        baselines[profile] = {key: {k: v for k, v in group.items() if k != "seconds"} for key, group in groups.items()}
+        baselines[f"{profile}Seconds"] = round(seconds, 3)
+        with open(BASELINE_FILE, "w") as file:
+            json.dump(baselines, file, indent=1, sort_keys=True)
+        print(f"updated baseline {BASELINE_FILE}")
+        return 0
+
+    if profile not in baselines:
+        print(f"no {profile} baseline to compare against, run with --update-baseline")
+        return 0
+
+    baselineSeconds = baselines.get(f"{profile}Seconds")
+    if baselineSeconds and args.hp == parser.get_default("hp"):
+        print(f"wall time vs baseline: {seconds:.3f}s vs {baselineSeconds:.3f}s ({seconds / baselineSeconds:.2f}x, machine dependent)")
+
+    regressions = compare(groups, baselines[profile])
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        print(f"{len(regressions)} configuration groups make more API calls than the baseline")
+        return 1
+
+    print("no API call regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+# Minimal stand-in for the Fusion adsk package, used to run and benchmark the add-in without Fusion.
+# Only the parts of the API that the add-in uses are implemented, and every call is counted by recorder.
+from . import recorder
+
+
+def doEvents():
+    recorder.record("adsk.doEvents")
+
+
+def terminate():
+    pass
@@ -0,0 +1,273 @@
+import math
+from .recorder import record
+
+
+class Base:
+    @classmethod
+    def cast(cls, obj):
+        return obj
+
+    @property
+    def isValid(self):
+        return True
+
+
+class LogLevels:
+    InfoLogLevel = 0
+    WarningLogLevel = 1
+    ErrorLogLevel = 2
+
+
+class LogTypes:
+    ConsoleLogType = 0
+    FileLogType = 1
+
+
+class DropDownStyles:
+    LabeledIconDropDownStyle = 0
+    CheckBoxDropDownStyle = 1
+    TextListDropDownStyle = 2
+
+
+class Event(Base):
+    def __init__(self):
+        self._handlers = []
+
+    def add(self, handler):
+        record("Event.add")
+        self._handlers.append(handler)
+        return True
+
+    def remove(self, handler):
+        self._handlers.remove(handler)
+        return True
+
+
+class CustomEvent(Event):
+    # add_handler looks up the handler class to subclass from this annotation, like it does for the real API
+    def add(self, handler: "CustomEventHandler"):
+        return super().add(handler)
+
+
+class CustomEventArgs(Base):
+    def __init__(self, additionalInfo: str = ""):
+        self.additionalInfo = additionalInfo
+
+
+class CustomEventHandler(Base):
+    pass
+
+
+class Point3D(Base):
+    def __init__(self, x: float = 0, y: float = 0, z: float = 0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @staticmethod
+    def create(x: float = 0, y: float = 0, z: float = 0):
+        record("Point3D.create")
+        return Point3D(x, y, z)
+
+    def isEqualTo(self, other: "Point3D"):
+        record("Point3D.isEqualTo")
+        return math.isclose(self.x, other.x, abs_tol=1e-9) and math.isclose(self.y, other.y, abs_tol=1e-9) and math.isclose(self.z, other.z, abs_tol=1e-9)
+
+    def distanceTo(self, other: "Point3D"):
+        record("Point3D.distanceTo")
+        return math.dist((self.x, self.y, self.z), (other.x, other.y, other.z))
+
+    def copy(self):
+        return Point3D(self.x, self.y, self.z)
+
+    def __repr__(self):
+        return f"Point3D({self.x}, {self.y}, {self.z})"
+
+
+class BoundingBox3D(Base):
+    def __init__(self, minPoint: Point3D, maxPoint: Point3D):
+        self.minPoint = minPoint
+        self.maxPoint = maxPoint
+
+
+class Vector3D(Base):
+    def __init__(self, x: float = 0, y: float = 0, z: float = 0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @staticmethod
+    def create(x: float = 0, y: float = 0, z: float = 0):
+        record("Vector3D.create")
+        return Vector3D(x, y, z)
+
+
+class Matrix3D(Base):
+    def __init__(self):
+        self.translation = Vector3D()
+
+    @staticmethod
+    def create():
+        record("Matrix3D.create")
+        return Matrix3D()
+
+
+class OrientedBoundingBox3D(Base):
+    @staticmethod
+    def create(centerPoint, lengthDirection, widthDirection, length, width, height):
+        record("OrientedBoundingBox3D.create")
+        box = OrientedBoundingBox3D()
+        box.centerPoint, box.length, box.width, box.height = centerPoint, length, width, height
+        return box
+
+
+class Color(Base):
+    @staticmethod
+    def create(red, green, blue, opacity):
+        record("Color.create")
+        return Color()
+
+
+class ObjectCollection(Base):
+    def __init__(self):
+        self._items = []
+
+    @staticmethod
+    def create():
+        record("ObjectCollection.create")
+        return ObjectCollection()
+
+    def add(self, item):
+        record("ObjectCollection.add")
+        self._items.append(item)
+        return True
+
+    def item(self, index: int):
+        return self._items[index]
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+class ValueInput(Base):
+    def __init__(self, value):
+        self.value = value
+
+    @staticmethod
+    def createByReal(value: float):
+        record("ValueInput.createByReal")
+        return ValueInput(value)
+
+    @staticmethod
+    def createByString(value: str):
+        record("ValueInput.createByString")
+        return ValueInput(value)
+
+
+class UserInterface(Base):
+    def messageBox(self, text, title="", *args):
+        record("UserInterface.messageBox")
+        return 0
+
+
+class Viewport(Base):
+    def refresh(self):
+        record("Viewport.refresh")
+
+
+class Attribute(Base):
+    def __init__(self, parent, groupName: str, name: str, value: str):
+        self.parent = parent
+        self.groupName = groupName
+        self.name = name
+        self.value = value
+
+    def deleteMe(self):
+        self.parent.attributes._items.remove(self)
+        return True
+
+
+class Attributes(Base):
+    def __init__(self, parent):
+        self.parent = parent
+        self._items: list[Attribute] = []
+
+    def add(self, groupName: str, name: str, value: str):
+        record("Attributes.add")
+        existing = self.itemByName(groupName, name)
+        if existing:
+            existing.value = value
+            return existing
+        attribute = Attribute(self.parent, groupName, name, value)
+        self._items.append(attribute)
+        return attribute
+
+    def itemByName(self, groupName: str, name: str):
+        record("Attributes.itemByName")
+        return next((a for a in self._items if a.groupName == groupName and a.name == name), None)
+
+    def itemsByGroup(self, groupName: str):
+        record("Attributes.itemsByGroup")
+        return [a for a in self._items if a.groupName == groupName]
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+class Application(Base):
+    _instance = None
+
+    def __init__(self):
+        self.userInterface = UserInterface()
+        self.activeViewport = Viewport()
+        self._activeProduct = None
+        self._customEvents: dict[str, CustomEvent] = {}
+
+    @staticmethod
+    def get():
+        if not Application._instance:
+            Application._instance = Application()
+        return Application._instance
+
+    @property
+    def activeProduct(self):
+        record("Application.activeProduct")
+        if not self._activeProduct:
+            from .fusion import Design
+
+            self._activeProduct = Design()
+        return self._activeProduct
+
+    @activeProduct.setter
+    def activeProduct(self, product):
+        self._activeProduct = product
+
+    def registerCustomEvent(self, eventId: str):
+        record("Application.registerCustomEvent")
+        self._customEvents[eventId] = CustomEvent()
+        return self._customEvents[eventId]
+
+    def unregisterCustomEvent(self, eventId: str):
+        record("Application.unregisterCustomEvent")
+        return self._customEvents.pop(eventId, None) is not None
+
+    # Handlers run immediately on the calling thread, unlike Fusion which queues them for the main thread
+    def fireCustomEvent(self, eventId: str, additionalInfo: str = ""):
+        record("Application.fireCustomEvent")
+        event = self._customEvents.get(eventId)
+        if not event:
+            return False
+        for handler in list(event._handlers):
+            handler.notify(CustomEventArgs(additionalInfo))
+        return True
+
+    def log(self, message, level=LogLevels.InfoLogLevel, logType=LogTypes.ConsoleLogType):
+        record("Application.log")
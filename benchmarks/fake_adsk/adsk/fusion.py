@@ -0,0 +1,759 @@
+import math
+from .recorder import record
+from .core import Attributes, Base, BoundingBox3D, Point3D
+
+
+class FeatureOperations:
+    JoinFeatureOperation = 0
+    CutFeatureOperation = 1
+    IntersectFeatureOperation = 2
+    NewBodyFeatureOperation = 3
+    NewComponentFeatureOperation = 4
+
+
+class ExtentDirections:
+    PositiveExtentDirection = 0
+    NegativeExtentDirection = 1
+    SymmetricExtentDirection = 2
+
+
+class DimensionOrientations:
+    AlignedDimensionOrientation = 0
+    HorizontalDimensionOrientation = 1
+    VerticalDimensionOrientation = 2
+
+
+class PatternDistanceType:
+    ExtentPatternDistanceType = 0
+    SpacingPatternDistanceType = 1
+
+
+class PatternComputeOptions:
+    OptimizedPatternCompute = 0
+    IdenticalPatternCompute = 1
+    AdjustPatternCompute = 2
+
+
+class BooleanTypes:
+    DifferenceBooleanType = 0
+    IntersectionBooleanType = 1
+    UnionBooleanType = 2
+
+
+class DesignTypes:
+    DirectDesignType = 0
+    ParametricDesignType = 1
+
+
+class _Collection(Base):
+    def __init__(self):
+        self._items = []
+
+    def item(self, index: int):
+        return self._items[index]
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def _add(self, item):
+        self._items.append(item)
+        return item
+
+
+# Sketch entities
+
+
+class SketchEntity(Base):
+    def __init__(self, sketch: "Sketch"):
+        self.parentSketch = sketch
+        self.isConstruction = False
+        self.attributes = Attributes(self)
+
+    @property
+    def entityToken(self):
+        return str(id(self))
+
+
+class SketchPoint(SketchEntity):
+    def __init__(self, sketch: "Sketch", geometry: Point3D):
+        super().__init__(sketch)
+        self.geometry = geometry
+
+
+class SketchLine(SketchEntity):
+    def __init__(self, sketch: "Sketch", start: SketchPoint, end: SketchPoint):
+        super().__init__(sketch)
+        self.startSketchPoint = start
+        self.endSketchPoint = end
+
+    @property
+    def length(self):
+        return self.startSketchPoint.geometry.distanceTo(self.endSketchPoint.geometry)
+
+
+class SketchArc(SketchEntity):
+    def __init__(self, sketch: "Sketch", center: SketchPoint, start: SketchPoint, end: SketchPoint):
+        super().__init__(sketch)
+        self.centerSketchPoint = center
+        self.startSketchPoint = start
+        self.endSketchPoint = end
+
+
+class SketchCircle(SketchEntity):
+    def __init__(self, sketch: "Sketch", center: SketchPoint, radius: float):
+        super().__init__(sketch)
+        self.centerSketchPoint = center
+        self.radius = radius
+
+
+class SketchLineList(_Collection):
+    pass
+
+
+class SketchPoints(_Collection):
+    def __init__(self, sketch: "Sketch"):
+        super().__init__()
+        self.sketch = sketch
+
+    def add(self, point: Point3D):
+        record("SketchPoints.add")
+        return self.sketch._added(self._add(SketchPoint(self.sketch, point)))
+
+
+class SketchLines(_Collection):
+    def __init__(self, sketch: "Sketch"):
+        super().__init__()
+        self.sketch = sketch
+
+    def _point(self, point):
+        return point if isinstance(point, SketchPoint) else SketchPoint(self.sketch, point)
+
+    def addByTwoPoints(self, startPoint, endPoint):
+        record("SketchLines.addByTwoPoints")
+        return self.sketch._added(self._add(SketchLine(self.sketch, self._point(startPoint), self._point(endPoint))))
+
+    def addTwoPointRectangle(self, pointOne: Point3D, pointTwo: Point3D):
+        record("SketchLines.addTwoPointRectangle")
+        x0, y0, x1, y1 = pointOne.x, pointOne.y, pointTwo.x, pointTwo.y
+        corners = [SketchPoint(self.sketch, Point3D(x, y)) for x, y in [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]]
+        rectangle = SketchLineList()
+        for i in range(4):
+            rectangle._add(self._add(SketchLine(self.sketch, corners[i], corners[(i + 1) % 4])))
+        self.sketch._loops.append(list(rectangle))
+        self.sketch._added(rectangle)
+        return rectangle
+
+
+class SketchArcs(_Collection):
+    def __init__(self, sketch: "Sketch"):
+        super().__init__()
+        self.sketch = sketch
+
+    def addByCenterStartSweep(self, centerPoint, startPoint, sweepAngle: float):
+        record("SketchArcs.addByCenterStartSweep")
+        center = centerPoint if isinstance(centerPoint, SketchPoint) else SketchPoint(self.sketch, centerPoint)
+        start = startPoint if isinstance(startPoint, SketchPoint) else SketchPoint(self.sketch, startPoint)
+        c, s = center.geometry, start.geometry
+        angle = math.atan2(s.y - c.y, s.x - c.x) + sweepAngle
+        radius = math.hypot(s.x - c.x, s.y - c.y)
+        end = SketchPoint(self.sketch, Point3D(c.x + radius * math.cos(angle), c.y + radius * math.sin(angle)))
+        return self.sketch._added(self._add(SketchArc(self.sketch, center, start, end)))
+
+
+class SketchCircles(_Collection):
+    def __init__(self, sketch: "Sketch"):
+        super().__init__()
+        self.sketch = sketch
+
+    def addByCenterRadius(self, centerPoint, radius: float):
+        record("SketchCircles.addByCenterRadius")
+        center = centerPoint if isinstance(centerPoint, SketchPoint) else SketchPoint(self.sketch, centerPoint)
+        circle = self.sketch._added(self._add(SketchCircle(self.sketch, center, radius)))
+        self.sketch._loops.append([circle])
+        return circle
+
+
+class SketchCurves(Base):
+    def __init__(self, sketch: "Sketch"):
+        self.sketchLines = SketchLines(sketch)
+        self.sketchArcs = SketchArcs(sketch)
+        self.sketchCircles = SketchCircles(sketch)
+
+    @property
+    def count(self):
+        return self.sketchLines.count + self.sketchArcs.count + self.sketchCircles.count
+
+
+class GeometricConstraints(_Collection):
+    # Every add* method (addHorizontal, addCoincident, addTangent...) creates a generic constraint
+    def __init__(self, sketch: "Sketch"):
+        super().__init__()
+        self.sketch = sketch
+
+    def __getattr__(self, name: str):
+        if not name.startswith("add"):
+            raise AttributeError(name)
+
+        def add(*args):
+            record(f"GeometricConstraints.{name}")
+            return self.sketch._added(self._add(SketchEntity(self.sketch)))
+
+        return add
+
+
+class ModelParameter(Base):
+    def __init__(self, value):
+        self.value = value
+        self.expression = str(value)
+
+
+class SketchDimension(SketchEntity):
+    def __init__(self, sketch: "Sketch", value=0):
+        super().__init__(sketch)
+        self.parameter = ModelParameter(value)
+
+
+class SketchDimensions(_Collection):
+    def __init__(self, sketch: "Sketch"):
+        super().__init__()
+        self.sketch = sketch
+
+    def __getattr__(self, name: str):
+        if not name.startswith("add"):
+            raise AttributeError(name)
+
+        def add(*args):
+            record(f"SketchDimensions.{name}")
+            return self.sketch._added(self._add(SketchDimension(self.sketch)))
+
+        return add
+
+
+class ProfileCurve(Base):
+    def __init__(self, sketchEntity: SketchEntity):
+        self.sketchEntity = sketchEntity
+
+
+class ProfileLoop(Base):
+    def __init__(self, curves: list):
+        self.profileCurves = _Collection()
+        for curve in curves:
+            self.profileCurves._add(ProfileCurve(curve))
+
+
+class Profile(Base):
+    def __init__(self, sketch: "Sketch", bounds: tuple[float, float, float, float], curves: list):
+        self.parentSketch = sketch
+        self._bounds = bounds
+        self._curves = curves
+
+    @property
+    def boundingBox(self):
+        record("Profile.boundingBox")
+        x0, y0, x1, y1 = self._bounds
+        return BoundingBox3D(Point3D(x0, y0, 0), Point3D(x1, y1, 0))
+
+    @property
+    def profileLoops(self):
+        record("Profile.profileLoops")
+        loops = _Collection()
+        loops._add(ProfileLoop(self._curves))
+        return loops
+
+
+class Profiles(_Collection):
+    def __init__(self, sketch: "Sketch"):
+        super().__init__()
+        for bounds, curves in sketch._regions():
+            self._add(Profile(sketch, bounds, curves))
+
+    def item(self, index: int):
+        record("Profiles.item")
+        return self._items[index]
+
+    @property
+    def count(self):
+        record("Profiles.count")
+        return len(self._items)
+
+    def __iter__(self):
+        return (self.item(i) for i in range(len(self._items)))
+
+
+def _lineBounds(lines: list):
+    xs = [point.geometry.x for line in lines for point in (line.startSketchPoint, line.endSketchPoint)]
+    ys = [point.geometry.y for line in lines for point in (line.startSketchPoint, line.endSketchPoint)]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _contains(outer: tuple, inner: tuple):
+    return outer != inner and outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+
+class Sketch(Base):
+    def __init__(self, component: "Component", planarEntity):
+        self.parentComponent = component
+        self.referencePlane = planarEntity
+        self.name = "Sketch"
+        self.areDimensionsShown = True
+        self._isComputeDeferred = False
+        self._loops: list[list[SketchEntity]] = []
+        self.originPoint = SketchPoint(self, Point3D(0, 0, 0))
+        self.sketchPoints = SketchPoints(self)
+        self.sketchCurves = SketchCurves(self)
+        self.geometricConstraints = GeometricConstraints(self)
+        self.sketchDimensions = SketchDimensions(self)
+        self.attributes = Attributes(self)
+
+    # Fusion re-solves a sketch after every change unless compute is deferred, so solves are counted too
+    def _added(self, entity):
+        if not self._isComputeDeferred:
+            record("Sketch.solve")
+        return entity
+
+    @property
+    def isComputeDeferred(self):
+        return self._isComputeDeferred
+
+    @isComputeDeferred.setter
+    def isComputeDeferred(self, value: bool):
+        record("Sketch.isComputeDeferred")
+        if self._isComputeDeferred and not value:
+            record("Sketch.solve")
+        self._isComputeDeferred = value
+
+    @property
+    def profiles(self):
+        record("Sketch.profiles")
+        return Profiles(self)
+
+    # Profiles are only modelled for the kinds of sketches the add-in draws: rectangles, which are split into bands
+    # by horizontal lines spanning them and may contain smaller rectangles, slots (pairs of arcs) and circles. They
+    # are returned in a different order than they were drawn in, since Fusion doesn't guarantee any order either.
+    def _regions(self):
+        regions = []
+        rectangles = [(_lineBounds(loop), loop) for loop in self._loops if len(loop) == 4]
+        for bounds, loop in rectangles:
+            if any(_contains(other, bounds) for other, _ in rectangles):
+                regions.append((bounds, loop))
+                continue
+            x0, y0, x1, y1 = bounds
+            splits = sorted(
+                line.startSketchPoint.geometry.y
+                for line in self.sketchCurves.sketchLines
+                if not line.isConstruction
+                and line.startSketchPoint.geometry.y == line.endSketchPoint.geometry.y
+                and y0 < line.startSketchPoint.geometry.y < y1
+                and _lineBounds([line])[0] <= x0
+                and _lineBounds([line])[2] >= x1
+            )
+            edges = [y0, *splits, y1]
+            regions += [((x0, bottom, x1, top), []) for bottom, top in zip(edges, edges[1:])]
+        arcs = self.sketchCurves.sketchArcs._items
+        for startArc, endArc in zip(arcs[0::2], arcs[1::2]):
+            centers = [arc.centerSketchPoint.geometry for arc in (startArc, endArc)]
+            radius = centers[0].distanceTo(startArc.startSketchPoint.geometry)
+            xs, ys = [center.x for center in centers], [center.y for center in centers]
+            regions.append(((min(xs) - radius, min(ys) - radius, max(xs) + radius, max(ys) + radius), [startArc, endArc]))
+        for circle in self.sketchCurves.sketchCircles:
+            center = circle.centerSketchPoint.geometry
+            regions.append(((center.x - circle.radius, center.y - circle.radius, center.x + circle.radius, center.y + circle.radius), [circle]))
+        return regions[::-1]
+
+    def deleteMe(self):
+        record("Sketch.deleteMe")
+        self.parentComponent.sketches._items.remove(self)
+        return True
+
+
+class Sketches(_Collection):
+    def __init__(self, component: "Component"):
+        super().__init__()
+        self.component = component
+
+    def add(self, planarEntity):
+        record("Sketches.add")
+        return self._add(Sketch(self.component, planarEntity))
+
+
+# Features and bodies
+
+
+class BRepFace(Base):
+    def __init__(self, body: "BRepBody", index: int):
+        self.body = body
+        self.index = index
+
+
+class BRepFaces(Base):
+    def __init__(self, body: "BRepBody"):
+        self.body = body
+
+    def item(self, index: int):
+        record("BRepFaces.item")
+        return BRepFace(self.body, index)
+
+
+class BRepBody(Base):
+    def __init__(self, component: "Component" = None):
+        self.parentComponent = component
+        self.name = "Body"
+        self.faces = BRepFaces(self)
+        self.attributes = Attributes(self)
+
+
+class BRepBodies(_Collection):
+    def add(self, body: BRepBody, *args):
+        record("BRepBodies.add")
+        return self._add(body)
+
+
+class DistanceExtentDefinition(Base):
+    @staticmethod
+    def create(distance):
+        record("DistanceExtentDefinition.create")
+        extent = DistanceExtentDefinition()
+        extent.distance = distance
+        return extent
+
+
+class ThroughAllExtentDefinition(Base):
+    @staticmethod
+    def create():
+        record("ThroughAllExtentDefinition.create")
+        return ThroughAllExtentDefinition()
+
+
+class FromEntityStartDefinition(Base):
+    @staticmethod
+    def create(entity, offset):
+        record("FromEntityStartDefinition.create")
+        return FromEntityStartDefinition()
+
+
+class ExtrudeFeatureInput(Base):
+    def __init__(self, profiles, operation):
+        self.profiles = profiles
+        self.operation = operation
+        self.startExtent = None
+
+    def setOneSideExtent(self, extent, direction, *args):
+        record("ExtrudeFeatureInput.setOneSideExtent")
+        self.extent = extent
+        return True
+
+
+class Feature(Base):
+    pass
+
+
+class ExtrudeFeature(Feature):
+    def __init__(self, component: "Component", extrudeInput: ExtrudeFeatureInput):
+        self.name = "Extrude"
+        self.component = component
+        self.bodies = BRepBodies()
+        extent = getattr(extrudeInput, "extent", None)
+        self.bodies._add(BRepBody(component))
+        self.attributes = Attributes(self)
+        self.extentOne = DistanceExtentDefinition()
+        self.extentOne.distance = ModelParameter(extent.distance.value if isinstance(extent, DistanceExtentDefinition) else 0)
+
+    def deleteMe(self):
+        record("ExtrudeFeature.deleteMe")
+        self.component.features._items.remove(self)
+        self.component.features.extrudeFeatures._items.remove(self)
+        return True
+
+
+class ExtrudeFeatures(_Collection):
+    def __init__(self, component: "Component"):
+        super().__init__()
+        self.component = component
+
+    def createInput(self, profiles, operation):
+        record("ExtrudeFeatures.createInput")
+        return ExtrudeFeatureInput(profiles, operation)
+
+    def add(self, extrudeInput: ExtrudeFeatureInput):
+        record("ExtrudeFeatures.add")
+        self.component.features._add(self._add(ExtrudeFeature(self.component, extrudeInput)))
+        return self._items[-1]
+
+
+class RectangularPatternFeatureInput(Base):
+    def __init__(self, inputEntities, directionOneEntity, quantityOne, distanceOne, patternDistanceType):
+        self.inputEntities = inputEntities
+        self.directionOneEntity = directionOneEntity
+        self.quantityOne = quantityOne
+        self.distanceOne = distanceOne
+        self.patternDistanceType = patternDistanceType
+        self.patternComputeOption = PatternComputeOptions.OptimizedPatternCompute
+
+    def setDirectionTwo(self, directionTwoEntity, quantityTwo, distanceTwo):
+        record("RectangularPatternFeatureInput.setDirectionTwo")
+        self.directionTwoEntity = directionTwoEntity
+        self.quantityTwo = quantityTwo
+        self.distanceTwo = distanceTwo
+        return True
+
+
+class RectangularPatternFeature(Feature):
+    def __init__(self, component: "Component"):
+        self.name = "Rectangular Pattern"
+        self.component = component
+        self.attributes = Attributes(self)
+
+    def deleteMe(self):
+        record("RectangularPatternFeature.deleteMe")
+        self.component.features._items.remove(self)
+        self.component.features.rectangularPatternFeatures._items.remove(self)
+        return True
+
+
+class RectangularPatternFeatures(_Collection):
+    def __init__(self, component: "Component"):
+        super().__init__()
+        self.component = component
+
+    def createInput(self, inputEntities, directionOneEntity, quantityOne, distanceOne, patternDistanceType):
+        record("RectangularPatternFeatures.createInput")
+        return RectangularPatternFeatureInput(inputEntities, directionOneEntity, quantityOne, distanceOne, patternDistanceType)
+
+    def add(self, patternInput: RectangularPatternFeatureInput):
+        record("RectangularPatternFeatures.add")
+        return self.component.features._add(self._add(RectangularPatternFeature(self.component)))
+
+
+class BaseFeatures(_Collection):
+    def __init__(self, component: "Component"):
+        super().__init__()
+        self.component = component
+
+    def add(self):
+        record("BaseFeatures.add")
+        feature = BaseFeature(self.component)
+        self.component.features._add(self._add(feature))
+        return feature
+
+
+class BaseFeature(Feature):
+    def __init__(self, component: "Component"):
+        self.name = "Base Feature"
+        self.component = component
+        self.bodies = BRepBodies()
+
+    def startEdit(self):
+        record("BaseFeature.startEdit")
+        return True
+
+    def finishEdit(self):
+        record("BaseFeature.finishEdit")
+        return True
+
+    def deleteMe(self):
+        record("BaseFeature.deleteMe")
+        self.component.features._items.remove(self)
+        self.component.features.baseFeatures._items.remove(self)
+        return True
+
+
+class Features(_Collection):
+    def __init__(self, component: "Component"):
+        super().__init__()
+        self.extrudeFeatures = ExtrudeFeatures(component)
+        self.baseFeatures = BaseFeatures(component)
+        self.rectangularPatternFeatures = RectangularPatternFeatures(component)
+
+
+class TemporaryBRepManager(Base):
+    _instance = None
+
+    @staticmethod
+    def get():
+        if not TemporaryBRepManager._instance:
+            TemporaryBRepManager._instance = TemporaryBRepManager()
+        return TemporaryBRepManager._instance
+
+    def createBox(self, box):
+        record("TemporaryBRepManager.createBox")
+        return BRepBody()
+
+    def createCylinderOrCone(self, pointOne, pointOneRadius, pointTwo, pointTwoRadius):
+        record("TemporaryBRepManager.createCylinderOrCone")
+        return BRepBody()
+
+    def booleanOperation(self, targetBody, toolBody, booleanType):
+        record("TemporaryBRepManager.booleanOperation")
+        return True
+
+
+# Custom graphics
+
+
+class CustomGraphicsEntity(Base):
+    def __init__(self):
+        self.color = None
+        self.weight = 1
+
+
+class CustomGraphicsCoordinates(Base):
+    @staticmethod
+    def create(coordinates):
+        record("CustomGraphicsCoordinates.create")
+        return CustomGraphicsCoordinates()
+
+
+class CustomGraphicsSolidColorEffect(Base):
+    @staticmethod
+    def create(color):
+        record("CustomGraphicsSolidColorEffect.create")
+        return CustomGraphicsSolidColorEffect()
+
+
+class CustomGraphicsGroup(_Collection):
+    def __init__(self, groups: "CustomGraphicsGroups"):
+        super().__init__()
+        self.groups = groups
+
+    def addLines(self, coordinates, indexList, isLineStrip, lineStripLengths=None):
+        record("CustomGraphicsGroup.addLines")
+        return self._add(CustomGraphicsEntity())
+
+    def addBRepBody(self, body):
+        record("CustomGraphicsGroup.addBRepBody")
+        return self._add(CustomGraphicsEntity())
+
+    def deleteMe(self):
+        record("CustomGraphicsGroup.deleteMe")
+        self.groups._items.remove(self)
+        return True
+
+
+class CustomGraphicsGroups(_Collection):
+    def add(self):
+        record("CustomGraphicsGroups.add")
+        return self._add(CustomGraphicsGroup(self))
+
+
+# Components, occurrences and the design
+
+
+class TimelineObject(Base):
+    def __init__(self, timeline: "Timeline", index: int):
+        self.timeline = timeline
+        self.index = index
+
+
+class TimelineGroup(Base):
+    def __init__(self, startIndex: int, endIndex: int):
+        self.name = "Group"
+        self.startIndex = startIndex
+        self.endIndex = endIndex
+
+
+class TimelineGroups(_Collection):
+    def add(self, startIndex: int, endIndex: int):
+        record("TimelineGroups.add")
+        return self._add(TimelineGroup(startIndex, endIndex))
+
+
+class Timeline(Base):
+    def __init__(self):
+        self.timelineGroups = TimelineGroups()
+        self.count = 0
+
+    def _next(self):
+        self.count += 1
+        return TimelineObject(self, self.count - 1)
+
+
+class Component(Base):
+    def __init__(self, design: "Design"):
+        self.parentDesign = design
+        self.name = "Component"
+        self.xYConstructionPlane = object()
+        self.xConstructionAxis = object()
+        self.yConstructionAxis = object()
+        self.sketches = Sketches(self)
+        self.features = Features(self)
+        self.bRepBodies = BRepBodies()
+        self.occurrences = Occurrences(self)
+        self.constructionAxes = _Collection()
+        self.constructionPlanes = _Collection()
+        self.customGraphicsGroups = CustomGraphicsGroups()
+        self.attributes = Attributes(self)
+
+    def allOccurrencesByComponent(self, component: "Component"):
+        record("Component.allOccurrencesByComponent")
+        occurrences = _Collection()
+        for occurrence in self.occurrences:
+            if occurrence.component is component:
+                occurrences._add(occurrence)
+        return occurrences
+
+
+class Occurrence(Base):
+    def __init__(self, component: Component, transform, timelineObject: TimelineObject):
+        self.component = component
+        self.transform = transform
+        self.timelineObject = timelineObject
+        self.attributes = Attributes(self)
+
+    def activate(self):
+        record("Occurrence.activate")
+        return True
+
+
+class Occurrences(_Collection):
+    def __init__(self, component: Component):
+        super().__init__()
+        self.component = component
+
+    def addNewComponent(self, transform):
+        record("Occurrences.addNewComponent")
+        design = self.component.parentDesign
+        return self._add(Occurrence(Component(design), transform, design.timeline._next()))
+
+    def addExistingComponent(self, component: Component, transform):
+        record("Occurrences.addExistingComponent")
+        return self._add(Occurrence(component, transform, self.component.parentDesign.timeline._next()))
+
+
+class FusionUnitsManager(Base):
+    _factors = {"mm": 10, "cm": 1, "m": 0.01, "in": 1 / 2.54, "ft": 1 / 30.48}
+
+    def __init__(self):
+        self.defaultLengthUnits = "mm"
+
+    def convert(self, valueInInputUnits: float, inputUnits: str, outputUnits: str):
+        record("FusionUnitsManager.convert")
+        return valueInInputUnits / self._factors[inputUnits] * self._factors[outputUnits]
+
+    def formatValue(self, value: float, *args):
+        record("FusionUnitsManager.formatValue")
+        return f"{round(self.convert(value, 'cm', self.defaultLengthUnits), 3)} {self.defaultLengthUnits}"
+
+
+class Design(Base):
+    def __init__(self):
+        self.designType = DesignTypes.ParametricDesignType
+        self.fusionUnitsManager = FusionUnitsManager()
+        self.unitsManager = self.fusionUnitsManager
+        self.timeline = Timeline()
+        self.rootComponent = Component(self)
+        self.attributes = Attributes(self)
+
+    # Only searches the root component's occurrences, which is all the add-in creates
+    def findAttributes(self, groupName: str, attributeName: str):
+        record("Design.findAttributes")
+        components = {id(o.component): o.component for o in self.rootComponent.occurrences}
+        return [
+            attribute
+            for entity in [self, self.rootComponent, *components.values()]
+            for attribute in entity.attributes
+            if attribute.groupName == groupName and attribute.name == attributeName
+        ]
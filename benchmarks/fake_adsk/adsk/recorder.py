@@ -0,0 +1,16 @@
+from collections import Counter
+
+# Every fake adsk API call is counted here, keyed by "Class.method"
+calls: Counter[str] = Counter()
+
+
+def record(name: str):
+    calls[name] += 1
+
+
+def reset():
+    calls.clear()
+
+
+def total():
+    return sum(calls.values())
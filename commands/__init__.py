@@ -4,11 +4,15 @@
 # If you want to add an additional command, duplicate one of the existing directories and import it here.
 # You need to use aliases (import "entry" as "my_module") assuming you have the default module named "entry".
 from .commandDialog import entry as commandDialog
+from .panelEditDialog import entry as panelEditDialog
+from .panelInventoryDialog import entry as panelInventoryDialog
 
 # TODO add your imported modules to this list.
 # Fusion will automatically call the start() and stop() functions.
 commands = [
-    commandDialog
+    commandDialog,
+    panelEditDialog,
+    panelInventoryDialog,
 ]
 
 
@@ -2,7 +2,7 @@ import adsk.core
 import os
 from ...lib import fusionAddInUtils as futil
 from ... import config
-from ...lib.panelUtils.panel_command import command_created, CMD_NAME, CMD_Description
+from ...lib.panelUtils.command_info import PANEL_CMD_NAME as CMD_NAME, PANEL_CMD_DESCRIPTION as CMD_Description
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -32,7 +32,8 @@ def start():
     cmd_def = ui.commandDefinitions.addButtonDefinition(CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER)
 
     # Define an event handler for the command created event. It will be called when the button is clicked.
-    futil.add_handler(cmd_def.commandCreated, command_created)
+    # The command module is only imported then, so it costs nothing at startup.
+    futil.add_handler(cmd_def.commandCreated, futil.lazy_handler("...lib.panelUtils.panel_command", "command_created", __package__))
 
     # ******** Add a button into the UI so the user can run the command. ********
     # Get the target workspace the button will be created in.
@@ -0,0 +1,66 @@
+import adsk.core
+import os
+from ...lib import fusionAddInUtils as futil
+from ... import config
+from ...lib.panelUtils.command_info import EDIT_CMD_NAME as CMD_NAME, EDIT_CMD_DESCRIPTION as CMD_Description
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+
+# TODO *** Specify the command identity information. ***
+CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdEditDialog"
+
+# Specify that the command will be promoted to the panel.
+IS_PROMOTED = False
+
+# TODO *** Define the location where the command button will be created. ***
+# This is done by specifying the workspace, the tab, and the panel, and the
+# command it will be inserted beside. Not providing the command to position it
+# will insert it at the end.
+WORKSPACE_ID = "FusionSolidEnvironment"
+PANEL_ID = "SolidModifyPanel"
+COMMAND_BESIDE_ID = ""
+
+# Resource location for command icons, shared with the generator command.
+ICON_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "commandDialog", "resources", "")
+
+
+# Executed when add-in is run.
+def start():
+    # Create a command Definition.
+    cmd_def = ui.commandDefinitions.addButtonDefinition(CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER)
+
+    # Define an event handler for the command created event. It will be called when the button is clicked.
+    # The command module is only imported then, so it costs nothing at startup.
+    futil.add_handler(cmd_def.commandCreated, futil.lazy_handler("...lib.panelUtils.panel_edit_command", "command_created", __package__))
+
+    # ******** Add a button into the UI so the user can run the command. ********
+    # Get the target workspace the button will be created in.
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+
+    # Get the panel the button will be created in.
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+
+    # Create the button command control in the UI after the specified existing command.
+    control = panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
+
+    # Specify if the command is promoted to the main toolbar.
+    control.isPromoted = IS_PROMOTED
+
+
+# Executed when add-in is stopped.
+def stop():
+    # Get the various UI elements for this command
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+    command_control = panel.controls.itemById(CMD_ID)
+    command_definition = ui.commandDefinitions.itemById(CMD_ID)
+
+    # Delete the button command control
+    if command_control:
+        command_control.deleteMe()
+
+    # Delete the command definition
+    if command_definition:
+        command_definition.deleteMe()
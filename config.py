@@ -4,11 +4,16 @@
 
 import os
 
-# Flag that indicates to run in Debug mode or not. When running in Debug mode
-# more information is written to the Text Command window. Generally, it's useful
-# to set this to True while developing an add-in and set it to False when you
-# are ready to distribute it.
-DEBUG = True
+# Flag that indicates to run in Debug mode or not. Every message is kept in an in-memory log either way (see
+# lib/fusionAddInUtils/log_utils.py), but only warnings and errors are written to the Text Command window unless
+# running in Debug mode. Writing every event to the window is slow under rapid input, so only set this to True
+# while developing the add-in. The log can be dumped with fusionAddInUtils.dump_log(), and errors write the
+# messages that led up to them to the Fusion log file.
+DEBUG = False
+
+# Panel generation always logs a one-line timing summary (at info level, so only shown in Debug mode). When this
+# is True, a per-phase breakdown of where the time went is logged as well.
+TIMING_DETAILS = False
 
 # Gets the name of the add-in from the name of the folder the py file is in.
 # This is used when defining unique internal names for various UI elements 
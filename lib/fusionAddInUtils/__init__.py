@@ -1,2 +1,3 @@
+from .log_utils import *
 from .general_utils import *
 from .event_utils import *
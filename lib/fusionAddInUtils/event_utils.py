@@ -9,11 +9,14 @@
 #  AUTODESK, INC. DOES NOT WARRANT THAT THE OPERATION OF THE PROGRAM WILL BE
 #  UNINTERRUPTED OR ERROR FREE.
 
+import importlib
 import sys
+import time
 from typing import Callable
 
 import adsk.core
 from .general_utils import handle_error
+from .log_utils import info
 
 
 # Global Variable to hold Event Handlers
@@ -53,6 +56,28 @@ def add_handler(
     return handler
 
 
+def lazy_handler(module_name: str, callback_name: str, package: str = None) -> Callable:
+    """Returns an event callback that imports the module defining the actual callback the first time the event
+    fires, eg. so a command's module (and everything it imports) is only loaded when the command is first run.
+
+    Arguments:
+    module_name -- The module to import, relative module names need package.
+    callback_name -- The name of the callback in the module.
+    package -- The package relative module names are resolved against, usually __package__.
+    """
+    callback = None
+
+    def lazy_callback(args):
+        nonlocal callback
+        if callback is None:
+            started = time.perf_counter()
+            callback = getattr(importlib.import_module(module_name, package), callback_name)
+            info('Loaded %s in %.1fms', module_name, (time.perf_counter() - started) * 1000)
+        callback(args)
+
+    return lazy_callback
+
+
 def clear_handlers():
     """Clears the global list of handlers.
     """
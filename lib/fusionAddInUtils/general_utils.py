@@ -12,38 +12,22 @@
 import os
 import traceback
 import adsk.core
+from .log_utils import ERROR, INFO, WARNING, log_message
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
-# Attempt to read DEBUG flag from parent config.
-try:
-    from ... import config
-    DEBUG = config.DEBUG
-except:
-    DEBUG = False
-
 
 def log(message: str, level: adsk.core.LogLevels = adsk.core.LogLevels.InfoLogLevel, force_console: bool = False):
-    """Utility function to easily handle logging in your app.
+    """Utility function to easily handle logging in your app. See log_utils.py for the leveled logging functions.
 
     Arguments:
     message -- The message to log.
     level -- The logging severity level.
     force_console -- Forces the message to be written to the Text Command window. 
     """    
-    # Always print to console, only seen through IDE.
-    print(message)  
-
-    # Log all errors to Fusion log file.
-    if level == adsk.core.LogLevels.ErrorLogLevel:
-        log_type = adsk.core.LogTypes.FileLogType
-        app.log(message, level, log_type)
-
-    # If config.DEBUG is True write all log messages to the console.
-    if DEBUG or force_console:
-        log_type = adsk.core.LogTypes.ConsoleLogType
-        app.log(message, level, log_type)
+    levels = {adsk.core.LogLevels.WarningLogLevel: WARNING, adsk.core.LogLevels.ErrorLogLevel: ERROR}
+    log_message(levels.get(level, INFO), message, force_console=force_console)
 
 
 def handle_error(name: str, show_message_box: bool = False):
@@ -0,0 +1,130 @@
+import time
+from collections import deque
+
+import adsk.core
+
+app = adsk.core.Application.get()
+
+# Log levels, from least to most severe.
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+
+FUSION_LOG_LEVELS = {
+    DEBUG: adsk.core.LogLevels.InfoLogLevel,
+    INFO: adsk.core.LogLevels.InfoLogLevel,
+    WARNING: adsk.core.LogLevels.WarningLogLevel,
+    ERROR: adsk.core.LogLevels.ErrorLogLevel,
+}
+
+# Number of recent messages kept in memory, whatever their level.
+BUFFER_SIZE = 1000
+
+# Attempt to read DEBUG flag from parent config, which makes every message verbose.
+try:
+    from ... import config
+    _verbose = config.DEBUG
+except:
+    _verbose = False
+
+# Every message is recorded in the ring buffer unformatted, as (number, time, level, message, args) tuples.
+# Formatting only happens when a message is written out, which is only warnings and errors unless verbose mode is
+# on, since writing to the Text Command window is slow when events fire many times per second.
+_buffer: deque = deque(maxlen=BUFFER_SIZE)
+_count = 0
+# The number of the last message written to the Fusion log file by a dump.
+_last_dumped = 0
+
+
+def set_verbose(verbose: bool):
+    """Writes every message to the Text Command window, not just warnings and errors."""
+    global _verbose
+    _verbose = verbose
+
+
+def is_verbose():
+    return _verbose
+
+
+def format_message(message, args: tuple):
+    """Formats a message the way the logging module does, with %-style args."""
+    return str(message) % args if args else str(message)
+
+
+def log_message(level: int, message, *args, force_console: bool = False):
+    """Records a message in the ring buffer, and writes it out if its level calls for it.
+
+    Arguments:
+    level -- One of DEBUG, INFO, WARNING or ERROR.
+    message -- The message, or a %-style format string for args. Only formatted when written out.
+    args -- Values for the format string.
+    force_console -- Forces the message to be written to the Text Command window.
+    """
+    global _count
+    _count += 1
+    _buffer.append((_count, time.time(), level, message, args))
+
+    # Errors go to the Fusion log file, along with the messages that led up to them.
+    if level >= ERROR:
+        dump_log(adsk.core.LogTypes.FileLogType)
+
+    if level >= WARNING or _verbose or force_console:
+        text = format_message(message, args)
+        # Seen through the IDE.
+        print(text)
+        app.log(text, FUSION_LOG_LEVELS[level], adsk.core.LogTypes.ConsoleLogType)
+
+
+def debug(message, *args):
+    log_message(DEBUG, message, *args)
+
+
+def info(message, *args):
+    log_message(INFO, message, *args)
+
+
+def warning(message, *args):
+    log_message(WARNING, message, *args)
+
+
+def error(message, *args):
+    log_message(ERROR, message, *args)
+
+
+def get_log_lines(level: int = DEBUG, after: int = 0):
+    """Returns the buffered messages at or above level, oldest first, formatted with their time and level.
+
+    Arguments:
+    level -- The minimum level of the messages to return.
+    after -- Only returns messages logged after the message with this number.
+    """
+    return [
+        f'{time.strftime("%H:%M:%S", time.localtime(created))} {LEVEL_NAMES[message_level]} {format_message(message, args)}'
+        for number, created, message_level, message, args in list(_buffer)
+        if number > after and message_level >= level
+    ]
+
+
+def dump_log(log_type: adsk.core.LogTypes = adsk.core.LogTypes.ConsoleLogType, level: int = DEBUG):
+    """Writes the buffered messages out, eg. to the Text Command window when investigating an issue.
+
+    Arguments:
+    log_type -- Where to write the messages. Dumps to the Fusion log file skip the messages an earlier dump
+                already wrote there.
+    level -- The minimum level of the messages to write.
+    """
+    global _last_dumped
+    after = 0
+    if log_type == adsk.core.LogTypes.FileLogType:
+        after = _last_dumped
+        _last_dumped = _count
+    lines = get_log_lines(level, after)
+    if lines:
+        app.log('\n'.join(lines), adsk.core.LogLevels.InfoLogLevel, log_type)
+
+
+def clear_log():
+    _buffer.clear()
@@ -1,6 +1,6 @@
 import adsk.core
 import adsk.fusion
-from ..fusionAddInUtils import log
+from ..fusionAddInUtils import warning
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -18,4 +18,4 @@ def identifyFaces(body: adsk.fusion.BRepBody):
             sketch = sketches.add(face)
             sketch.name = "Face {}".format(i)
         except Exception as err:
-            log(f"Error occurred, {err}")
+            warning("Error occurred, %s", err)
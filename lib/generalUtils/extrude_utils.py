@@ -1,6 +1,6 @@
 import adsk.core
 import adsk.fusion
-from .value_utils import getNormalizedValueInput
+from .value_utils import Units, getNormalizedValueInput
 from typing import TypedDict, NotRequired, Unpack, cast
 
 # Extrude Feature API Sample
@@ -11,34 +11,48 @@ app = adsk.core.Application.get()
 
 class ExtrudeKwargs(TypedDict):
     operation: NotRequired[adsk.fusion.FeatureOperations]
-    offsetFrom: NotRequired[adsk.core.Base]
+    units: NotRequired[Units]
 
 
 def extrude(
     component: adsk.fusion.Component,
-    sketch: adsk.fusion.Sketch,
-    profileIndices: list[int],
+    profileList: list[adsk.fusion.Profile],
     height: float,
     name: str,
     **kwargs: Unpack[ExtrudeKwargs],
 ):
     operation = kwargs.get("operation", cast(adsk.fusion.FeatureOperations, adsk.fusion.FeatureOperations.NewBodyFeatureOperation))
-    offsetFrom = kwargs.get("offsetFrom")
+    units = kwargs.get("units")
 
     profiles = adsk.core.ObjectCollection.create()
-    for i in profileIndices:
-        profiles.add(sketch.profiles.item(i))
+    for profile in profileList:
+        profiles.add(profile)
 
     features = component.features
     extrudeFeatures = features.extrudeFeatures
 
     extrudeInput = extrudeFeatures.createInput(profiles, operation)
-    extent = adsk.fusion.DistanceExtentDefinition.create(getNormalizedValueInput(height))
+    extent = adsk.fusion.DistanceExtentDefinition.create(getNormalizedValueInput(height, units))
     extrudeInput.setOneSideExtent(extent, cast(adsk.fusion.ExtentDirections, adsk.fusion.ExtentDirections.PositiveExtentDirection))
-    if offsetFrom:
-        extrudeInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(offsetFrom, adsk.core.ValueInput.createByReal(0))
 
     extrude = extrudeFeatures.add(extrudeInput)
     extrude.name = "Extrude {}".format(name)
     body = extrude.bodies.item(0)
     return body
+
+
+# Cuts the profiles through everything below the sketch plane
+def cutThroughAll(component: adsk.fusion.Component, profileList: list[adsk.fusion.Profile], name: str):
+    profiles = adsk.core.ObjectCollection.create()
+    for profile in profileList:
+        profiles.add(profile)
+
+    extrudeFeatures = component.features.extrudeFeatures
+
+    extrudeInput = extrudeFeatures.createInput(profiles, cast(adsk.fusion.FeatureOperations, adsk.fusion.FeatureOperations.CutFeatureOperation))
+    extent = adsk.fusion.ThroughAllExtentDefinition.create()
+    extrudeInput.setOneSideExtent(extent, cast(adsk.fusion.ExtentDirections, adsk.fusion.ExtentDirections.NegativeExtentDirection))
+
+    extrude = extrudeFeatures.add(extrudeInput)
+    extrude.name = "Cut {}".format(name)
+    return extrude
@@ -0,0 +1,54 @@
+import adsk.core
+import threading
+from time import perf_counter
+from typing import Callable
+from ...lib import fusionAddInUtils as futil
+
+app = adsk.core.Application.get()
+
+
+# Collapses bursts of input changes, eg. while a spinner is dragged or held, into a single callback once the
+# input has settled. Each touch() restarts a timer, and when it runs out a Fusion custom event is fired, so the
+# callback runs on the main thread where it can safely use the API (eg. command.doExecutePreview()).
+class InputCoalescer:
+    def __init__(self, eventId: str, settleSeconds: float, onSettled: Callable[[], None]):
+        self.eventId = eventId
+        self.settleSeconds = settleSeconds
+        self.onSettled = onSettled
+        self._lastTouched = 0.0
+        self._timer: threading.Timer | None = None
+        self._handlers = []
+
+    def start(self):
+        # A previous command may not have been cleaned up if it crashed
+        app.unregisterCustomEvent(self.eventId)
+        customEvent = app.registerCustomEvent(self.eventId)
+        futil.add_handler(customEvent, self._onCustomEvent, local_handlers=self._handlers)
+        self._lastTouched = 0.0
+
+    def stop(self):
+        self._cancelTimer()
+        app.unregisterCustomEvent(self.eventId)
+        self._handlers = []
+
+    def touch(self):
+        self._lastTouched = perf_counter()
+        self._cancelTimer()
+        self._timer = threading.Timer(self.settleSeconds, app.fireCustomEvent, [self.eventId])
+        self._timer.daemon = True
+        self._timer.start()
+
+    # True while input is still changing, ie. within settleSeconds of the last touch()
+    @property
+    def isSettling(self):
+        return perf_counter() - self._lastTouched < self.settleSeconds
+
+    def _cancelTimer(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _onCustomEvent(self, args: adsk.core.CustomEventArgs):
+        self._timer = None
+        self._lastTouched = 0.0
+        self.onSettled()
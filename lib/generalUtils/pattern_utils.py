@@ -0,0 +1,43 @@
+import adsk.core
+import adsk.fusion
+from .value_utils import Units
+from typing import cast
+
+app = adsk.core.Application.get()
+
+
+# Repeats a feature along up to two directions, given as (axis, count, spacing) tuples. Directions with a count
+# of 1 are skipped, so a single row or column only needs one.
+def rectangularPattern(
+    component: adsk.fusion.Component,
+    feature: adsk.fusion.Feature,
+    directions: list[tuple[adsk.core.Base, int, float]],
+    name: str,
+    units: Units | None = None,
+):
+    directions = [direction for direction in directions if direction[1] > 1]
+    if not directions:
+        return None
+
+    units = units or Units.fromDesign()
+    entities = adsk.core.ObjectCollection.create()
+    entities.add(feature)
+
+    rectangularPatternFeatures = component.features.rectangularPatternFeatures
+    axisOne, countOne, spacingOne = directions[0]
+    patternInput = rectangularPatternFeatures.createInput(
+        entities,
+        axisOne,
+        adsk.core.ValueInput.createByReal(countOne),
+        units.valueInput(spacingOne),
+        cast(adsk.fusion.PatternDistanceType, adsk.fusion.PatternDistanceType.SpacingPatternDistanceType),
+    )
+    if len(directions) > 1:
+        axisTwo, countTwo, spacingTwo = directions[1]
+        patternInput.setDirectionTwo(axisTwo, adsk.core.ValueInput.createByReal(countTwo), units.valueInput(spacingTwo))
+    # Every instance cuts identical holes through the same body, so Fusion can skip recomputing each one
+    patternInput.patternComputeOption = cast(adsk.fusion.PatternComputeOptions, adsk.fusion.PatternComputeOptions.IdenticalPatternCompute)
+
+    pattern = rectangularPatternFeatures.add(patternInput)
+    pattern.name = "Pattern {}".format(name)
+    return pattern
@@ -1,66 +1,156 @@
 from os.path import normpath, join, dirname, abspath, exists
-from os import mkdir, remove
+from os import mkdir, remove, replace, stat
 import json
+from typing import Callable
 from ...lib import fusionAddInUtils as futil
 
 persistDir = normpath(join(dirname(abspath(__file__)), "../../persist_defaults"))
 
+# Key the schema version is stored under in persisted files, files without it are version 0
+VERSION_KEY = "__version"
 
-class Persistable:
+# Loaded (and migrated) data by file path, with the (mtime, size) it was loaded at. Shared between instances,
+# so files that haven't changed are never re-read, no matter how often they're loaded.
+_loadedFiles: dict[str, tuple[tuple[int, int] | None, dict | None]] = {}
+
+
+def getFileKey(path: str):
+    try:
+        fileStat = stat(path)
+        return (fileStat.st_mtime_ns, fileStat.st_size)
+    except FileNotFoundError:
+        return None
+
+
+def loadJsonFile(path: str, description: str, transform: Callable[[dict], dict]):
+    fileKey = getFileKey(path)
+    cached = _loadedFiles.get(path)
+    if cached and cached[0] == fileKey:
+        return cached[1]
+
+    data = None
+    try:
+        if fileKey:
+            with open(path) as file:
+                data = transform(json.load(file))
+                futil.debug("loaded %s file %s", description, path)
+        else:
+            futil.debug("no %s file to load %s", description, path)
+    except Exception as err:
+        futil.warning(f"error when attempting to load {description} file {path}: {err}")
+    # Failures are cached too, so they aren't retried until the file changes
+    _loadedFiles[path] = (fileKey, data)
+    return data
+
+
+# Written to a temp file that then replaces the file, so a crash mid-write can't truncate it
+def saveJsonFile(path: str, description: str, data: dict):
+    try:
+        if not exists(persistDir):
+            mkdir(persistDir)
+        tempFile = f"{path}.tmp"
+        with open(tempFile, "w") as file:
+            json.dump(data, file, indent=4)
+        replace(tempFile, path)
+        _loadedFiles.pop(path, None)
+        futil.debug("saved %s file %s", description, path)
+        return True
+    except Exception as err:
+        futil.warning(f"error when attempting to save {description} file {path}: {err}")
+        return False
+
+
+def eraseJsonFile(path: str, description: str):
+    try:
+        _loadedFiles.pop(path, None)
+        if exists(path):
+            remove(path)
+            futil.debug("erased %s file %s", description, path)
+        else:
+            futil.debug("no %s file to erase %s", description, path)
+        return True
+    except Exception as err:
+        futil.warning(f"error when attempting to erase {description} file {path}: {err}")
+        return False
+
+
+# Subclasses bump schemaVersion when the persisted keys or values change, and add a migration that upgrades
+# data from the previous version, eg. {0: lambda data: data | {"newKey": data.pop("oldKey")}}
+class Versioned:
+    schemaVersion = 0
+    migrations: dict[int, Callable[[dict], dict]] = {}
+
+    def versioned(self, data: dict):
+        return {VERSION_KEY: self.schemaVersion} | data
+
+    def migrate(self, data: dict):
+        version = data.pop(VERSION_KEY, 0)
+        if version > self.schemaVersion:
+            futil.warning(f"{self.persistFile} is from a newer version ({version}), unknown keys will be ignored")
+        while version < self.schemaVersion:
+            if version in self.migrations:
+                data = self.migrations[version](data)
+            version += 1
+            futil.debug("migrated %s to version %s", self.persistFile, version)
+        return data
+
+
+class Persistable(Versioned):
     def __init__(self, persistFile: str, defaults: dict):
         self.persistFile = join(persistDir, persistFile)
         self._defaults = defaults
         self.restoreDefaults()
 
     def saveDefaults(self):
-        try:
-            if not exists(persistDir):
-                mkdir(persistDir)
-            with open(self.persistFile, "w") as persistFile:
-                data = {}
-                for key in self._defaults.keys():
-                    data[key] = getattr(self, key)
-                json.dump(data, persistFile, indent=4)
-                futil.log(f"saved defaults file {self.persistFile}")
-            return True
-        except Exception as err:
-            futil.log(f"error when attempting to save defaults file {self.persistFile}: {err}")
-            return False
-
-    def __loadDefaults(self):
-        try:
-            data = False
-            if exists(self.persistFile):
-                with open(self.persistFile) as persistFile:
-                    data = json.load(persistFile)
-                    futil.log(f"loaded defaults file {self.persistFile}")
-            else:
-                futil.log(f"no defaults file to load {self.persistFile}")
-            return data
-        except Exception as err:
-            futil.log(f"error when attempting to load defaults file {self.persistFile}: {err}")
-            return False
+        return saveJsonFile(self.persistFile, "defaults", self.versioned(self.toDict()))
 
     def restoreDefaults(self):
-        data = self._defaults | (self.__loadDefaults() or {})
-        for key, value in data.items():
+        for key, value in self._defaults.items():
             setattr(self, key, value)
+        self.updateFromDict(loadJsonFile(self.persistFile, "defaults", self.migrate) or {})
+
+    def toDict(self):
+        return {key: getattr(self, key) for key in self._defaults.keys()}
+
+    # Unknown keys are ignored, missing keys keep their current values
+    def updateFromDict(self, data: dict):
+        for key, value in data.items():
+            if key in self._defaults:
+                setattr(self, key, value)
 
     # Ensure invalid values loaded from persistFile don't break things
     def ensureDefaultKeyIsValid(self, keyName, obj):
         key = getattr(self, keyName)
         if key not in obj:
-            futil.log(f'Warning: {keyName} "{key}" invalid, restoring default value "{self._defaults[keyName]}"')
+            futil.warning(f'{keyName} "{key}" invalid, restoring default value "{self._defaults[keyName]}"')
             setattr(self, keyName, self._defaults[keyName])
 
     def eraseDefaults(self):
-        try:
-            if exists(self.persistFile):
-                remove(self.persistFile)
-                futil.log(f"erased defaults file {self.persistFile}")
-            else:
-                futil.log(f"no defaults file to erase {self.persistFile}")
-            return True
-        except Exception as err:
-            futil.log(f"error when attempting to erase defaults file {self.persistFile}: {err}")
-            return False
+        return eraseJsonFile(self.persistFile, "defaults")
+
+
+# Any number of named sets of values, eg. option presets, stored in one file. The file is only read by load(),
+# which is a no-op when it hasn't changed, after which looking up a preset is a dict lookup.
+class PresetStore(Versioned):
+    def __init__(self, persistFile: str):
+        self.persistFile = join(persistDir, persistFile)
+        self.presets: dict[str, dict] = {}
+
+    def load(self):
+        data = loadJsonFile(self.persistFile, "presets", self.migrate) or {}
+        self.presets = dict(data.get("presets", {}))
+
+    @property
+    def names(self):
+        return list(self.presets.keys())
+
+    def get(self, name: str):
+        return self.presets.get(name)
+
+    def save(self, name: str, values: dict):
+        self.presets[name] = values
+        return saveJsonFile(self.persistFile, "presets", self.versioned({"presets": self.presets}))
+
+    def delete(self, name: str):
+        self.presets.pop(name, None)
+        return saveJsonFile(self.persistFile, "presets", self.versioned({"presets": self.presets}))
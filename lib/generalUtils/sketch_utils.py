@@ -1,6 +1,7 @@
 import adsk.core
 import adsk.fusion
 import math
+from contextlib import contextmanager
 from typing import TypedDict, NotRequired, Unpack, cast
 
 # Sketch Object
@@ -10,6 +11,18 @@ from typing import TypedDict, NotRequired, Unpack, cast
 # https://help.autodesk.com/view/fusion360/ENU/?guid=GUID-da476794-86f9-11e7-937e-6c0b84aa5a3f
 
 
+@contextmanager
+def deferredCompute(sketch: adsk.fusion.Sketch):
+    # Fusion re-solves the sketch after every added entity, constraint and dimension unless compute is
+    # deferred. Nested usage is safe, only the outermost block re-enables compute (and triggers the solve).
+    wasDeferred = sketch.isComputeDeferred
+    sketch.isComputeDeferred = True
+    try:
+        yield sketch
+    finally:
+        sketch.isComputeDeferred = wasDeferred
+
+
 def point(x: float, y: float):
     return adsk.core.Point3D.create(x, y, 0)
 
@@ -52,6 +65,7 @@ def sketchLineMidpoint(sketch: adsk.fusion.Sketch, refLine: adsk.fusion.SketchLi
 
 class SketchRectangleKwargs(TypedDict):
     offset: NotRequired[float]
+    preview: NotRequired[bool]
 
 
 def sketchRectangle(
@@ -65,15 +79,19 @@ def sketchRectangle(
     constraints = sketch.geometricConstraints
 
     offset = kwargs.get("offset", 0)
-    rectangleLines = lines.addTwoPointRectangle(
-        addPoints(startPoint, point(offset, offset)),
-        addPoints(startPoint, point(width - offset, length - offset)),
-    )
+    preview = kwargs.get("preview", False)
+    with deferredCompute(sketch):
+        rectangleLines = lines.addTwoPointRectangle(
+            addPoints(startPoint, point(offset, offset)),
+            addPoints(startPoint, point(width - offset, length - offset)),
+        )
+        if preview:
+            return rectangleLines
 
-    constraints.addHorizontal(rectangleLines.item(0))
-    constraints.addVertical(rectangleLines.item(1))
-    constraints.addHorizontal(rectangleLines.item(2))
-    constraints.addVertical(rectangleLines.item(3))
+        constraints.addHorizontal(rectangleLines.item(0))
+        constraints.addVertical(rectangleLines.item(1))
+        constraints.addHorizontal(rectangleLines.item(2))
+        constraints.addVertical(rectangleLines.item(3))
 
     return rectangleLines
 
@@ -83,7 +101,10 @@ def sketchSlot(
     startPoint: adsk.core.Point3D,
     endPoint: adsk.core.Point3D,
     diameter: float,
+    preview: bool = False,
 ):
+    # When preview is True, only the geometry and coincident constraints needed to close the profile are
+    # created. Parallel and tangent constraints and dimensions are omitted.
     lines = sketch.sketchCurves.sketchLines
     constraints = sketch.geometricConstraints
     dimensions = sketch.sketchDimensions
@@ -91,39 +112,42 @@ def sketchSlot(
     # Sadly, this doesn't seem to return anything of use
     # result = sketch.addCenterToCenterSlot(startPoint, endPoint, adsk.core.ValueInput.createByReal(diameter), True)
 
-    centerLine = lines.addByTwoPoints(startPoint, endPoint)
-    centerLine.isConstruction = True
-    delta = lineOffset(centerLine, diameter / 2)
+    with deferredCompute(sketch):
+        centerLine = lines.addByTwoPoints(startPoint, endPoint)
+        centerLine.isConstruction = True
+        delta = lineOffset(centerLine, diameter / 2)
 
-    line1Delta = multPoints(delta, point(-1, 1))
-    line1Start = addPoints(startPoint, line1Delta)
-    line1End = addPoints(endPoint, line1Delta)
-    line1 = lines.addByTwoPoints(line1Start, line1End)
+        line1Delta = multPoints(delta, point(-1, 1))
+        line1Start = addPoints(startPoint, line1Delta)
+        line1End = addPoints(endPoint, line1Delta)
+        line1 = lines.addByTwoPoints(line1Start, line1End)
 
-    line2Delta = multPoints(delta, point(1, -1))
-    line2Start = addPoints(startPoint, line2Delta)
-    line2End = addPoints(endPoint, line2Delta)
-    line2 = lines.addByTwoPoints(line2Start, line2End)
+        line2Delta = multPoints(delta, point(1, -1))
+        line2Start = addPoints(startPoint, line2Delta)
+        line2End = addPoints(endPoint, line2Delta)
+        line2 = lines.addByTwoPoints(line2Start, line2End)
 
-    arcs = sketch.sketchCurves.sketchArcs
-    arc1 = arcs.addByCenterStartSweep(centerLine.startSketchPoint, line1.startSketchPoint, math.pi)
-    arc2 = arcs.addByCenterStartSweep(centerLine.endSketchPoint, line2.endSketchPoint, math.pi)
+        arcs = sketch.sketchCurves.sketchArcs
+        arc1 = arcs.addByCenterStartSweep(centerLine.startSketchPoint, line1.startSketchPoint, math.pi)
+        arc2 = arcs.addByCenterStartSweep(centerLine.endSketchPoint, line2.endSketchPoint, math.pi)
 
-    constraints.addParallel(line1, line2)
+        constraints.addCoincident(arc1.centerSketchPoint, centerLine.startSketchPoint)
+        constraints.addCoincident(arc2.centerSketchPoint, centerLine.endSketchPoint)
+        constraints.addCoincident(arc1.endSketchPoint, line2.startSketchPoint)
+        constraints.addCoincident(arc2.endSketchPoint, line1.endSketchPoint)
+        if preview:
+            return centerLine, lines, arcs
 
-    constraints.addCoincident(arc1.centerSketchPoint, centerLine.startSketchPoint)
-    constraints.addCoincident(arc2.centerSketchPoint, centerLine.endSketchPoint)
-    constraints.addCoincident(arc1.endSketchPoint, line2.startSketchPoint)
-    constraints.addCoincident(arc2.endSketchPoint, line1.endSketchPoint)
+        constraints.addParallel(line1, line2)
 
-    constraints.addTangent(line1, arc1)
-    constraints.addTangent(line1, arc2)
-    constraints.addTangent(line2, arc1)
-    constraints.addTangent(line2, arc2)
+        constraints.addTangent(line1, arc1)
+        constraints.addTangent(line1, arc2)
+        constraints.addTangent(line2, arc1)
+        constraints.addTangent(line2, arc2)
 
-    dimensions.addDiameterDimension(arc1, midpoint(arc1.endSketchPoint.geometry, centerLine.startSketchPoint.geometry))
+        dimensions.addDiameterDimension(arc1, midpoint(arc1.endSketchPoint.geometry, centerLine.startSketchPoint.geometry))
 
-    constrainPointToPoint(sketch, centerLine.startSketchPoint, centerLine.endSketchPoint)
+        constrainPointToPoint(sketch, centerLine.startSketchPoint, centerLine.endSketchPoint)
 
     return centerLine, lines, arcs
 
@@ -156,18 +180,19 @@ def constrainPointToPoint(
     constraints = sketch.geometricConstraints
     dimensions = sketch.sketchDimensions
 
-    if sketchPoint.geometry.isEqualTo(referencePoint.geometry):
-        constraints.addCoincident(referencePoint, sketchPoint)
-    else:
-        dimensions.addDistanceDimension(
-            referencePoint,
-            sketchPoint,
-            cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation),
-            midpoint(point(referencePoint.geometry.x, sketchPoint.geometry.y), sketchPoint.geometry),
-        )
-        dimensions.addDistanceDimension(
-            referencePoint,
-            sketchPoint,
-            cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.VerticalDimensionOrientation),
-            midpoint(point(sketchPoint.geometry.x, referencePoint.geometry.y), sketchPoint.geometry),
-        )
+    with deferredCompute(sketch):
+        if sketchPoint.geometry.isEqualTo(referencePoint.geometry):
+            constraints.addCoincident(referencePoint, sketchPoint)
+        else:
+            dimensions.addDistanceDimension(
+                referencePoint,
+                sketchPoint,
+                cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation),
+                midpoint(point(referencePoint.geometry.x, sketchPoint.geometry.y), sketchPoint.geometry),
+            )
+            dimensions.addDistanceDimension(
+                referencePoint,
+                sketchPoint,
+                cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.VerticalDimensionOrientation),
+                midpoint(point(sketchPoint.geometry.x, referencePoint.geometry.y), sketchPoint.geometry),
+            )
@@ -0,0 +1,54 @@
+from collections import Counter
+from time import perf_counter
+
+
+# Lightweight named phase timer, cheap enough to leave on all the time. Calling mark() ends the current
+# phase (if any) and starts the next one, so instrumenting a sequence of steps only costs one call each.
+class PhaseTimer:
+    def __init__(self, name: str):
+        self.name = name
+        self.phases: dict[str, float] = {}
+        self.counters: Counter[str] = Counter()
+        self._started = perf_counter()
+        self._phase: str | None = None
+        self._phaseStarted = self._started
+        self._stopped: float | None = None
+
+    def mark(self, phase: str | None):
+        now = perf_counter()
+        if self._phase:
+            self.phases[self._phase] = self.phases.get(self._phase, 0) + now - self._phaseStarted
+        self._phase = phase
+        self._phaseStarted = now
+
+    def stop(self):
+        self.mark(None)
+        self._stopped = perf_counter()
+
+    def count(self, counter: str, amount: int = 1):
+        self.counters[counter] += amount
+
+    @property
+    def total(self):
+        return (self._stopped or perf_counter()) - self._started
+
+    @property
+    def summary(self):
+        summary = f"{self.name} in {self.total * 1000:.1f}ms"
+        if self.phases:
+            summary += " ({})".format(", ".join(f"{phase} {seconds * 1000:.1f}" for phase, seconds in self.phases.items()))
+        if self.counters:
+            summary += ", " + ", ".join(f"{amount} {counter}" for counter, amount in self.counters.items())
+        return summary
+
+    @property
+    def details(self):
+        total = self.total or 1
+        lines = [f"{self.name}: {self.total * 1000:.1f}ms"]
+        for phase, seconds in sorted(self.phases.items(), key=lambda item: -item[1]):
+            lines.append(f"  {phase:<20} {seconds * 1000:9.1f}ms {seconds / total * 100:5.1f}%")
+        untracked = self.total - sum(self.phases.values())
+        lines.append(f"  {'(untracked)':<20} {untracked * 1000:9.1f}ms {untracked / total * 100:5.1f}%")
+        for counter, amount in self.counters.items():
+            lines.append(f"  {counter:<20} {amount:9}")
+        return "\n".join(lines)
@@ -0,0 +1,77 @@
+import adsk.core
+import adsk.fusion
+from dataclasses import dataclass
+
+# Geometric lookups of sketch profiles, so features don't depend on the (undocumented and unstable) order Fusion
+# returns them in. A query reads the bounds of every profile once, when first needed, so create one query per sketch
+# and reuse it.
+# Bounds are (x0, y0, x1, y1) tuples in sketch space, which matches model space for sketches on the XY plane.
+
+# Model units are cm, so this is 0.01mm
+TOLERANCE = 0.001
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileBounds:
+    profile: adsk.fusion.Profile
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+    # The center of a profile's bounds is its centroid for the symmetric profiles used here (rectangles, circles,
+    # slots), without the area properties calculation that an actual centroid needs
+    @property
+    def center(self):
+        return ((self.x0 + self.x1) / 2, (self.y0 + self.y1) / 2)
+
+
+def isClose(a: float, b: float):
+    return abs(a - b) <= TOLERANCE
+
+
+class ProfileQuery:
+    def __init__(self, sketch: adsk.fusion.Sketch):
+        self.sketch = sketch
+        self._entries: list[ProfileBounds] | None = None
+        self._byCenter: dict[tuple[int, int], list[ProfileBounds]] | None = None
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = []
+            for profile in self.sketch.profiles:
+                box = profile.boundingBox
+                self._entries.append(ProfileBounds(profile, box.minPoint.x, box.minPoint.y, box.maxPoint.x, box.maxPoint.y))
+        return self._entries
+
+    # Profiles whose bounds match, eg. a rectangle
+    def withBounds(self, bounds: tuple[float, float, float, float]):
+        return [entry.profile for entry in self.entries if self._matches(entry, bounds)]
+
+    # Profiles whose bounds match none of the bounds, eg. everything but the slots
+    def withoutBounds(self, boundsList: list[tuple[float, float, float, float]]):
+        return [entry.profile for entry in self.entries if not any(self._matches(entry, bounds) for bounds in boundsList)]
+
+    def _matches(self, entry: ProfileBounds, bounds: tuple[float, float, float, float]):
+        return all(map(isClose, (entry.x0, entry.y0, entry.x1, entry.y1), bounds))
+
+    # The profile centered on the point, eg. a circle, or None. Profiles are hashed into a grid of TOLERANCE
+    # sized cells, so each lookup only checks the neighboring cells instead of every profile.
+    def atCenter(self, x: float, y: float):
+        if self._byCenter is None:
+            self._byCenter = {}
+            for entry in self.entries:
+                self._byCenter.setdefault(self._cell(*entry.center), []).append(entry)
+        cellX, cellY = self._cell(x, y)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for entry in self._byCenter.get((cellX + dx, cellY + dy), []):
+                    centerX, centerY = entry.center
+                    if isClose(centerX, x) and isClose(centerY, y):
+                        return entry.profile
+        return None
+
+    def _cell(self, x: float, y: float):
+        return (round(x / TOLERANCE), round(y / TOLERANCE))
+
@@ -7,9 +7,36 @@ import adsk.fusion
 app = adsk.core.Application.get()
 
 
-def getNormalizedValueInput(length: float):
-    design = adsk.fusion.Design.cast(app.activeProduct)
-    unitsMgr = design.fusionUnitsManager
-    defaultLengthUnits = app.activeProduct.unitsManager.defaultLengthUnits
-    converted = round(unitsMgr.convert(length, "cm", defaultLengthUnits), 3)
-    return adsk.core.ValueInput.createByString(f"{converted} {defaultLengthUnits}")
+# Converts and formats lengths in the design's default length units. Looking the units up and converting through
+# the units manager are API round trips, so create one Units per generation (or batch) and convert locally with it.
+# Don't keep one around longer than that, since the user can change the default units at any time.
+class Units:
+    def __init__(self, lengthUnits: str, factor: float):
+        self.lengthUnits = lengthUnits
+        # User length units per cm
+        self.factor = factor
+
+    @classmethod
+    def fromDesign(cls, design: adsk.fusion.Design | None = None):
+        design = design or adsk.fusion.Design.cast(app.activeProduct)
+        unitsMgr = design.fusionUnitsManager
+        lengthUnits = unitsMgr.defaultLengthUnits
+        # Length conversions are linear, so one conversion gives the factor for all of them
+        return cls(lengthUnits, unitsMgr.convert(1, "cm", lengthUnits))
+
+    def convert(self, length: float):
+        return round(length * self.factor, 3)
+
+    def expression(self, length: float):
+        return f"{self.convert(length)} {self.lengthUnits}"
+
+    def valueInput(self, length: float):
+        return adsk.core.ValueInput.createByString(self.expression(length))
+
+
+def getNormalizedExpression(length: float, units: Units | None = None):
+    return (units or Units.fromDesign()).expression(length)
+
+
+def getNormalizedValueInput(length: float, units: Units | None = None):
+    return (units or Units.fromDesign()).valueInput(length)
@@ -0,0 +1,73 @@
+import adsk.core
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+from ...lib import fusionAddInUtils as futil
+
+app = adsk.core.Application.get()
+
+
+# Runs pure-Python jobs (no adsk calls!) on a background thread, and hands each result back to the main thread
+# through a Fusion custom event, where onResult can safely use the API. Only the latest submitted job matters,
+# so submitting a job cancels any queued one, and results of jobs that were superseded while running are dropped.
+class BackgroundWorker:
+    def __init__(self, eventId: str, onResult: Callable[[Any], None]):
+        self.eventId = eventId
+        self.onResult = onResult
+        self._executor: ThreadPoolExecutor | None = None
+        self._future: Future | None = None
+        self._generation = 0
+        self._results: dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self._handlers = []
+
+    def start(self):
+        # A previous command may not have been cleaned up if it crashed
+        app.unregisterCustomEvent(self.eventId)
+        customEvent = app.registerCustomEvent(self.eventId)
+        futil.add_handler(customEvent, self._onCustomEvent, local_handlers=self._handlers)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.eventId)
+
+    def stop(self):
+        self._generation += 1
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        app.unregisterCustomEvent(self.eventId)
+        self._handlers = []
+        with self._lock:
+            self._results.clear()
+
+    # True while the latest submitted job hasn't been handed back yet
+    @property
+    def isBusy(self):
+        return self._future is not None
+
+    def submit(self, job: Callable[..., Any], *args):
+        self._generation += 1
+        if self._future:
+            self._future.cancel()
+        self._future = self._executor.submit(self._run, self._generation, job, *args)
+
+    def _run(self, generation: int, job: Callable[..., Any], *args):
+        if generation != self._generation:
+            return
+        try:
+            result = job(*args)
+        except Exception as err:
+            result = err
+        with self._lock:
+            self._results[generation] = result
+        app.fireCustomEvent(self.eventId, str(generation))
+
+    def _onCustomEvent(self, args: adsk.core.CustomEventArgs):
+        generation = int(args.additionalInfo)
+        with self._lock:
+            result = self._results.pop(generation, None)
+        if generation != self._generation:
+            # Superseded by a newer job while it was running
+            return
+        self._future = None
+        if isinstance(result, Exception):
+            futil.error("Background job failed: %s", result)
+        self.onResult(result)
@@ -0,0 +1,12 @@
+# Command names and descriptions, kept out of the command modules so the add-in can register its buttons at startup
+# without importing them. The command modules, and everything they use, are only imported when a command is first
+# run (see futil.lazy_handler in commands/*/entry.py).
+
+PANEL_CMD_NAME = "Modular Synth Panel Generator"
+PANEL_CMD_DESCRIPTION = "Create a modular synth panel"
+
+EDIT_CMD_NAME = "Edit Modular Synth Panel"
+EDIT_CMD_DESCRIPTION = "Change the options of a generated modular synth panel"
+
+INVENTORY_CMD_NAME = "Modular Synth Panel Inventory"
+INVENTORY_CMD_DESCRIPTION = "List the generated modular synth panels in this design and export them as a CSV bill of materials"
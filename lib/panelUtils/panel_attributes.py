@@ -0,0 +1,48 @@
+import adsk.core
+import adsk.fusion
+import json
+from .panel_options import PanelOptions
+
+# Generated panel components store the options they were generated from, and the sketch dimensions and
+# features that can be edited in place are tagged with a role, so panels can be edited after the fact.
+
+# Fixed, because the add-in folder name (and so config.ADDIN_NAME) changes between releases
+PANEL_ATTRIBUTE_GROUP = "cowboy_ModularSynthPanelGenerator"
+
+
+def savePanelOptions(component: adsk.fusion.Component, opts: PanelOptions):
+    component.attributes.add(PANEL_ATTRIBUTE_GROUP, "options", json.dumps(opts.toDict()))
+
+
+def loadPanelOptions(component: adsk.fusion.Component):
+    attribute = component.attributes.itemByName(PANEL_ATTRIBUTE_GROUP, "options")
+    if not attribute:
+        return None
+    try:
+        return json.loads(attribute.value)
+    except ValueError:
+        return None
+
+
+def setRole(entity, role: str):
+    entity.attributes.add(PANEL_ATTRIBUTE_GROUP, "role", role)
+
+
+def getRole(entity):
+    attribute = entity.attributes.itemByName(PANEL_ATTRIBUTE_GROUP, "role")
+    return attribute.value if attribute else None
+
+
+# All role-tagged sketch dimensions and extrude features in a panel component, by role
+def findRoleEntities(component: adsk.fusion.Component):
+    entities: dict[str, list] = {}
+    for sketch in component.sketches:
+        for dimension in sketch.sketchDimensions:
+            role = getRole(dimension)
+            if role:
+                entities.setdefault(role, []).append(dimension)
+    for feature in component.features.extrudeFeatures:
+        role = getRole(feature)
+        if role:
+            entities.setdefault(role, []).append(feature)
+    return entities
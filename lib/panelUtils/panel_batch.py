@@ -0,0 +1,81 @@
+import copy
+import re
+from .panel_options import PanelOptions
+
+# Batch specs describe one panel per line, as comma and/or space separated fields:
+#
+#   format, width in HP, support type, anchor point
+#
+# Trailing fields may be omitted, in which case the current dialog values are used. A final xN field
+# repeats the panel N times. Blank lines and anything after a # are ignored. For example:
+#
+#   3u_eurorack, 6, shell, top-left
+#   3u_eurorack 2 solid
+#   3u_eurorack, 4, shell x12  # blanks
+#   1u_intellijel, 12  # utility tile
+#
+# A line starting with @ uses a saved preset instead, by name, optionally followed by xN:
+#
+#   @1U tile blank x4
+
+BATCH_SPEC_FIELDS = ["formatId", "widthInHp", "supportType", "anchorPoint"]
+
+
+def parseBatchSpecs(text: str, opts: PanelOptions, presets: dict[str, dict] | None = None):
+    panels: list[PanelOptions] = []
+
+    for lineNumber, line in enumerate(text.splitlines(), 1):
+        line = line.split("#")[0].strip()
+        if line.startswith("@"):
+            presetMatch = re.fullmatch(r"@(.+?)(?:\s+[xX](\d+))?", line)
+            if not presetMatch:
+                raise ValueError(f"Batch line {lineNumber}: expected @preset name")
+            name = presetMatch.group(1).strip()
+            quantity = int(presetMatch.group(2) or 1)
+            if not presets or name not in presets:
+                raise ValueError(f'Batch line {lineNumber}: unknown preset "{name}"')
+            if quantity < 1:
+                raise ValueError(f"Batch line {lineNumber}: quantity must be at least 1")
+            problems = opts.getUnknownIdProblems(presets[name])
+            if problems:
+                raise ValueError(f'Batch line {lineNumber}: preset "{name}" uses {", ".join(problems)}')
+            panelOpts = copy.copy(opts)
+            panelOpts.updateFromDict(presets[name])
+            panels.extend([panelOpts] * quantity)
+            continue
+
+        fields = line.replace(",", " ").split()
+        if not fields:
+            continue
+
+        quantity = 1
+        quantityMatch = re.fullmatch(r"[xX](\d+)", fields[-1])
+        if quantityMatch:
+            quantity = int(quantityMatch.group(1))
+            fields = fields[:-1]
+            if quantity < 1:
+                raise ValueError(f"Batch line {lineNumber}: quantity must be at least 1")
+        if len(fields) > len(BATCH_SPEC_FIELDS):
+            raise ValueError(f"Batch line {lineNumber}: expected at most {len(BATCH_SPEC_FIELDS)} fields, got {len(fields)}")
+
+        panelOpts = copy.copy(opts)
+        for key, value in zip(BATCH_SPEC_FIELDS, fields):
+            match key:
+                case "formatId":
+                    validValues = opts.formatIds
+                case "widthInHp":
+                    if not value.isdigit() or int(value) < 2:
+                        raise ValueError(f'Batch line {lineNumber}: invalid width "{value}", must be a whole number of at least 2 HP')
+                    setattr(panelOpts, key, int(value))
+                    continue
+                case "supportType":
+                    validValues = opts.supportTypeIds
+                case "anchorPoint":
+                    validValues = opts.anchorPointIds
+            if value not in validValues:
+                raise ValueError(f'Batch line {lineNumber}: invalid {key} "{value}", expected one of {", ".join(validValues)}')
+            setattr(panelOpts, key, value)
+
+        panels.extend([panelOpts] * quantity)
+
+    return panels
@@ -0,0 +1,68 @@
+import adsk.core
+import adsk.fusion
+from typing import cast
+from .panel_options import PanelOptions
+from .panel_layout import PanelLayout, Rect
+
+# Builds the panel solid straight from the layout as a temporary BRep body, with no sketch or features. It's drawn as
+# the preview (see panel_preview.py), and inserted as is for baked output (see bakePanelComponent).
+
+
+def buildPanelBody(opts: PanelOptions, layout: PanelLayout):
+    tempBRep = adsk.fusion.TemporaryBRepManager.get()
+    difference = cast(adsk.fusion.BooleanTypes, adsk.fusion.BooleanTypes.DifferenceBooleanType)
+    union = cast(adsk.fusion.BooleanTypes, adsk.fusion.BooleanTypes.UnionBooleanType)
+
+    def box(rect: Rect, az: float, bz: float):
+        center = adsk.core.Point3D.create((rect.x0 + rect.x1) / 2, (rect.y0 + rect.y1) / 2, (az + bz) / 2)
+        boundingBox = adsk.core.OrientedBoundingBox3D.create(
+            center,
+            adsk.core.Vector3D.create(1, 0, 0),
+            adsk.core.Vector3D.create(0, 1, 0),
+            abs(rect.width),
+            abs(rect.length),
+            abs(bz - az),
+        )
+        return tempBRep.createBox(boundingBox)
+
+    panelBottom = -opts.panelHeight
+    body = box(layout.panel, panelBottom, 0)
+
+    # Cut slots all the way through, with a little overshoot to avoid coincident faces
+    overshoot = 0.01
+    for slot in layout.slots:
+        startX, endX, y, radius = slot.minX, slot.maxX, slot.startY, slot.radius
+        tool = box(Rect(startX, y - radius, endX, y + radius), panelBottom - overshoot, overshoot)
+        for x in [startX, endX]:
+            cylinder = tempBRep.createCylinderOrCone(
+                adsk.core.Point3D.create(x, y, panelBottom - overshoot),
+                radius,
+                adsk.core.Point3D.create(x, y, overshoot),
+                radius,
+            )
+            tempBRep.booleanOperation(tool, cylinder, union)
+        tempBRep.booleanOperation(body, tool, difference)
+
+    if opts.supportType == "solid":
+        support = box(layout.supportArea, panelBottom - opts.supportSolidHeight, panelBottom)
+        tempBRep.booleanOperation(body, support, union)
+    elif layout.shellInner:
+        supportBottom = panelBottom - opts.supportShellHeight
+        support = box(layout.supportArea, supportBottom, panelBottom)
+        hollow = box(layout.shellInner, supportBottom - overshoot, panelBottom)
+        tempBRep.booleanOperation(support, hollow, difference)
+        tempBRep.booleanOperation(body, support, union)
+
+    # Holes are cut through the supports too, like the through-all cuts of the generated panel
+    holesBottom = panelBottom - max(opts.supportSolidHeight, opts.supportShellHeight) - overshoot
+    for hole in layout.holes:
+        extentX, extentY = hole.extents
+        for x, y in hole.centers:
+            if hole.isRect:
+                tool = box(Rect(x - extentX, y - extentY, x + extentX, y + extentY), holesBottom, overshoot)
+            else:
+                pointOne = adsk.core.Point3D.create(x, y, holesBottom)
+                tool = tempBRep.createCylinderOrCone(pointOne, extentX, adsk.core.Point3D.create(x, y, overshoot), extentX)
+            tempBRep.booleanOperation(body, tool, difference)
+
+    return body
@@ -3,9 +3,18 @@ import adsk.fusion
 import traceback
 
 from .. import fusionAddInUtils as futil
+from .command_info import PANEL_CMD_DESCRIPTION, PANEL_CMD_NAME
+from ... import config
+from ..generalUtils.input_utils import InputCoalescer
+from ..generalUtils.persist_utils import PresetStore
+from ..generalUtils.timing_utils import PhaseTimer
+from ..generalUtils.value_utils import Units
+from ..generalUtils.worker_utils import BackgroundWorker
 from .panel_inputs import Inputs
 from .panel_options import PanelOptions
 from .panel_generate import generatePanelComponent
+from .panel_plan import PanelPlan, computePanelPlan, getPlanKey, snapshotOptions
+from .panel_preview import drawPanelPreview
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -22,19 +31,57 @@ ui = app.userInterface
 # Command Inputs API Sample
 # https://help.autodesk.com/view/fusion360/ENU/?guid=GUID-e5c4dbe8-ee48-11e4-9823-f8b156d7cd97
 
-CMD_NAME = "Modular Synth Panel Generator"
-CMD_Description = "Create a modular synth panel"
+CMD_NAME = PANEL_CMD_NAME
+CMD_Description = PANEL_CMD_DESCRIPTION
 
 OPTIONS = PanelOptions("modular_synth_panel_generator.json")
+# Named presets, the file is only read again when it has changed
+PRESETS = PresetStore("modular_synth_panel_presets.json")
 INPUTS: Inputs
 
+# Custom graphics drawn for the current preview, and the fingerprint of the options they were drawn from
+PREVIEW_GRAPHICS: adsk.fusion.CustomGraphicsGroup | None = None
+PREVIEW_FINGERPRINT: tuple | None = None
+
+# Spinner and value inputs fire inputChanged, validateInputs and executePreview for every step while they're
+# dragged or held. Previews are only rebuilt once these inputs have settled, in between only cheap feedback like
+# the panel width is updated, so going from 2 to 40 HP rebuilds the preview a handful of times instead of 38.
+COALESCED_INPUT_IDS = {"widthInHp", "panelHeight", "supportSolidHeight", "supportShellHeight", "supportShellWallThickness"}
+PREVIEW_SETTLE_SECONDS = 0.3
+COMMAND: adsk.core.Command | None = None
+COALESCER = InputCoalescer(
+    f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_previewInputSettled",
+    PREVIEW_SETTLE_SECONDS,
+    lambda: COMMAND and COMMAND.doExecutePreview(),
+)
+
+# Layout planning, validation and batch spec parsing (see panel_plan.py) run on a background thread, so only the
+# adsk calls that draw the preview run on the main thread. When inputs change before a plan is ready, it's
+# superseded and dropped. Once the plan for the current inputs is ready, a new preview is requested.
+PLAN: PanelPlan | None = None
+
+
+def onPlanReady(plan: PanelPlan | Exception):
+    global PLAN
+    if isinstance(plan, Exception):
+        # computePanelPlan reports its own errors as problems, so this is a bug, but it must not leave OK enabled
+        plan = PanelPlan(getPlanKey(OPTIONS, INPUTS.batchSpecs.text), snapshotOptions(OPTIONS), problems=[f"Unable to plan panels: {plan!r}"])
+    if isinstance(plan, PanelPlan):
+        PLAN = plan
+        if COMMAND:
+            COMMAND.doExecutePreview()
+
+
+PLANNER = BackgroundWorker(f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_panelPlanReady", onPlanReady)
+
 # Local list of event handlers used to maintain a reference so
 # they are not released and garbage collected.
 LOCAL_HANDLERS = []
 
 
-def log(msg):
-    futil.log(f"[{CMD_NAME}] {str(msg)}")
+# Event messages are debug level, so they only reach the Text Command window in verbose mode
+def log(msg, *args, level: int = futil.DEBUG):
+    futil.log_message(level, f"[{CMD_NAME}] {msg}", *args)
 
 
 def getErrorMessage(text="An unknown error occurred, please validate your inputs and try again"):
@@ -46,8 +93,12 @@ def getErrorMessage(text="An unknown error occurred, please validate your inputs
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     log("Command Created Event")
     OPTIONS.restoreDefaults()
-    global INPUTS
-    INPUTS = Inputs(args.command.commandInputs, OPTIONS)
+    PRESETS.load()
+    global INPUTS, COMMAND
+    INPUTS = Inputs(args.command.commandInputs, OPTIONS, PRESETS)
+    COMMAND = args.command
+    COALESCER.start()
+    PLANNER.start()
 
     args.command.setDialogMinimumSize(400, 450)
     args.command.setDialogSize(400, 450)
@@ -64,32 +115,68 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
 # is immediately called after the created event not command inputs were created for the dialog.
 def onCommandExecute(args: adsk.core.CommandEventArgs):
     log("Command Execute Event")
-    generatePanel(args)
+    clearPreview()
+    # The plan is usually ready from the preview, if not there's nothing to wait for, so compute it right away
+    plan = getCurrentPlan() or computePanelPlan(snapshotOptions(OPTIONS), INPUTS.batchSpecs.text, dict(PRESETS.presets))
+    if not plan.isValid:
+        args.executeFailed = True
+        args.executeFailedMessage = "<br>".join(plan.problems)
+    elif plan.batchPanels:
+        generatePanels(args, plan.batchPanels)
+    else:
+        generatePanel(args)
 
 
 # This event handler is called when the command needs to compute a new preview in the graphics window.
 def onCommandPreview(args: adsk.core.CommandEventArgs):
-    log("Command Preview Event")
-    if INPUTS.isValid:
-        generatePanel(args)
-    else:
+    if COALESCER.isSettling:
+        # The existing preview is kept until the input settles and a new preview is requested
+        return
+    if not INPUTS.isValid:
+        clearPreview()
         args.executeFailed = True
         args.executeFailedMessage = "Some inputs are invalid, unable to generate preview"
+        return
+    plan = getCurrentPlan()
+    if not plan:
+        # The existing preview is kept until the plan is ready and a new preview is requested
+        requestPlan()
+        return
+    log("Command Preview Event")
+    if not plan.isValid:
+        clearPreview()
+        args.executeFailed = True
+        args.executeFailedMessage = "<br>".join(plan.problems)
+    elif plan.batchPanels:
+        # Batches are only generated on execute, previewing dozens of panels per input change is too slow
+        log("Batch mode, skipping preview")
+        clearPreview()
+    elif OPTIONS.parametricPreview:
+        clearPreview()
+        generatePanel(args, preview=True)
+    else:
+        previewPanel(args, plan)
 
 
 # This event handler is called when the user changes anything in the command dialog
 # allowing you to modify values of other inputs based on that change.
 def onCommandInputChanged(args: adsk.core.InputChangedEventArgs):
     changedInputId = args.input.id
-    log(f"Command Input Changed: {changedInputId}")
+    if changedInputId in COALESCED_INPUT_IDS:
+        COALESCER.touch()
+    else:
+        log("Command Input Changed: %s", changedInputId)
     INPUTS.handleAction(changedInputId)
 
 
 # This event handler is called when the user interacts with any of the inputs in the dialog
 # which allows you to verify that all of the inputs are valid and enables the OK button.
 def onCommandValidateInput(args: adsk.core.ValidateInputsEventArgs):
-    log("Validate Input Event")
-    args.areInputsValid = INPUTS.isValid
+    if not COALESCER.isSettling:
+        log("Validate Input Event")
+    # Batch specs are validated with the plan, in the background
+    plan = getCurrentPlan()
+    args.areInputsValid = INPUTS.isValid and (not plan or plan.isValid)
 
     if INPUTS.isValid:
         INPUTS.updateOptionsFromInputs()
@@ -98,37 +185,171 @@ def onCommandValidateInput(args: adsk.core.ValidateInputsEventArgs):
 # This event handler is called when the command terminates.
 def onCommandDestroy(args: adsk.core.CommandEventArgs):
     log("Command Destroy Event")
-    global LOCAL_HANDLERS
+    global LOCAL_HANDLERS, COMMAND, PLAN
     LOCAL_HANDLERS = []
+    COMMAND = None
+    PLAN = None
+    COALESCER.stop()
+    PLANNER.stop()
+    clearPreview()
+
 
+def requestPlan():
+    PLANNER.submit(computePanelPlan, snapshotOptions(OPTIONS), INPUTS.batchSpecs.text, dict(PRESETS.presets))
 
-def generatePanel(args: adsk.core.CommandEventArgs):
+
+# The plan for the current inputs, if it's ready
+def getCurrentPlan():
+    if PLAN and PLAN.key == getPlanKey(OPTIONS, INPUTS.batchSpecs.text):
+        return PLAN
+    return None
+
+
+def clearPreview():
+    global PREVIEW_GRAPHICS, PREVIEW_FINGERPRINT
+    if PREVIEW_GRAPHICS and PREVIEW_GRAPHICS.isValid:
+        PREVIEW_GRAPHICS.deleteMe()
+    PREVIEW_GRAPHICS = None
+    PREVIEW_FINGERPRINT = None
+
+
+# The preview is drawn with custom graphics instead of generating the parametric panel (see panel_preview.py).
+# Custom graphics aren't rolled back between executePreview events, so when the options haven't changed, eg.
+# after clicking the Reset/Update defaults/Factory reset buttons, the existing preview is simply kept.
+def previewPanel(args: adsk.core.CommandEventArgs, plan: PanelPlan):
+    global PREVIEW_GRAPHICS, PREVIEW_FINGERPRINT
+    fingerprint = plan.opts.fingerprint
+
+    if PREVIEW_GRAPHICS and PREVIEW_GRAPHICS.isValid and PREVIEW_FINGERPRINT == fingerprint:
+        log("Options unchanged, keeping existing preview")
+        return True
+
+    clearPreview()
     try:
-        des = adsk.fusion.Design.cast(app.activeProduct)
-        if des.designType == 0:
-            args.executeFailed = True
-            args.executeFailedMessage = "Projects with direct modeling are not supported, please enable parametric modeling (timeline) to proceed."
+        des = getDesign(args)
+        if not des:
             return False
 
-        root = adsk.fusion.Component.cast(des.rootComponent)
-        componentName = "{} {} HP Panel".format(OPTIONS.formatName, OPTIONS.widthInHp)
+        PREVIEW_GRAPHICS = des.rootComponent.customGraphicsGroups.add()
+        drawPanelPreview(PREVIEW_GRAPHICS, plan.opts, plan.layout)
+        PREVIEW_FINGERPRINT = fingerprint
+        app.activeViewport.refresh()
+        return True
+    except Exception as err:
+        clearPreview()
+        args.executeFailed = True
+        args.executeFailedMessage = getErrorMessage()
+        log("Error occurred, %s, %s", err, getErrorMessage(), level=futil.ERROR)
+        return False
 
-        # create new component
-        newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(adsk.core.Matrix3D.create())
-        newCmpOcc.component.name = componentName
-        newCmpOcc.activate()
 
-        panelComponent: adsk.fusion.Component = newCmpOcc.component
+def getDesign(args: adsk.core.CommandEventArgs):
+    des = adsk.fusion.Design.cast(app.activeProduct)
+    if des.designType == 0:
+        args.executeFailed = True
+        args.executeFailedMessage = "Projects with direct modeling are not supported, please enable parametric modeling (timeline) to proceed."
+        return None
+    return des
 
-        generatePanelComponent(panelComponent, OPTIONS)
 
+def getOffsetTransform(offsetX: float):
+    transform = adsk.core.Matrix3D.create()
+    transform.translation = adsk.core.Vector3D.create(offsetX, 0, 0)
+    return transform
+
+
+# Place another occurrence of an already generated panel component, which costs no sketch, feature or recompute work
+def placePanelOccurrence(des: adsk.fusion.Design, component: adsk.fusion.Component, offsetX: float = 0):
+    root = adsk.fusion.Component.cast(des.rootComponent)
+    return adsk.fusion.Occurrences.cast(root.occurrences).addExistingComponent(component, getOffsetTransform(offsetX))
+
+
+def generatePanelOccurrence(des: adsk.fusion.Design, opts: PanelOptions, offsetX: float = 0, preview: bool = False, units: Units | None = None):
+    root = adsk.fusion.Component.cast(des.rootComponent)
+    componentName = opts.panelName
+    timer = PhaseTimer(f"Generated {componentName}{' preview' if preview else ''}")
+
+    # create new component
+    timer.mark("component")
+    newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(getOffsetTransform(offsetX))
+    newCmpOcc.component.name = componentName
+    newCmpOcc.activate()
+
+    panelComponent: adsk.fusion.Component = newCmpOcc.component
+
+    generatePanelComponent(panelComponent, opts, preview, timer, units)
+
+    # Preview results are rolled back, so don't bother grouping them
+    if not preview:
         # group features in timeline
+        timer.mark("timeline")
         count = panelComponent.sketches.count + panelComponent.features.count + panelComponent.constructionAxes.count + panelComponent.constructionPlanes.count
         if count > 1:
             panelGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + count)
             panelGroup.name = componentName
+
+    timer.stop()
+    log(timer.summary, level=futil.INFO)
+    if config.TIMING_DETAILS:
+        log(timer.details, level=futil.INFO)
+
+    return newCmpOcc
+
+
+def generatePanel(args: adsk.core.CommandEventArgs, preview: bool = False):
+    try:
+        des = getDesign(args)
+        if not des:
+            return False
+
+        generatePanelOccurrence(des, OPTIONS, preview=preview)
+        return True
+    except Exception as err:
+        args.executeFailed = True
+        args.executeFailedMessage = getErrorMessage()
+        log("Error occurred, %s, %s", err, getErrorMessage(), level=futil.ERROR)
+        return False
+
+
+# Generate every batch panel in a single execute, laid out side by side along the X axis. Each unique panel
+# gets its own component and timeline group, and its sketch is solved once (see deferredCompute). When
+# instanceIdenticalPanels is set, panels with identical options are placed as additional occurrences of the
+# first one's component, so recompute time and file size scale with the number of unique panels.
+def generatePanels(args: adsk.core.CommandEventArgs, panels: list[PanelOptions]):
+    progressDialog = ui.createProgressDialog()
+    try:
+        des = getDesign(args)
+        if not des:
+            return False
+
+        progressDialog.isCancelButtonShown = True
+        progressDialog.show(CMD_NAME, "Generating panel %v of %m", 0, len(panels), 1)
+
+        timer = PhaseTimer(f"Generated batch of {len(panels)} panels")
+        # The design's units can't change during the batch, so they're only looked up once
+        units = Units.fromDesign(des)
+        components: dict[tuple, adsk.fusion.Component] = {}
+        offsetX = 0
+        for i, opts in enumerate(panels):
+            if progressDialog.wasCancelled:
+                log("Batch cancelled after %d of %d panels", i, len(panels), level=futil.INFO)
+                break
+            progressDialog.progressValue = i
+            fingerprint = opts.fingerprint
+            if opts.instanceIdenticalPanels and fingerprint in components:
+                placePanelOccurrence(des, components[fingerprint], offsetX)
+            else:
+                components[fingerprint] = generatePanelOccurrence(des, opts, offsetX, units=units).component
+            offsetX += opts.width
+            # Let the progress dialog repaint and register cancel clicks
+            adsk.doEvents()
+        timer.stop()
+        timer.count("unique components", len(components))
+        log(timer.summary, level=futil.INFO)
     except Exception as err:
         args.executeFailed = True
         args.executeFailedMessage = getErrorMessage()
-        log(f"Error occurred, {err}, {getErrorMessage()}")
+        log("Error occurred, %s, %s", err, getErrorMessage(), level=futil.ERROR)
         return False
+    finally:
+        progressDialog.hide()
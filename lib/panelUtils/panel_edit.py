@@ -0,0 +1,119 @@
+import adsk.core
+import adsk.fusion
+import copy
+from ..generalUtils.timing_utils import PhaseTimer
+from ..generalUtils.value_utils import Units
+from .panel_attributes import findRoleEntities, loadPanelOptions, savePanelOptions
+from .panel_generate import generatePanelComponent, getSupportDepth
+from .panel_layout import getPanelLayout
+from .panel_options import PanelOptions
+
+# Editing a generated panel in place only changes the values of existing sketch dimensions and extrude
+# extents, which is far cheaper than regenerating it. Changes that alter the sketch or feature topology
+# fall back to rebuilding the component contents, keeping the component (and its occurrences) intact.
+
+TOPOLOGY_KEYS = ["formatId", "anchorPoint", "supportType", "sketchOnly", "bakedOutput", "holeMapFile"]
+
+
+def getStoredPanelOptions(component: adsk.fusion.Component, opts: PanelOptions):
+    data = loadPanelOptions(component)
+    if data is None:
+        return None
+    storedOpts = copy.copy(opts)
+    storedOpts.updateFromDict(data)
+    return storedOpts
+
+
+def getChangedKeys(oldOpts: PanelOptions, opts: PanelOptions):
+    return [key for key, value in opts.toDict().items() if getattr(oldOpts, key) != value]
+
+
+def needsRebuild(oldOpts: PanelOptions, opts: PanelOptions):
+    if any(getattr(oldOpts, key) != getattr(opts, key) for key in TOPOLOGY_KEYS):
+        return True
+    oldLayout, layout = getPanelLayout(oldOpts), getPanelLayout(opts)
+    # Narrow panels only have mounting slots on one side. Holes aren't dimensioned, so they can't follow a change,
+    # eg. the holes of a KiCad board, which is centered on the support area, when the width changes.
+    return len(oldLayout.slots) != len(layout.slots) or oldLayout.holes != layout.holes
+
+
+# Returns False if the panel couldn't be updated in place and needs to be rebuilt
+def updatePanelComponent(component: adsk.fusion.Component, opts: PanelOptions, units: Units):
+    oldOpts = getStoredPanelOptions(component, opts)
+    # Baked panels have no dimensions or extrudes to update, so they're baked again
+    if not oldOpts or needsRebuild(oldOpts, opts) or opts.isBaked:
+        return False
+
+    changedKeys = getChangedKeys(oldOpts, opts)
+    entities = findRoleEntities(component)
+
+    def setExpressions(role: str, expression: str, count: int = 1):
+        if len(entities.get(role, [])) != count:
+            return False
+        for entity in entities[role]:
+            if isinstance(entity, adsk.fusion.ExtrudeFeature):
+                extent = adsk.fusion.DistanceExtentDefinition.cast(entity.extentOne)
+                extent.distance.expression = expression
+            else:
+                entity.parameter.expression = expression
+        return True
+
+    # The support extrude includes the panel thickness, so it changes with the panel height too
+    def setSupportDepth():
+        if opts.supportType == "none" or "supportDepth" in updated:
+            return True
+        updated.add("supportDepth")
+        return setExpressions("supportExtrude", units.expression(-getSupportDepth(opts)))
+
+    updated: set[str] = set()
+    updates = {
+        "widthInHp": lambda: setExpressions("width", opts.getWidthExpression(units)),
+        "panelHeight": lambda: opts.sketchOnly or (setExpressions("panelExtrude", units.expression(-opts.panelHeight)) and setSupportDepth()),
+        "supportSolidHeight": lambda: opts.supportType != "solid" or setSupportDepth(),
+        "supportShellHeight": lambda: opts.supportType != "shell" or setSupportDepth(),
+        "supportShellWallThickness": lambda: opts.supportType != "shell" or setExpressions("shellWall", units.expression(opts.supportShellWallThickness), 4),
+    }
+
+    for key in changedKeys:
+        update = updates.get(key)
+        # A missing role entity means the panel was modified by hand (or predates roles), so rebuild it
+        if update and not update():
+            return False
+
+    savePanelOptions(component, opts)
+    return True
+
+
+def clearPanelComponent(component: adsk.fusion.Component):
+    for feature in reversed(list(component.features)):
+        feature.deleteMe()
+    for sketch in reversed(list(component.sketches)):
+        sketch.deleteMe()
+
+
+def rebuildPanelComponent(des: adsk.fusion.Design, component: adsk.fusion.Component, opts: PanelOptions, timer: PhaseTimer, units: Units):
+    timer.mark("clear")
+    clearPanelComponent(component)
+
+    generatePanelComponent(component, opts, timer=timer, units=units)
+
+    # The regenerated features are at the end of the timeline, group them like a newly generated panel
+    timer.mark("timeline")
+    count = component.sketches.count + component.features.count
+    if count > 1:
+        panelGroup = des.timeline.timelineGroups.add(des.timeline.count - count, des.timeline.count - 1)
+        panelGroup.name = opts.panelName
+
+
+def editPanelComponent(des: adsk.fusion.Design, component: adsk.fusion.Component, opts: PanelOptions):
+    timer = PhaseTimer(f"Edited {opts.panelName}")
+    timer.mark("update")
+    units = Units.fromDesign(des)
+    if updatePanelComponent(component, opts, units):
+        timer.count("in place")
+    else:
+        rebuildPanelComponent(des, component, opts, timer, units)
+        timer.count("rebuilt")
+    component.name = opts.panelName
+    timer.stop()
+    return timer
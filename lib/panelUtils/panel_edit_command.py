@@ -0,0 +1,172 @@
+import adsk.core
+import adsk.fusion
+import traceback
+
+from .. import fusionAddInUtils as futil
+from .command_info import EDIT_CMD_DESCRIPTION, EDIT_CMD_NAME
+from ... import config
+from ..generalUtils.persist_utils import PresetStore
+from .panel_attributes import loadPanelOptions
+from .panel_edit import editPanelComponent
+from .panel_inputs import Inputs
+from .panel_options import PanelOptions
+from .panel_plan import computePanelPlan, snapshotOptions
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+CMD_NAME = EDIT_CMD_NAME
+CMD_Description = EDIT_CMD_DESCRIPTION
+
+# Shares its defaults and presets files with the generator command
+OPTIONS = PanelOptions("modular_synth_panel_generator.json")
+PRESETS = PresetStore("modular_synth_panel_presets.json")
+INPUTS: Inputs
+
+# Local list of event handlers used to maintain a reference so
+# they are not released and garbage collected.
+LOCAL_HANDLERS = []
+
+
+# Event messages are debug level, so they only reach the Text Command window in verbose mode
+def log(msg, *args, level: int = futil.DEBUG):
+    futil.log_message(level, f"[{CMD_NAME}] {msg}", *args)
+
+
+def getErrorMessage(text="An unknown error occurred, please validate your inputs and try again"):
+    stackTrace = traceback.format_exc()
+    return f"{text}:<br>{stackTrace}"
+
+
+# Named for easy importing into panelEditDialog/entry.py
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    log("Command Created Event")
+    OPTIONS.restoreDefaults()
+    PRESETS.load()
+    global INPUTS
+    INPUTS = Inputs(args.command.commandInputs, OPTIONS, PRESETS, editMode=True)
+
+    # Edit the selected panel, if one was selected before running the command
+    panelSelection = getPanelSelectionInput()
+    for i in range(ui.activeSelections.count):
+        occurrence = adsk.fusion.Occurrence.cast(ui.activeSelections.item(i).entity)
+        if occurrence and loadPanelOptions(occurrence.component) is not None:
+            panelSelection.addSelection(occurrence)
+            loadSelectedPanelOptions()
+            break
+
+    args.command.setDialogMinimumSize(400, 450)
+    args.command.setDialogSize(400, 450)
+
+    # Register event handlers
+    futil.add_handler(args.command.execute, onCommandExecute, local_handlers=LOCAL_HANDLERS)
+    futil.add_handler(args.command.executePreview, onCommandPreview, local_handlers=LOCAL_HANDLERS)
+    futil.add_handler(args.command.inputChanged, onCommandInputChanged, local_handlers=LOCAL_HANDLERS)
+    futil.add_handler(args.command.validateInputs, onCommandValidateInput, local_handlers=LOCAL_HANDLERS)
+    futil.add_handler(args.command.destroy, onCommandDestroy, local_handlers=LOCAL_HANDLERS)
+
+
+# This event handler is called when the user clicks the OK button in the command dialog.
+def onCommandExecute(args: adsk.core.CommandEventArgs):
+    log("Command Execute Event")
+    editPanel(args)
+
+
+# Editing in place is cheap, so the preview is the actual edit. When it succeeds, Fusion keeps the preview
+# result instead of rolling it back and running execute, so the edit is only ever done once.
+def onCommandPreview(args: adsk.core.CommandEventArgs):
+    log("Command Preview Event")
+    if isValid():
+        args.isValidResult = editPanel(args)
+    else:
+        args.executeFailed = True
+        args.executeFailedMessage = "Some inputs are invalid, unable to generate preview"
+
+
+# This event handler is called when the user changes anything in the command dialog
+# allowing you to modify values of other inputs based on that change.
+def onCommandInputChanged(args: adsk.core.InputChangedEventArgs):
+    changedInputId = args.input.id
+    log("Command Input Changed: %s", changedInputId)
+    if changedInputId == "panelSelection":
+        loadSelectedPanelOptions()
+    else:
+        INPUTS.handleAction(changedInputId)
+
+
+# This event handler is called when the user interacts with any of the inputs in the dialog
+# which allows you to verify that all of the inputs are valid and enables the OK button.
+def onCommandValidateInput(args: adsk.core.ValidateInputsEventArgs):
+    log("Validate Input Event")
+    args.areInputsValid = isValid()
+
+    if args.areInputsValid:
+        INPUTS.updateOptionsFromInputs()
+
+
+# This event handler is called when the command terminates.
+def onCommandDestroy(args: adsk.core.CommandEventArgs):
+    log("Command Destroy Event")
+    global LOCAL_HANDLERS
+    LOCAL_HANDLERS = []
+
+
+def getPanelSelectionInput():
+    return adsk.core.SelectionCommandInput.cast(INPUTS.inputs.itemById("panelSelection"))
+
+
+def getSelectedPanelComponent():
+    panelSelection = getPanelSelectionInput()
+    if panelSelection.selectionCount != 1:
+        return None
+    occurrence = adsk.fusion.Occurrence.cast(panelSelection.selection(0).entity)
+    if not occurrence or loadPanelOptions(occurrence.component) is None:
+        return None
+    return occurrence.component
+
+
+def loadSelectedPanelOptions():
+    component = getSelectedPanelComponent()
+    if not component:
+        return
+    panelOptions = loadPanelOptions(component)
+    problems = OPTIONS.getUnknownIdProblems(panelOptions)
+    if problems:
+        getPanelSelectionInput().clearSelection()
+        ui.messageBox(f"{component.name} can't be edited, it uses {', '.join(problems)}.", "Warning")
+        return
+    OPTIONS.updateFromDict(panelOptions)
+    INPUTS.updateInputsFromOptions()
+    INPUTS.updateUiState()
+
+
+def isValid():
+    return INPUTS.isValid and getSelectedPanelComponent() is not None
+
+
+def editPanel(args: adsk.core.CommandEventArgs):
+    try:
+        des = adsk.fusion.Design.cast(app.activeProduct)
+        component = getSelectedPanelComponent()
+        if not component:
+            args.executeFailed = True
+            args.executeFailedMessage = "Select a panel created by the Modular Synth Panel Generator"
+            return False
+
+        # The same checks as the generator's, there are no batch specs when editing
+        plan = computePanelPlan(snapshotOptions(OPTIONS), "", {})
+        if not plan.isValid:
+            args.executeFailed = True
+            args.executeFailedMessage = "<br>".join(plan.problems)
+            return False
+
+        timer = editPanelComponent(des, component, OPTIONS)
+        log(timer.summary, level=futil.INFO)
+        if config.TIMING_DETAILS:
+            log(timer.details, level=futil.INFO)
+        return True
+    except Exception as err:
+        args.executeFailed = True
+        args.executeFailedMessage = getErrorMessage()
+        log("Error occurred, %s, %s", err, getErrorMessage(), level=futil.ERROR)
+        return False
@@ -0,0 +1,137 @@
+import json
+import os
+from dataclasses import dataclass, fields
+from os.path import abspath, dirname, join
+from .. import fusionAddInUtils as futil
+
+# Panel formats are loaded from the JSON files in the formats directory, one format per file, with the file name
+# (minus .json) as the format id. Values are in cm, any value not specified falls back to FORMAT_DEFAULTS. eg.
+#
+#   {"name": "3U Eurorack", "order": 0, "panelLength": 12.85, "maxPcbLength": 11.0}
+#
+# The directory is scanned lazily, each file is parsed and validated once and cached by its mtime and size, and
+# the formats are resolved into immutable records. Adding a format only requires adding a file.
+
+FORMATS_DIR = join(dirname(abspath(__file__)), "formats")
+
+FORMAT_DEFAULTS = {
+    "order": 1000,
+    "hpWidth": 0.508,
+    "slotDiameter": 0.35,
+    "slotLength": 0.14,
+    "slotOffsetY": 0.3,
+    "slotOffsetX": 0.6,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PanelFormat:
+    id: str
+    name: str
+    order: int
+    hpWidth: float
+    panelLength: float
+    maxPcbLength: float
+    slotDiameter: float
+    slotLength: float
+    slotOffsetY: float
+    slotOffsetX: float
+
+
+@dataclass(frozen=True, slots=True)
+class FormatRegistry:
+    # Format id -> format, in dropdown order
+    formats: dict[str, PanelFormat]
+    # Reverse name -> id index for the Fusion UI dropdown
+    idsByName: dict[str, str]
+
+
+FORMAT_KEYS = [f.name for f in fields(PanelFormat) if f.name != "id"]
+
+
+# Raised for invalid format files, which are skipped with a warning
+class FormatError(ValueError):
+    pass
+
+
+def validateFormat(data: dict):
+    if not isinstance(data, dict):
+        raise FormatError("expected a JSON object")
+    unknownKeys = [key for key in data if key not in FORMAT_KEYS]
+    if unknownKeys:
+        raise FormatError(f"unknown keys {', '.join(unknownKeys)}")
+    data = FORMAT_DEFAULTS | data
+    missingKeys = [key for key in FORMAT_KEYS if key not in data]
+    if missingKeys:
+        raise FormatError(f"missing keys {', '.join(missingKeys)}")
+    if not isinstance(data["name"], str) or not data["name"]:
+        raise FormatError("name must be a non-empty string")
+    for key in FORMAT_KEYS:
+        if key == "name":
+            continue
+        value = data[key]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise FormatError(f"{key} must be a non-negative number")
+    # The baked body cuts slots with a box between two cylinders, which can't be empty
+    for key in ["slotDiameter", "slotLength"]:
+        if data[key] <= 0:
+            raise FormatError(f"{key} must be greater than 0")
+    if data["maxPcbLength"] >= data["panelLength"]:
+        raise FormatError("maxPcbLength must be less than panelLength")
+    return data
+
+
+def parseFormatFile(path: str):
+    formatId = os.path.basename(path)[: -len(".json")]
+    try:
+        with open(path) as file:
+            return PanelFormat(id=formatId, **validateFormat(json.load(file)))
+    except (OSError, ValueError) as err:
+        futil.warning(f"skipping invalid panel format file {path}: {err}")
+        return None
+
+
+# Parsed formats by path, with the (mtime, size) they were parsed at
+_parsedFiles: dict[str, tuple[tuple[int, int], PanelFormat | None]] = {}
+_registry: FormatRegistry | None = None
+_registryKey: tuple | None = None
+
+
+# Returns the current format registry. Only the first call (or refresh=True) touches the disk, and then only
+# stats the directory, files are re-parsed only if they changed.
+def getFormatRegistry(refresh: bool = False):
+    global _registry, _registryKey
+    if _registry and not refresh:
+        return _registry
+
+    stats: dict[str, tuple[int, int]] = {}
+    with os.scandir(FORMATS_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                stats[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    registryKey = tuple(sorted(stats.items()))
+    if _registry and registryKey == _registryKey:
+        return _registry
+
+    for path, stat in stats.items():
+        if path not in _parsedFiles or _parsedFiles[path][0] != stat:
+            _parsedFiles[path] = (stat, parseFormatFile(path))
+    for path in list(_parsedFiles):
+        if path not in stats:
+            del _parsedFiles[path]
+
+    formats: dict[str, PanelFormat] = {}
+    idsByName: dict[str, str] = {}
+    for panelFormat in sorted((f for _, f in _parsedFiles.values() if f), key=lambda f: (f.order, f.name)):
+        if panelFormat.name in idsByName:
+            futil.warning(f'skipping panel format "{panelFormat.id}", its name duplicates "{idsByName[panelFormat.name]}"')
+            continue
+        formats[panelFormat.id] = panelFormat
+        idsByName[panelFormat.name] = panelFormat.id
+    if not formats:
+        futil.warning(f"no valid panel formats found in {FORMATS_DIR}")
+
+    _registry = FormatRegistry(formats, idsByName)
+    _registryKey = registryKey
+    return _registry
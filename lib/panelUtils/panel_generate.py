@@ -5,6 +5,7 @@ from ..generalUtils.sketch_utils import (
     addPoints,
     constrainPointToPoint,
     constrainRectangleWidthHeight,
+    deferredCompute,
     lineMidpoint,
     midpoint,
     point,
@@ -12,14 +13,41 @@ from ..generalUtils.sketch_utils import (
     sketchRectangle,
     sketchSlot,
 )
-from ..generalUtils.extrude_utils import extrude
+from ..generalUtils.extrude_utils import cutThroughAll, extrude
+from ..generalUtils.pattern_utils import rectangularPattern
+from ..generalUtils.timing_utils import PhaseTimer
+from ..generalUtils.topology_utils import ProfileQuery
+from ..generalUtils.value_utils import Units
 from .panel_options import PanelOptions
+from .panel_holes import Hole
+from .panel_layout import PanelLayout, getPanelLayout
+from .panel_attributes import savePanelOptions, setRole
+from .panel_body import buildPanelBody
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
 
-def generatePanelComponent(component: adsk.fusion.Component, opts: PanelOptions):
+# When preview is True, a reduced-fidelity sketch is generated that contains only the geometry needed for the
+# extrude profiles. Dimensions, construction/reference lines and constraints that don't affect the profiles are
+# omitted, since preview results are discarded anyway. Pass units to share them across a batch.
+def generatePanelComponent(
+    component: adsk.fusion.Component,
+    opts: PanelOptions,
+    preview: bool = False,
+    timer: PhaseTimer | None = None,
+    units: Units | None = None,
+):
+    timer = timer or PhaseTimer("Panel component")
+    units = units or Units.fromDesign()
+    timer.mark("layout")
+    layout = getPanelLayout(opts)
+
+    if opts.isBaked:
+        bakePanelComponent(component, opts, layout, preview, timer)
+        return
+
+    timer.mark("sketch")
     sketches = component.sketches
     xyPlane = component.xYConstructionPlane
     sketch = sketches.add(xyPlane)
@@ -28,183 +56,279 @@ def generatePanelComponent(component: adsk.fusion.Component, opts: PanelOptions)
     dimensions = sketch.sketchDimensions
 
     sketch.name = "Panel"
-    sketch.areDimensionsShown = True
-
-    # Panel
-    anchorPointVertical, anchorPointHorizontal = opts.anchorPoint.split("-")
-    match anchorPointVertical:
-        case "top":
-            panelStartY = -opts.panelLength
-        case "middle":
-            panelStartY = -opts.panelLength / 2
-        case "bottom":
-            panelStartY = 0
-        case _:
-            raise ValueError("Invalid anchorPoint value")
-
-    match anchorPointHorizontal:
-        case "left":
-            panelStartX = 0
-        case "center":
-            panelStartX = -opts.width / 2
-        case "right":
-            panelStartX = -opts.width
-        case _:
-            raise ValueError("Invalid anchorPoint value")
-
-    panelStartPoint = point(panelStartX, panelStartY)
-
-    rectangleLines = sketchRectangle(sketch, panelStartPoint, opts.width, opts.panelLength)
-    constrainRectangleWidthHeight(sketch, rectangleLines)
-    dimensions.item(dimensions.count - 2).parameter.expression = opts.widthAsExpression
-
-    panelBottomLine = rectangleLines.item(0)
-    panelRightLine = rectangleLines.item(1)
-    panelTopLine = rectangleLines.item(2)
-    panelLeftLine = rectangleLines.item(3)
-
-    topLeftPoint = panelTopLine.endSketchPoint
-    topRightPoint = panelTopLine.startSketchPoint
-    bottomLeftPoint = panelBottomLine.startSketchPoint
-    bottomRightPoint = panelBottomLine.endSketchPoint
-
-    def createPanelHorizontalLine(offset: float, isConstruction: bool):
-        line = lines.addByTwoPoints(
-            point(panelTopLine.startSketchPoint.geometry.x, offset),
-            point(panelTopLine.endSketchPoint.geometry.x, offset),
-        )
-        line.isConstruction = isConstruction
-        constraints.addHorizontal(line)
-        constraints.addCoincident(line.startSketchPoint, panelLeftLine)
-        constraints.addCoincident(line.endSketchPoint, panelRightLine)
-        return line
-
-    def createPanelMidLine():
-        line = createPanelHorizontalLine(lineMidpoint(panelLeftLine).y, True)
-        constraints.addMidPoint(line.startSketchPoint, panelLeftLine)
-        return line
-
-    match opts.anchorPoint:
-        case "top-left":
-            anchorPoint = topLeftPoint
-        case "top-center":
-            anchorPoint = sketchLineMidpoint(sketch, panelTopLine)
-        case "top-right":
-            anchorPoint = topRightPoint
-        case "middle-left":
-            anchorPoint = sketchLineMidpoint(sketch, panelLeftLine)
-        case "middle-center":
-            anchorPoint = sketchLineMidpoint(sketch, createPanelMidLine())
-        case "middle-right":
-            anchorPoint = sketchLineMidpoint(sketch, panelRightLine)
-        case "bottom-left":
-            anchorPoint = bottomLeftPoint
-        case "bottom-center":
-            anchorPoint = sketchLineMidpoint(sketch, panelBottomLine)
-        case "bottom-right":
-            anchorPoint = bottomRightPoint
-        case _:
-            raise ValueError("Invalid anchorPoint value")
-
-    constrainPointToPoint(sketch, anchorPoint, sketch.originPoint)
-
-    # Max extents for anything extruded from the bottom
-    def addRefLine(panelLine: adsk.fusion.SketchLine, offset: float):
-        line = createPanelHorizontalLine(panelLine.startSketchPoint.geometry.y + offset, opts.supportType == "none")
-        dimensions.addDistanceDimension(
-            panelLine.startSketchPoint,
-            line.startSketchPoint,
-            cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.VerticalDimensionOrientation),
-            midpoint(lineMidpoint(line), lineMidpoint(panelLine)),
-        )
-        return line
-
-    railLength = (opts.panelLength - opts.maxPcbLength) / 2
-    topRefLine = addRefLine(panelTopLine, -railLength)
-    bottomRefLine = addRefLine(panelBottomLine, railLength)
-
-    dimensions.addDistanceDimension(
-        topRefLine.startSketchPoint,
-        bottomRefLine.startSketchPoint,
-        cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.VerticalDimensionOrientation),
-        addPoints(
-            midpoint(topRefLine.startSketchPoint.geometry, bottomRefLine.startSketchPoint.geometry),
-            point(-0.2, 0),
-        ),
-        False,
-    )
-
-    if opts.supportType == "shell":
-        shellRectLines = sketchRectangle(
-            sketch,
-            bottomRefLine.startSketchPoint.geometry,
-            opts.width,
-            opts.maxPcbLength,
-            offset=opts.supportShellWallThickness,
-        )
-        shellBottomLine = shellRectLines.item(0)
-        shellRightLine = shellRectLines.item(1)
-        shellTopLine = shellRectLines.item(2)
-        shellLeftLine = shellRectLines.item(3)
-        dimensions.addOffsetDimension(bottomRefLine, shellBottomLine, lineMidpoint(shellBottomLine))
-        dimensions.addOffsetDimension(panelRightLine, shellRightLine, lineMidpoint(shellRightLine))
-        dimensions.addOffsetDimension(topRefLine, shellTopLine, lineMidpoint(shellTopLine))
-        dimensions.addOffsetDimension(panelLeftLine, shellLeftLine, lineMidpoint(shellLeftLine))
-
-    # Screw holes
-    slots = []
-    slotsLeft = True
-    slotsRight = True
-
-    if opts.widthInHp < 6:
-        slotsRight = False
-
-    if slotsLeft:
-        slots.append([topLeftPoint, -1, 1])
-        slots.append([bottomLeftPoint, 1, 1])
-
-    if slotsRight:
-        slots.append([topRightPoint, -1, -1])
-        slots.append([bottomRightPoint, 1, -1])
-
-    slotFaceCount = 4 * len(slots)
-
-    for referencePoint, yOffsetDirection, xOffsetDirection in slots:
-        slotStartPoint = addPoints(
-            referencePoint.geometry,
-            point(xOffsetDirection * opts.slotOffsetX, yOffsetDirection * opts.slotOffsetY),
-        )
-        slotEndPoint = addPoints(slotStartPoint, point(xOffsetDirection * opts.slotLength, 0))
-        slotCenterLine = sketchSlot(sketch, slotStartPoint, slotEndPoint, opts.slotDiameter)[0]
-        constrainPointToPoint(sketch, slotCenterLine.startSketchPoint, referencePoint)
+    sketch.areDimensionsShown = not preview
+
+    # Defer solving until all geometry, constraints and dimensions exist
+    with deferredCompute(sketch):
+        # Panel
+        panelStartPoint = point(layout.panel.x0, layout.panel.y0)
+
+        rectangleLines = sketchRectangle(sketch, panelStartPoint, layout.panel.width, layout.panel.length, preview=preview)
+        if not preview:
+            constrainRectangleWidthHeight(sketch, rectangleLines)
+            widthDimension = dimensions.item(dimensions.count - 2)
+            widthDimension.parameter.expression = opts.getWidthExpression(units)
+            setRole(widthDimension, "width")
+
+        panelBottomLine = rectangleLines.item(0)
+        panelRightLine = rectangleLines.item(1)
+        panelTopLine = rectangleLines.item(2)
+        panelLeftLine = rectangleLines.item(3)
+
+        topLeftPoint = panelTopLine.endSketchPoint
+        topRightPoint = panelTopLine.startSketchPoint
+        bottomLeftPoint = panelBottomLine.startSketchPoint
+        bottomRightPoint = panelBottomLine.endSketchPoint
+
+        def createPanelHorizontalLine(offset: float, isConstruction: bool):
+            line = lines.addByTwoPoints(
+                point(panelTopLine.startSketchPoint.geometry.x, offset),
+                point(panelTopLine.endSketchPoint.geometry.x, offset),
+            )
+            line.isConstruction = isConstruction
+            constraints.addCoincident(line.startSketchPoint, panelLeftLine)
+            constraints.addCoincident(line.endSketchPoint, panelRightLine)
+            if not preview:
+                constraints.addHorizontal(line)
+            return line
+
+        def createPanelMidLine():
+            line = createPanelHorizontalLine(lineMidpoint(panelLeftLine).y, True)
+            constraints.addMidPoint(line.startSketchPoint, panelLeftLine)
+            return line
+
+        def getAnchorPoint():
+            match opts.anchorPoint:
+                case "top-left":
+                    anchorPoint = topLeftPoint
+                case "top-center":
+                    anchorPoint = sketchLineMidpoint(sketch, panelTopLine)
+                case "top-right":
+                    anchorPoint = topRightPoint
+                case "middle-left":
+                    anchorPoint = sketchLineMidpoint(sketch, panelLeftLine)
+                case "middle-center":
+                    anchorPoint = sketchLineMidpoint(sketch, createPanelMidLine())
+                case "middle-right":
+                    anchorPoint = sketchLineMidpoint(sketch, panelRightLine)
+                case "bottom-left":
+                    anchorPoint = bottomLeftPoint
+                case "bottom-center":
+                    anchorPoint = sketchLineMidpoint(sketch, panelBottomLine)
+                case "bottom-right":
+                    anchorPoint = bottomRightPoint
+                case _:
+                    raise ValueError("Invalid anchorPoint value")
+
+            return anchorPoint
+
+        if not preview:
+            constrainPointToPoint(sketch, getAnchorPoint(), sketch.originPoint)
+
+        # Max extents for anything extruded from the bottom
+        def addRefLine(panelLine: adsk.fusion.SketchLine, offset: float):
+            line = createPanelHorizontalLine(panelLine.startSketchPoint.geometry.y + offset, opts.supportType == "none")
+            if preview:
+                return line
+            dimensions.addDistanceDimension(
+                panelLine.startSketchPoint,
+                line.startSketchPoint,
+                cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.VerticalDimensionOrientation),
+                midpoint(lineMidpoint(line), lineMidpoint(panelLine)),
+            )
+            return line
+
+        # Without support, the reference lines are construction lines that don't affect the profiles
+        if not preview or opts.supportType != "none":
+            topRefLine = addRefLine(panelTopLine, -layout.railLength)
+            bottomRefLine = addRefLine(panelBottomLine, layout.railLength)
+
+        if not preview:
+            dimensions.addDistanceDimension(
+                topRefLine.startSketchPoint,
+                bottomRefLine.startSketchPoint,
+                cast(adsk.fusion.DimensionOrientations, adsk.fusion.DimensionOrientations.VerticalDimensionOrientation),
+                addPoints(
+                    midpoint(topRefLine.startSketchPoint.geometry, bottomRefLine.startSketchPoint.geometry),
+                    point(-0.2, 0),
+                ),
+                False,
+            )
+
+        if layout.shellInner:
+            shellRectLines = sketchRectangle(
+                sketch,
+                point(layout.shellInner.x0, layout.shellInner.y0),
+                layout.shellInner.width,
+                layout.shellInner.length,
+                preview=preview,
+            )
+            if not preview:
+                shellBottomLine = shellRectLines.item(0)
+                shellRightLine = shellRectLines.item(1)
+                shellTopLine = shellRectLines.item(2)
+                shellLeftLine = shellRectLines.item(3)
+                setRole(dimensions.addOffsetDimension(bottomRefLine, shellBottomLine, lineMidpoint(shellBottomLine)), "shellWall")
+                setRole(dimensions.addOffsetDimension(panelRightLine, shellRightLine, lineMidpoint(shellRightLine)), "shellWall")
+                setRole(dimensions.addOffsetDimension(topRefLine, shellTopLine, lineMidpoint(shellTopLine)), "shellWall")
+                setRole(dimensions.addOffsetDimension(panelLeftLine, shellLeftLine, lineMidpoint(shellLeftLine)), "shellWall")
+
+        # Screw holes
+        cornerPoints = {
+            "top-left": topLeftPoint,
+            "top-right": topRightPoint,
+            "bottom-left": bottomLeftPoint,
+            "bottom-right": bottomRightPoint,
+        }
+        for slot in layout.slots:
+            slotStartPoint = point(slot.startX, slot.startY)
+            slotEndPoint = point(slot.endX, slot.endY)
+            slotCenterLine = sketchSlot(sketch, slotStartPoint, slotEndPoint, slot.diameter, preview)[0]
+            if not preview:
+                constrainPointToPoint(sketch, slotCenterLine.startSketchPoint, cornerPoints[slot.corner])
+
+        # Leaving the deferredCompute block solves the sketch
+        timer.mark("solve")
+
+    timer.count("curves", sketch.sketchCurves.count)
+    timer.count("constraints", constraints.count)
+    timer.count("dimensions", dimensions.count)
+
+    if layout.holes:
+        timer.mark("sketch holes")
+        holesSketch = sketchHoles(component, layout)
+
+    # Remember how the panel was generated, so it can be edited later
+    if not preview:
+        savePanelOptions(component, opts)
 
     if opts.sketchOnly:
+        timer.mark(None)
         return
 
-    # Extrusions
-    if opts.supportType == "solid":
-        body1 = extrude(component, sketch, [0, 1, 2], -opts.panelHeight, "Panel")
-        body = extrude(
-            component,
-            sketch,
-            [1],
-            -opts.supportSolidHeight,
-            "Support",
-            offsetFrom=body1.faces.item(5 + slotFaceCount),
-            operation=cast(adsk.fusion.FeatureOperations, adsk.fusion.FeatureOperations.JoinFeatureOperation),
-        )
-    elif opts.supportType == "shell":
-        body1 = extrude(component, sketch, [0, 1, 2, 3], -opts.panelHeight, "Panel")
+    # Tag the most recent extrude so its extent can be edited later
+    def tagExtrude(role: str):
+        if not preview:
+            extrudeFeatures = component.features.extrudeFeatures
+            setRole(extrudeFeatures.item(extrudeFeatures.count - 1), role)
+
+    # Profiles are picked by their geometry rather than by index, since Fusion doesn't guarantee any order. The
+    # panel is every profile except the mounting slots, which are matched by their exact bounds (on narrow panels
+    # the center of a rail can lie within a slot's bounds). The support area is bounded by the rails, and for
+    # shells its inside is a separate, smaller profile.
+    profiles = ProfileQuery(sketch)
+    panelProfiles = profiles.withoutBounds([slot.bounds for slot in layout.slots])
+    # The whole panel without support, otherwise the rails and the support area, and the inside of a shell
+    expectedPanelProfiles = 1 if opts.supportType == "none" else 3 + bool(layout.shellInner)
+    if len(panelProfiles) != expectedPanelProfiles:
+        raise ValueError(f"Expected {expectedPanelProfiles} panel profiles, found {len(panelProfiles)}")
+    supportProfiles = profiles.withBounds(layout.supportArea.bounds) if opts.supportType != "none" else []
+    if opts.supportType != "none" and len(supportProfiles) != 1:
+        raise ValueError(f"Expected one support area profile, found {len(supportProfiles)}")
+
+    # Extrusions. The support is extruded from the sketch plane through the panel thickness, instead of from the
+    # bottom face of the panel, so neither extrude depends on the other's geometry and each recomputes on its own.
+    timer.mark("extrude panel")
+    body = extrude(component, panelProfiles, -opts.panelHeight, "Panel", units=units)
+    tagExtrude("panelExtrude")
+    if supportProfiles:
+        timer.mark("extrude support")
         body = extrude(
             component,
-            sketch,
-            [1],
-            -opts.supportShellHeight,
-            "Support Shell",
-            offsetFrom=body1.faces.item(5 + slotFaceCount),
+            supportProfiles,
+            -getSupportDepth(opts),
+            "Support" if opts.supportType == "solid" else "Support Shell",
             operation=cast(adsk.fusion.FeatureOperations, adsk.fusion.FeatureOperations.JoinFeatureOperation),
+            units=units,
         )
-    else:
-        body = extrude(component, sketch, [0], -opts.panelHeight, "Panel")
 
+    if opts.supportType != "none":
+        tagExtrude("supportExtrude")
     body.name = "Panel"
+
+    if layout.holes:
+        timer.mark("cut holes")
+        cutHoles(component, layout, holesSketch, units)
+    timer.mark(None)
+
+
+# Baked panels are a single base feature holding the panel body, built directly from the layout (see panel_body.py),
+# without a sketch or extrudes. Base features don't recompute, so large assemblies of baked panels stay fast to
+# edit. The options are still saved on the component, so the edit command can bake the panel again.
+def bakePanelComponent(component: adsk.fusion.Component, opts: PanelOptions, layout: PanelLayout, preview: bool, timer: PhaseTimer):
+    timer.mark("build body")
+    body = buildPanelBody(opts, layout)
+
+    timer.mark("base feature")
+    baseFeature = component.features.baseFeatures.add()
+    baseFeature.name = "Baked Panel"
+    baseFeature.startEdit()
+    try:
+        component.bRepBodies.add(body, baseFeature).name = "Panel"
+    finally:
+        baseFeature.finishEdit()
+
+    if not preview:
+        savePanelOptions(component, opts)
+    timer.mark(None)
+
+
+# Depth of the support extrude below the sketch plane, including the panel thickness
+def getSupportDepth(opts: PanelOptions):
+    supportHeight = opts.supportSolidHeight if opts.supportType == "solid" else opts.supportShellHeight
+    return opts.panelHeight + supportHeight
+
+
+# All hole map holes go into a single sketch of their own, so they don't affect the panel sketch profiles. Holes
+# are positioned by the hole map, which is their source of truth, so they aren't constrained or dimensioned.
+# Only the first hole of each grid is sketched, the rest are added by a pattern feature in cutHoles.
+def sketchHoles(component: adsk.fusion.Component, layout: PanelLayout):
+    sketch = component.sketches.add(component.xYConstructionPlane)
+    sketch.name = "Holes"
+    lines = sketch.sketchCurves.sketchLines
+    circles = sketch.sketchCurves.sketchCircles
+
+    with deferredCompute(sketch):
+        for hole in layout.holes:
+            extentX, extentY = hole.extents
+            for x, y in hole.seedCenters:
+                if hole.isRect:
+                    lines.addTwoPointRectangle(point(x - extentX, y - extentY), point(x + extentX, y + extentY))
+                else:
+                    circles.addByCenterRadius(point(x, y), hole.diameter / 2)
+
+    return sketch
+
+
+# Cuts every hole that isn't part of a grid with a single extrude, and each grid with an extrude of its first
+# hole(s) and a rectangular pattern of that extrude, so the feature count doesn't grow with the hole count. Grids
+# with the same counts and pitches, eg. a row of pots above a row of switches, share their extrude and pattern.
+def cutHoles(component: adsk.fusion.Component, layout: PanelLayout, sketch: adsk.fusion.Sketch, units: Units):
+    profiles = ProfileQuery(sketch)
+    gridHoles = [(i, hole) for i, hole in enumerate(layout.holes) if hole.isGrid]
+    # Grid seed profiles are found by their centers, every other profile is a hole that's cut as is
+    gridProfiles = {i: [profiles.atCenter(x, y) for x, y in hole.seedCenters] for i, hole in gridHoles}
+    # By identity, since the query hands out the same profile objects
+    seedIds = {id(profile) for seeds in gridProfiles.values() for profile in seeds if profile}
+    holeProfiles = [entry.profile for entry in profiles.entries if id(entry.profile) not in seedIds]
+
+    if holeProfiles:
+        cutThroughAll(component, holeProfiles, "Holes")
+
+    sharedGrids: dict[tuple, list[tuple[int, Hole]]] = {}
+    for i, hole in gridHoles:
+        if not any(gridProfiles[i]):
+            raise ValueError(f"Profile for {hole.type} grid {i + 1} not found")
+        sharedGrids.setdefault(hole.gridKey, []).append((i, hole))
+
+    for grids in sharedGrids.values():
+        seeds = [profile for i, _ in grids for profile in gridProfiles[i] if profile]
+        i, hole = grids[0]
+        types = " + ".join(dict.fromkeys(gridHole.type.capitalize() for _, gridHole in grids))
+        name = "{} Grid {}".format(types, i + 1)
+        feature = cutThroughAll(component, seeds, name)
+        directions = [
+            (component.xConstructionAxis, hole.countX, hole.pitchX),
+            (component.yConstructionAxis, hole.countY, hole.pitchY),
+        ]
+        rectangularPattern(component, feature, directions, name, units)
@@ -0,0 +1,286 @@
+import csv
+import json
+import math
+import os
+from dataclasses import dataclass, fields, replace
+from itertools import groupby
+from .panel_kicad import KicadBoard, loadKicadBoard
+
+# Hole maps list the jacks, pots, switches, LEDs and other holes to cut into a panel, as JSON or CSV. Positions
+# are the hole centers relative to the panel anchor point, and like all hole map values are in mm (which is what
+# component datasheets use). Y is up, so with a top anchor point holes have negative y values. eg.
+#
+#   {"holes": [
+#     {"type": "jack", "x": 7.5, "y": -100, "countX": 2, "pitchX": 15, "countY": 3, "pitchY": -12},
+#     {"type": "pot", "x": 15, "y": -30},
+#     {"type": "led", "x": 15, "y": -45, "circularCount": 8, "circularCenterX": 15, "circularCenterY": -30},
+#     {"type": "rect", "x": 15, "y": -60, "width": 10, "height": 4}
+#   ]}
+#
+# CSV files have a header row with the same column names, empty cells use the defaults. Holes without a diameter
+# use the default for their type. countX/countY (with pitchX/pitchY) repeat a hole on a grid, which is cut with a
+# single pattern feature. circularCount repeats a hole evenly around circularCenterX/Y. JSON hole maps can also
+# set "origin": "pcb" to position holes relative to the center of the PCB area between the rails instead.
+#
+# KiCad .kicad_pcb board files are hole maps too, see panel_kicad.py. The jack, pot, switch and LED footprints
+# become holes relative to the center of the board outline, which is centered in the PCB area of the panel. Like
+# the layout, this module has no adsk dependencies.
+
+# Default hole diameters in mm, by type
+HOLE_TYPE_DIAMETERS = {
+    "jack": 6.0,  # 3.5mm jacks, eg. Thonkiconn
+    "pot": 7.0,  # 9mm pots, M7 bushing
+    "switch": 6.2,  # Mini toggle switches, M6 bushing
+    "button": 7.2,
+    "led": 3.2,  # 3mm LEDs
+    "led5": 5.2,  # 5mm LEDs
+    "hole": 0.0,  # Generic hole, diameter required
+    "rect": 0.0,  # Rectangular cutout, width and height required
+}
+
+MM = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class Hole:
+    type: str
+    # Center of the (first) hole, in cm relative to the anchor point
+    x: float
+    y: float
+    # Circular holes have a diameter, rectangular cutouts a width and height, all in cm
+    diameter: float = 0.0
+    width: float = 0.0
+    height: float = 0.0
+    # Grid repeats, cut with a rectangular pattern feature
+    countX: int = 1
+    pitchX: float = 0.0
+    countY: int = 1
+    pitchY: float = 0.0
+    # Circular repeats around a center point
+    circularCount: int = 1
+    circularCenterX: float = 0.0
+    circularCenterY: float = 0.0
+
+    @property
+    def isRect(self):
+        return self.type == "rect"
+
+    @property
+    def isGrid(self):
+        return self.countX > 1 or self.countY > 1
+
+    # Grids with the same key repeat their seeds the same way, so they can share a pattern
+    @property
+    def gridKey(self):
+        return (self.countX, roundedKey(self.pitchX), self.countY, roundedKey(self.pitchY))
+
+    # Half the width and height of a single hole
+    @property
+    def extents(self):
+        if self.isRect:
+            return (self.width / 2, self.height / 2)
+        return (self.diameter / 2, self.diameter / 2)
+
+    # Centers of the hole and all of its circular repeats, but not its grid repeats
+    @property
+    def seedCenters(self):
+        if self.circularCount <= 1:
+            return [(self.x, self.y)]
+        radius = math.hypot(self.x - self.circularCenterX, self.y - self.circularCenterY)
+        startAngle = math.atan2(self.y - self.circularCenterY, self.x - self.circularCenterX)
+        return [
+            (
+                self.circularCenterX + radius * math.cos(startAngle + 2 * math.pi * i / self.circularCount),
+                self.circularCenterY + radius * math.sin(startAngle + 2 * math.pi * i / self.circularCount),
+            )
+            for i in range(self.circularCount)
+        ]
+
+    # Centers of every hole this entry produces
+    @property
+    def centers(self):
+        return [
+            (x + i * self.pitchX, y + j * self.pitchY)
+            for x, y in self.seedCenters
+            for i in range(self.countX)
+            for j in range(self.countY)
+        ]
+
+    def translated(self, x: float, y: float):
+        return replace(self, x=self.x + x, y=self.y + y, circularCenterX=self.circularCenterX + x, circularCenterY=self.circularCenterY + y)
+
+
+HOLE_ORIGINS = ["anchor", "pcb"]
+
+
+@dataclass(frozen=True, slots=True)
+class HoleMap:
+    holes: tuple[Hole, ...]
+    # "anchor" if hole positions are relative to the panel anchor point, "pcb" if they are relative to the center of
+    # the PCB area between the rails
+    origin: str = "anchor"
+    # Width and length of the PCB in cm, if known, so the layout can check that it fits between the rails
+    pcbSize: tuple[float, float] | None = None
+
+
+HOLE_KEYS = {f.name for f in fields(Hole)}
+LENGTH_KEYS = {"x", "y", "diameter", "width", "height", "pitchX", "pitchY", "circularCenterX", "circularCenterY"}
+COUNT_KEYS = {"countX", "countY", "circularCount"}
+
+
+# JSON values may be of any type, CSV values are strings. Raises ValueError for anything that isn't a valid hole.
+def parseHole(data: dict, where: str):
+    if not isinstance(data, dict):
+        raise ValueError(f"{where}: invalid hole, expected an object")
+    data = {key: value for key, value in data.items() if value not in (None, "")}
+    unknownKeys = [key for key in data if key not in HOLE_KEYS]
+    if unknownKeys:
+        # Extra CSV columns have a None key
+        raise ValueError(f"{where}: unknown keys {', '.join(map(str, unknownKeys))}")
+    holeType = data.get("type", "hole")
+    if not isinstance(holeType, str) or holeType not in HOLE_TYPE_DIAMETERS:
+        raise ValueError(f'{where}: unknown type "{holeType}", expected one of {", ".join(HOLE_TYPE_DIAMETERS)}')
+    if "x" not in data or "y" not in data:
+        raise ValueError(f"{where}: x and y are required")
+
+    values = {"type": holeType, "diameter": HOLE_TYPE_DIAMETERS[holeType]}
+    for key, value in data.items():
+        if key == "type":
+            continue
+        try:
+            # bool is an int, but true isn't a length
+            if isinstance(value, bool):
+                raise ValueError
+            values[key] = float(value)
+            if key in COUNT_KEYS:
+                if not values[key].is_integer() or values[key] < 1:
+                    raise ValueError
+                values[key] = int(values[key])
+        except (TypeError, ValueError):
+            raise ValueError(f'{where}: invalid {key} "{value}"') from None
+    for key in LENGTH_KEYS & values.keys():
+        values[key] *= MM
+    # Patterns repeat in the positive axis directions, so grids with a negative pitch start from the other end
+    for axis in ["X", "Y"]:
+        pitch = values.get(f"pitch{axis}", 0.0)
+        if pitch < 0:
+            values[axis.lower()] += (values.get(f"count{axis}", 1) - 1) * pitch
+            values[f"pitch{axis}"] = -pitch
+
+    hole = Hole(**values)
+    if hole.isRect and (hole.width <= 0 or hole.height <= 0):
+        raise ValueError(f"{where}: rect cutouts need a width and height")
+    if not hole.isRect and hole.diameter <= 0:
+        raise ValueError(f"{where}: {holeType} holes need a diameter")
+    if hole.countX > 1 and not hole.pitchX or hole.countY > 1 and not hole.pitchY:
+        raise ValueError(f"{where}: repeated holes need a pitchX/pitchY")
+    return hole
+
+
+def parseHoleMap(text: str, isCsv: bool):
+    if isCsv:
+        rows = list(csv.DictReader(line for line in text.splitlines() if line.strip() and not line.startswith("#")))
+        return HoleMap(tuple(parseHole(row, f"row {i}") for i, row in enumerate(rows, 2)))
+
+    data = json.loads(text)
+    holes = data.get("holes") if isinstance(data, dict) else data
+    if not isinstance(holes, list):
+        raise ValueError('expected a list of holes, or an object with a "holes" list')
+    origin = data.get("origin", "anchor") if isinstance(data, dict) else "anchor"
+    if origin not in HOLE_ORIGINS:
+        raise ValueError(f'unknown origin "{origin}", expected one of {", ".join(HOLE_ORIGINS)}')
+    return HoleMap(tuple(parseHole(hole, f"hole {i}") for i, hole in enumerate(holes, 1)), origin)
+
+
+def roundedKey(value: float):
+    return round(value, 4)
+
+
+# Splits sorted values into runs with a constant (non-zero) step, as (start, step, count) tuples
+def getEvenRuns(values: list[float]):
+    runs: list[tuple[float, float, int]] = []
+    for value in values:
+        if runs:
+            start, step, count = runs[-1]
+            if count == 1:
+                if roundedKey(value - start) > 0:
+                    runs[-1] = (start, value - start, 2)
+                    continue
+            elif roundedKey(value - start - step * count) == 0:
+                runs[-1] = (start, step, count + 1)
+                continue
+        runs.append((value, 0.0, 1))
+    return runs
+
+
+# Combines holes of the same type and size that are evenly spaced in rows and columns into grid holes, so they are
+# cut with pattern features, eg. the rows of jacks on an imported board. Holes must not be grids already. Identical
+# holes at the same position, eg. from stacked footprints, are only cut once.
+def groupHoleGrids(holes: list[Hole]):
+    def getSizeKey(hole: Hole):
+        return (hole.type, roundedKey(hole.diameter), roundedKey(hole.width), roundedKey(hole.height))
+
+    def getRowKey(row: tuple[float, float, int, float]):
+        return (roundedKey(row[0]), roundedKey(row[1]), row[2])
+
+    grouped: list[Hole] = []
+    for _, sizeHoles in groupby(sorted(holes, key=getSizeKey), getSizeKey):
+        sizeHoles = list({(roundedKey(hole.x), roundedKey(hole.y)): hole for hole in sizeHoles}.values())
+        # Evenly spaced runs of holes within each row, as (x, pitchX, countX, y)
+        rows = []
+        for y, rowHoles in groupby(sorted(sizeHoles, key=lambda hole: (roundedKey(hole.y), hole.x)), lambda hole: roundedKey(hole.y)):
+            rows += [(x, pitchX, countX, y) for x, pitchX, countX in getEvenRuns([hole.x for hole in rowHoles])]
+        # Evenly spaced identical rows become grids
+        for (_, _, countX), similarRows in groupby(sorted(rows, key=lambda row: (getRowKey(row), row[3])), getRowKey):
+            similarRows = list(similarRows)
+            x, pitchX = similarRows[0][:2]
+            for y, pitchY, countY in getEvenRuns([row[3] for row in similarRows]):
+                grouped.append(replace(sizeHoles[0], x=x, y=y, countX=countX, pitchX=pitchX, countY=countY, pitchY=pitchY))
+    return grouped
+
+
+def getKicadHoleMap(board: KicadBoard):
+    if not board.footprints:
+        raise ValueError("no jack, pot, switch or LED footprints found")
+    if board.edges:
+        x0, y0, x1, y1 = board.edges
+    else:
+        xs = [footprint.x for footprint in board.footprints]
+        ys = [footprint.y for footprint in board.footprints]
+        x0, y0, x1, y1 = min(xs), min(ys), max(xs), max(ys)
+    centerX, centerY = (x0 + x1) / 2, (y0 + y1) / 2
+
+    # KiCad's y axis points down, and the board is viewed from the front, just like the panel
+    holes = [
+        Hole(footprint.holeType, (footprint.x - centerX) * MM, (centerY - footprint.y) * MM, HOLE_TYPE_DIAMETERS[footprint.holeType] * MM)
+        for footprint in board.footprints
+    ]
+    pcbSize = ((x1 - x0) * MM, (y1 - y0) * MM) if board.edges else None
+    return HoleMap(tuple(groupHoleGrids(holes)), "pcb", pcbSize)
+
+
+# Parsed hole maps by path, with the (mtime, size) they were parsed at
+_holeMaps: dict[str, tuple[tuple[int, int], HoleMap]] = {}
+
+
+# Raises ValueError (or OSError) for invalid or missing files
+def loadHoleMap(path: str):
+    fileStat = os.stat(path)
+    fileKey = (fileStat.st_mtime_ns, fileStat.st_size)
+    cached = _holeMaps.get(path)
+    if cached and cached[0] == fileKey:
+        return cached[1]
+
+    if path.lower().endswith(".kicad_pcb"):
+        try:
+            holeMap = getKicadHoleMap(loadKicadBoard(path))
+        except ValueError as err:
+            raise ValueError(f"Invalid hole map {os.path.basename(path)}: {err}") from None
+    else:
+        with open(path, newline="") as file:
+            try:
+                holeMap = parseHoleMap(file.read(), path.lower().endswith(".csv"))
+            except ValueError as err:
+                raise ValueError(f"Invalid hole map {os.path.basename(path)}: {err}") from None
+    _holeMaps[path] = (fileKey, holeMap)
+    return holeMap
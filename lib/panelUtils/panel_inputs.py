@@ -1,6 +1,7 @@
 import adsk.core
 from enum import Enum
 from typing import cast
+from ..generalUtils.persist_utils import PresetStore
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -10,24 +11,41 @@ class Actions(Enum):
     RESTORE_DEFAULTS = "RESTORE_DEFAULTS"
     SAVE_DEFAULTS = "SAVE_DEFAULTS"
     ERASE_DEFAULTS = "ERASE_DEFAULTS"
+    SAVE_PRESET = "SAVE_PRESET"
+    DELETE_PRESET = "DELETE_PRESET"
+    BROWSE_HOLE_MAP = "BROWSE_HOLE_MAP"
+
+
+# Preset dropdown entry for not using a preset
+NO_PRESET = "(none)"
 
 
 class Inputs:
-    def __init__(self, inputs: adsk.core.CommandInputs, options):
+    def __init__(self, inputs: adsk.core.CommandInputs, options, presets: PresetStore, editMode: bool = False):
         self.inputs = inputs
         self.options = options
+        self.presets = presets
+        self.editMode = editMode
 
         self.initializeInputs()
 
+        self.preset = adsk.core.DropDownCommandInput.cast(self.inputs.itemById("preset"))
+        self.presetName = adsk.core.StringValueCommandInput.cast(self.inputs.itemById("presetName"))
         self.widthInHp = adsk.core.IntegerSpinnerCommandInput.cast(self.inputs.itemById("widthInHp"))
+        self.widthFeedback = adsk.core.TextBoxCommandInput.cast(self.inputs.itemById("widthFeedback"))
         self.panelHeight = adsk.core.ValueCommandInput.cast(self.inputs.itemById("panelHeight"))
         self.sketchOnly = adsk.core.BoolValueCommandInput.cast(self.inputs.itemById("sketchOnly"))
+        self.bakedOutput = adsk.core.BoolValueCommandInput.cast(self.inputs.itemById("bakedOutput"))
+        self.parametricPreview = adsk.core.BoolValueCommandInput.cast(self.inputs.itemById("parametricPreview"))
         self.supportSolidHeight = adsk.core.ValueCommandInput.cast(self.inputs.itemById("supportSolidHeight"))
         self.supportShellHeight = adsk.core.ValueCommandInput.cast(self.inputs.itemById("supportShellHeight"))
         self.supportShellWallThickness = adsk.core.ValueCommandInput.cast(self.inputs.itemById("supportShellWallThickness"))
         self.formatType = adsk.core.DropDownCommandInput.cast(self.inputs.itemById("formatType"))
         self.anchorPoint = adsk.core.DropDownCommandInput.cast(self.inputs.itemById("anchorPoint"))
         self.supportType = adsk.core.DropDownCommandInput.cast(self.inputs.itemById("supportType"))
+        self.holeMapFile = adsk.core.StringValueCommandInput.cast(self.inputs.itemById("holeMapFile"))
+        self.batchSpecs = adsk.core.TextBoxCommandInput.cast(self.inputs.itemById("batchSpecs"))
+        self.instanceIdenticalPanels = adsk.core.BoolValueCommandInput.cast(self.inputs.itemById("instanceIdenticalPanels"))
 
         self.updateUiState()
 
@@ -36,25 +54,40 @@ class Inputs:
         supportTypeName = self.supportType.selectedItem.name
         supportTypeId = self.options.getIdForSupportTypeName(supportTypeName)
         self.panelHeight.isVisible = not sketchOnly
+        self.bakedOutput.isVisible = not sketchOnly
         self.supportSolidHeight.isVisible = supportTypeId == "solid" and not sketchOnly
         self.supportShellHeight.isVisible = supportTypeId == "shell" and not sketchOnly
         self.supportShellWallThickness.isVisible = supportTypeId == "shell"
+        self.updateFeedback()
+
+    # Cheap feedback, updated on every input change even while previews are held back (see panel_command.py)
+    def updateFeedback(self):
+        panelFormat = self.options.getFormatByName(self.formatType.selectedItem.name)
+        unitsMgr = app.activeProduct.unitsManager
+        self.widthFeedback.text = unitsMgr.formatValue(panelFormat.hpWidth * self.widthInHp.value)
 
     def updateOptionsFromInputs(self):
         self.options.widthInHp = int(self.widthInHp.value)
         self.options.panelHeight = self.panelHeight.value
         self.options.sketchOnly = self.sketchOnly.value
+        self.options.bakedOutput = self.bakedOutput.value
+        self.options.parametricPreview = self.parametricPreview.value
+        self.options.instanceIdenticalPanels = self.instanceIdenticalPanels.value
         self.options.supportSolidHeight = self.supportSolidHeight.value
         self.options.supportShellHeight = self.supportShellHeight.value
         self.options.supportShellWallThickness = self.supportShellWallThickness.value
         self.options.formatName = self.formatType.selectedItem.name
         self.options.anchorPointName = self.anchorPoint.selectedItem.name
         self.options.supportTypeName = self.supportType.selectedItem.name
+        self.options.holeMapFile = self.holeMapFile.value.strip()
 
     def updateInputsFromOptions(self):
         self.widthInHp.value = self.options.widthInHp
         self.panelHeight.value = self.options.panelHeight
         self.sketchOnly.value = self.options.sketchOnly
+        self.bakedOutput.value = self.options.bakedOutput
+        self.parametricPreview.value = self.options.parametricPreview
+        self.instanceIdenticalPanels.value = self.options.instanceIdenticalPanels
         self.supportSolidHeight.value = self.options.supportSolidHeight
         self.supportShellHeight.value = self.options.supportShellHeight
         self.supportShellWallThickness.value = self.options.supportShellWallThickness
@@ -64,15 +97,73 @@ class Inputs:
             listItem.isSelected = listItem.name == self.options.anchorPointName
         for listItem in self.supportType.listItems:
             listItem.isSelected = listItem.name == self.options.supportTypeName
+        self.holeMapFile.value = self.options.holeMapFile
 
+    # Batch specs are validated separately, see panel_plan.py
     @property
     def isValid(self):
         return self.widthInHp.value >= 2
 
+    def applyPreset(self):
+        name = self.preset.selectedItem.name if self.preset.selectedItem else NO_PRESET
+        preset = self.presets.get(name)
+        if preset is None:
+            return
+        # Checked before anything is applied, so an outdated preset leaves the inputs as they were
+        problems = self.options.getUnknownIdProblems(preset)
+        if problems:
+            ui.messageBox(f'Preset "{name}" can\'t be used, it uses {", ".join(problems)}.', "Warning")
+            return
+        self.options.updateFromDict(preset)
+        self.presetName.value = name
+        self.updateInputsFromOptions()
+        self.updateUiState()
+
+    def savePreset(self):
+        name = self.presetName.value.strip()
+        if not name or name == NO_PRESET:
+            ui.messageBox("Enter a name for the preset first.", "Warning")
+            return
+        self.updateOptionsFromInputs()
+        isNew = self.presets.get(name) is None
+        if not self.presets.save(name, self.options.geometryOptions):
+            ui.messageBox(f"Unable to save presets file {self.presets.persistFile}. Is it writable?", "Warning")
+        elif isNew:
+            self.preset.listItems.add(name, True)
+        else:
+            for listItem in self.preset.listItems:
+                listItem.isSelected = listItem.name == name
+
+    def deletePreset(self):
+        name = self.preset.selectedItem.name if self.preset.selectedItem else NO_PRESET
+        if self.presets.get(name) is None:
+            return
+        if not self.presets.delete(name):
+            ui.messageBox(f"Unable to save presets file {self.presets.persistFile}. Is it writable?", "Warning")
+            return
+        self.preset.selectedItem.deleteMe()
+        self.preset.listItems.item(0).isSelected = True
+
+    def browseHoleMap(self):
+        fileDialog = ui.createFileDialog()
+        fileDialog.title = "Choose a hole map file"
+        fileDialog.filter = "Hole maps (*.json *.csv *.kicad_pcb)"
+        if fileDialog.showOpen() != adsk.core.DialogResults.DialogOK:
+            return
+        self.holeMapFile.value = fileDialog.filename
+
     def handleAction(self, action: str):
         self.updateUiState()
 
         match action:
+            case "preset":
+                self.applyPreset()
+            case Actions.SAVE_PRESET.value:
+                self.savePreset()
+            case Actions.DELETE_PRESET.value:
+                self.deletePreset()
+            case Actions.BROWSE_HOLE_MAP.value:
+                self.browseHoleMap()
             case Actions.RESTORE_DEFAULTS.value:
                 self.options.restoreDefaults()
                 self.updateInputsFromOptions()
@@ -90,6 +181,19 @@ class Inputs:
         message = 'For more information, <a href="https://github.com/cowboy/ModularSynthPanelGenerator">read the documentation.</a>'
         self.inputs.addTextBoxCommandInput("infoTextBox", "Information", message, 1, True)
 
+        if self.editMode:
+            panelSelectionInput = self.inputs.addSelectionInput("panelSelection", "Panel", "Select a generated panel to edit")
+            panelSelectionInput.addSelectionFilter("Occurrences")
+            panelSelectionInput.setSelectionLimits(1, 1)
+
+        presetDropdown = self.inputs.addDropDownCommandInput(
+            "preset", "Preset", cast(adsk.core.DropDownStyles, adsk.core.DropDownStyles.TextListDropDownStyle)
+        )
+        presetDropdown.listItems.add(NO_PRESET, True)
+        for name in self.presets.names:
+            presetDropdown.listItems.add(name, False)
+        presetDropdown.tooltip = "Apply a saved preset to all inputs below"
+
         heightDropdown = self.inputs.addDropDownCommandInput(
             "formatType", "Panel format", cast(adsk.core.DropDownStyles, adsk.core.DropDownStyles.TextListDropDownStyle)
         )
@@ -97,6 +201,7 @@ class Inputs:
             heightDropdown.listItems.add(name, name == self.options.formatName)
 
         self.inputs.addIntegerSpinnerCommandInput("widthInHp", "Panel width in HP", 2, 9000, 1, self.options.widthInHp)
+        self.inputs.addTextBoxCommandInput("widthFeedback", "Panel width", "", 1, True)
         self.inputs.addValueInput(
             "panelHeight",
             "Panel height",
@@ -111,6 +216,14 @@ class Inputs:
             anchorPointDropdown.listItems.add(name, name == self.options.anchorPointName)
 
         self.inputs.addBoolValueInput("sketchOnly", "Sketch only", True, "", self.options.sketchOnly)
+        bakedOutputInput = self.inputs.addBoolValueInput("bakedOutput", "Baked (no history)", True, "", self.options.bakedOutput)
+        bakedOutputInput.tooltip = "Generate the panel as a single base feature body, without a sketch or extrusions"
+        bakedOutputInput.tooltipDescription = (
+            "Baked panels don't add to the design's timeline recompute, which helps in assemblies with many panels. "
+            "They can still be changed with the Edit Modular Synth Panel command, which bakes them again."
+        )
+        parametricPreviewInput = self.inputs.addBoolValueInput("parametricPreview", "Parametric preview", True, "", self.options.parametricPreview)
+        parametricPreviewInput.tooltip = "Preview with a simplified parametric sketch and extrusions instead of a lightweight outline (slower)"
 
         supportGroup = self.inputs.addGroupCommandInput("supportGroup", "Reinforcement")
         supportGroup.isExpanded = True
@@ -140,6 +253,47 @@ class Inputs:
             adsk.core.ValueInput.createByReal(self.options.supportShellWallThickness),
         )
 
+        # Jacks, pots, switches and LEDs, see panel_holes.py
+        holesGroup = self.inputs.addGroupCommandInput("holesGroup", "Holes")
+        holesGroup.isExpanded = bool(self.options.holeMapFile)
+        holeMapFileInput = holesGroup.children.addStringValueInput("holeMapFile", "Hole map file", self.options.holeMapFile)
+        holeMapFileInput.tooltip = "Cut component holes into the panel"
+        holeMapFileInput.tooltipDescription = (
+            "A JSON or CSV file listing the holes to cut, with a type (jack, pot, switch, button, led, led5, hole or rect), "
+            "x and y in mm relative to the anchor point, and an optional diameter or width and height. "
+            "Or a KiCad board file, whose jack, pot, switch and LED footprints are cut with the board centered between the rails. "
+            "When empty, only the mounting slots are cut."
+        )
+        browseHoleMapInput = holesGroup.children.addBoolValueInput(Actions.BROWSE_HOLE_MAP.name, "Browse", False, "", False)
+        browseHoleMapInput.text = "Choose a hole map file"
+
+        # Batch generation, one panel per line
+        batchGroup = self.inputs.addGroupCommandInput("batchGroup", "Batch")
+        batchGroup.isExpanded = False
+        # Existing panels are edited one at a time
+        batchGroup.isVisible = not self.editMode
+        batchSpecsInput = batchGroup.children.addTextBoxCommandInput("batchSpecs", "Panels", "", 4, False)
+        batchSpecsInput.tooltip = "Generate many panels at once"
+        batchSpecsInput.tooltipDescription = (
+            "One panel per line: format, width in HP, support type, anchor point (eg. 3u_eurorack, 6, shell, top-left). "
+            "Omitted fields use the values above. Add xN to the end of a line to repeat it N times (eg. 3u_eurorack, 4 x12). "
+            "Use @ followed by a preset name for a saved preset (eg. @1U tile blank x4). "
+            "When empty, a single panel is generated."
+        )
+        instanceInput = batchGroup.children.addBoolValueInput(
+            "instanceIdenticalPanels", "Reuse identical panels", True, "", self.options.instanceIdenticalPanels
+        )
+        instanceInput.tooltip = "Generate each unique panel once and place identical panels as additional occurrences of the same component"
+
+        # Save and delete named presets
+        presetGroup = self.inputs.addGroupCommandInput("presetGroup", "Presets")
+        presetGroup.isExpanded = False
+        presetGroup.children.addStringValueInput("presetName", "Preset name", "")
+        savePresetInput = presetGroup.children.addBoolValueInput(Actions.SAVE_PRESET.name, "Save preset", False, "", False)
+        savePresetInput.text = "Save current input values as a named preset"
+        deletePresetInput = presetGroup.children.addBoolValueInput(Actions.DELETE_PRESET.name, "Delete preset", False, "", False)
+        deletePresetInput.text = "Delete the selected preset"
+
         # Save, restore and erase defaults
         persistGroup = self.inputs.addGroupCommandInput("persistGroup", "Defaults")
         persistGroup.isExpanded = True
@@ -0,0 +1,85 @@
+import adsk.core
+import adsk.fusion
+import copy
+import csv
+import json
+from dataclasses import dataclass, field
+from .panel_attributes import PANEL_ATTRIBUTE_GROUP
+from .panel_options import PanelOptions
+
+# Generated panels are found through the options attribute stored on their component (see panel_attributes.py).
+# design.findAttributes is a single indexed lookup, so unlike walking every occurrence and matching names, the
+# cost only grows with the number of generated panel components, not the size of the assembly.
+
+INVENTORY_CSV_HEADER = ["Format", "Width (HP)", "Reinforcement", "Quantity", "Components"]
+
+
+@dataclass
+class InventoryItem:
+    formatName: str
+    widthInHp: int
+    supportTypeName: str
+    quantity: int = 0
+    components: list[str] = field(default_factory=list)
+
+    @property
+    def csvRow(self):
+        return [self.formatName, self.widthInHp, self.supportTypeName, self.quantity, ", ".join(self.components)]
+
+
+# Every generated panel component in the design, with the options it was generated from
+def findPanelComponents(design: adsk.fusion.Design, opts: PanelOptions):
+    panels: list[tuple[adsk.fusion.Component, PanelOptions]] = []
+    for attribute in design.findAttributes(PANEL_ATTRIBUTE_GROUP, "options"):
+        component = adsk.fusion.Component.cast(attribute.parent)
+        if not component:
+            continue
+        try:
+            data = json.loads(attribute.value)
+        except ValueError:
+            continue
+        panelOpts = copy.copy(opts)
+        panelOpts.updateFromDict(data)
+        panels.append((component, panelOpts))
+    return panels
+
+
+# Panels may have been generated with a format or support type this version doesn't know (eg. from a removed custom
+# format file), those are listed by their stored ID
+def getFormatName(panelOpts: PanelOptions):
+    try:
+        return panelOpts.formatName
+    except KeyError:
+        return panelOpts.formatId
+
+
+def getSupportTypeName(panelOpts: PanelOptions):
+    try:
+        return panelOpts.supportTypeName
+    except KeyError:
+        return panelOpts.supportType
+
+
+# Generated panels grouped by format, HP and support type, with the number of placed occurrences of each
+def getPanelInventory(design: adsk.fusion.Design, opts: PanelOptions):
+    root = design.rootComponent
+    inventory: dict[tuple, InventoryItem] = {}
+    for component, panelOpts in findPanelComponents(design, opts):
+        key = (panelOpts.formatId, panelOpts.widthInHp, panelOpts.supportType)
+        if key not in inventory:
+            inventory[key] = InventoryItem(getFormatName(panelOpts), panelOpts.widthInHp, getSupportTypeName(panelOpts))
+        item = inventory[key]
+        item.quantity += root.allOccurrencesByComponent(component).count
+        item.components.append(component.name)
+
+    # Sorted like the format dropdown, then by width
+    formatOrder = {formatId: i for i, formatId in enumerate(opts.formatIds)}
+    return [inventory[key] for key in sorted(inventory, key=lambda key: (formatOrder.get(key[0], len(formatOrder)), key[1], key[2]))]
+
+
+def writeInventoryCsv(filename: str, inventory: list[InventoryItem]):
+    with open(filename, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(INVENTORY_CSV_HEADER)
+        for item in inventory:
+            writer.writerow(item.csvRow)
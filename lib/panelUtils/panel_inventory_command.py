@@ -0,0 +1,86 @@
+import adsk.core
+import adsk.fusion
+import traceback
+
+from .. import fusionAddInUtils as futil
+from .command_info import INVENTORY_CMD_DESCRIPTION, INVENTORY_CMD_NAME
+from .panel_inventory import InventoryItem, getPanelInventory, writeInventoryCsv
+from .panel_options import PanelOptions
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+CMD_NAME = INVENTORY_CMD_NAME
+CMD_Description = INVENTORY_CMD_DESCRIPTION
+
+OPTIONS = PanelOptions("modular_synth_panel_generator.json")
+INVENTORY: list[InventoryItem] = []
+
+# Local list of event handlers used to maintain a reference so
+# they are not released and garbage collected.
+LOCAL_HANDLERS = []
+
+
+# Event messages are debug level, so they only reach the Text Command window in verbose mode
+def log(msg, *args, level: int = futil.DEBUG):
+    futil.log_message(level, f"[{CMD_NAME}] {msg}", *args)
+
+
+def getErrorMessage(text="An unknown error occurred"):
+    stackTrace = traceback.format_exc()
+    return f"{text}:<br>{stackTrace}"
+
+
+def getInventoryMessage(inventory: list[InventoryItem]):
+    if not inventory:
+        return "No generated panels found in this design."
+    lines = [f"{item.quantity} × {item.formatName}, {item.widthInHp} HP, {item.supportTypeName}" for item in inventory]
+    total = sum(item.quantity for item in inventory)
+    return "<br>".join(lines + [f"<b>{total} panels total</b>"])
+
+
+# Named for easy importing into panelInventoryDialog/entry.py
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    log("Command Created Event")
+    global INVENTORY
+    des = adsk.fusion.Design.cast(app.activeProduct)
+    INVENTORY = getPanelInventory(des, OPTIONS) if des else []
+
+    inputs = args.command.commandInputs
+    message = getInventoryMessage(INVENTORY)
+    inventoryTextBox = inputs.addTextBoxCommandInput("inventoryTextBox", "Panels", message, min(len(INVENTORY) + 2, 20), True)
+    inventoryTextBox.isFullWidth = True
+
+    args.command.okButtonText = "Export CSV"
+    args.command.isOKButtonVisible = bool(INVENTORY)
+    args.command.setDialogMinimumSize(400, 200)
+
+    # Register event handlers
+    futil.add_handler(args.command.execute, onCommandExecute, local_handlers=LOCAL_HANDLERS)
+    futil.add_handler(args.command.destroy, onCommandDestroy, local_handlers=LOCAL_HANDLERS)
+
+
+# Export the inventory when the user clicks the Export CSV button
+def onCommandExecute(args: adsk.core.CommandEventArgs):
+    log("Command Execute Event")
+    try:
+        fileDialog = ui.createFileDialog()
+        fileDialog.title = "Export panel inventory"
+        fileDialog.filter = "CSV files (*.csv)"
+        fileDialog.initialFilename = "panel_inventory.csv"
+        if fileDialog.showSave() != adsk.core.DialogResults.DialogOK:
+            return
+        writeInventoryCsv(fileDialog.filename, INVENTORY)
+        log("Exported %d inventory items to %s", len(INVENTORY), fileDialog.filename, level=futil.INFO)
+    except Exception as err:
+        args.executeFailed = True
+        args.executeFailedMessage = getErrorMessage()
+        log("Error occurred, %s, %s", err, getErrorMessage(), level=futil.ERROR)
+
+
+# This event handler is called when the command terminates.
+def onCommandDestroy(args: adsk.core.CommandEventArgs):
+    log("Command Destroy Event")
+    global LOCAL_HANDLERS, INVENTORY
+    LOCAL_HANDLERS = []
+    INVENTORY = []
@@ -0,0 +1,217 @@
+import math
+import re
+from dataclasses import dataclass, field
+
+# Streaming importer for KiCad .kicad_pcb board files (KiCad 5 and later), used to place panel holes where the
+# jacks, pots, switches and LEDs actually are on the module PCB. Board files are S-expressions that are megabytes
+# long, almost all of it tracks, zones and pads that don't matter here. So instead of parsing the whole file, it is
+# read in chunks and only scanned for the starts of top-level footprints and board edge graphics, which KiCad always
+# writes on lines of their own. Only footprints whose library ID maps to a hole type, and Edge.Cuts graphics, are
+# parsed at all. Like the layout, this module has no adsk dependencies.
+
+# Footprint library ID patterns (case-insensitive) and the hole type each maps to, first match wins
+KICAD_FOOTPRINT_TYPES = [
+    (re.compile(r"thonkiconn|pj301|pj398|jack_3\.5|audiojack|connector_audio", re.I), "jack"),
+    (re.compile(r"potentiometer|alpha_rd90|rk09|\bpot", re.I), "pot"),
+    (re.compile(r"switch_toggle|toggle|sw_spdt|sw_dpdt|sw_mini", re.I), "switch"),
+    (re.compile(r"button|sw_push|tactile|sw_tact", re.I), "button"),
+    (re.compile(r"led_d5\.0|led_5mm", re.I), "led5"),
+    (re.compile(r"led_d3\.0|led_3mm|led_tht", re.I), "led"),
+]
+
+# Top-level elements worth a closer look, the second group is the footprint library ID
+ELEMENT_START = re.compile(r'^[ \t]*\((footprint|module|gr_line|gr_rect|gr_arc|gr_circle|gr_poly)\s+("(?:[^"\\]|\\.)*"|[^\s()]+)?', re.M)
+TOKEN = re.compile(r'[()]|"(?:[^"\\]|\\.)*"|[^\s()"]+')
+UNESCAPE = re.compile(r"\\(.)")
+
+GRAPHIC_KINDS = {"fp_line", "fp_rect", "fp_arc", "fp_circle", "fp_poly"}
+COURTYARD_LAYERS = {"F.CrtYd", "B.CrtYd"}
+
+CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class KicadFootprint:
+    reference: str
+    libId: str
+    holeType: str
+    # Where the hole goes in mm, in KiCad board coordinates (y is down), see getFootprintCenter
+    x: float
+    y: float
+    layer: str
+
+
+@dataclass
+class KicadBoard:
+    # Only the footprints that map to a hole type, in file order
+    footprints: list[KicadFootprint] = field(default_factory=list)
+    byReference: dict[str, KicadFootprint] = field(default_factory=dict)
+    byLibId: dict[str, list[KicadFootprint]] = field(default_factory=dict)
+    # Board outline bounds from the Edge.Cuts layer in mm (min x, min y, max x, max y), if there is one
+    edges: tuple[float, float, float, float] | None = None
+
+    def add(self, footprint: KicadFootprint):
+        self.footprints.append(footprint)
+        self.byReference[footprint.reference] = footprint
+        self.byLibId.setdefault(footprint.libId, []).append(footprint)
+
+
+class IncompleteElement(Exception):
+    pass
+
+
+def getFootprintHoleType(libId: str):
+    for pattern, holeType in KICAD_FOOTPRINT_TYPES:
+        if pattern.search(libId):
+            return holeType
+    return None
+
+
+def unquote(token: str):
+    if token.startswith('"'):
+        return UNESCAPE.sub(r"\1", token[1:-1])
+    return token
+
+
+# Parses the S-expression starting at pos into nested lists of strings, raises IncompleteElement if text ends first
+def parseElement(text: str, pos: int):
+    stack: list[list] = []
+    for match in TOKEN.finditer(text, pos):
+        token = match.group()
+        if token == "(":
+            stack.append([])
+        elif token == ")":
+            element = stack.pop()
+            if not stack:
+                return element, match.end()
+            stack[-1].append(element)
+        else:
+            stack[-1].append(unquote(token))
+    raise IncompleteElement()
+
+
+def children(element: list, name: str):
+    return [child for child in element if isinstance(child, list) and child and child[0] == name]
+
+
+def child(element: list, name: str):
+    found = children(element, name)
+    return found[0] if found else None
+
+
+# Footprint origins are usually pin 1, not the shaft or barrel the hole is for. The hole goes in the middle of the
+# mounting pads (NPTH pads, or the "MP" pads of eg. pots) if there are any, otherwise in the middle of the courtyard.
+# Positions in footprints are relative to the origin, unrotated, and KiCad rotates counterclockwise with y down.
+def getFootprintCenter(element: list, x: float, y: float, angle: float):
+    pads = [pad for pad in children(element, "pad") if len(pad) > 2 and (pad[2] == "np_thru_hole" or pad[1] == "MP")]
+    points = [tuple(map(float, child(pad, "at")[1:3])) for pad in pads]
+    if not points:
+        points = [
+            point
+            for graphic in element
+            if isinstance(graphic, list) and graphic and graphic[0] in GRAPHIC_KINDS and getLayer(graphic) in COURTYARD_LAYERS
+            for point in getGraphicPoints(graphic)
+        ]
+    if not points:
+        return x, y
+    localX = (min(px for px, _ in points) + max(px for px, _ in points)) / 2
+    localY = (min(py for _, py in points) + max(py for _, py in points)) / 2
+    cos, sin = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    return x + localX * cos + localY * sin, y - localX * sin + localY * cos
+
+
+def getLayer(element: list):
+    layer = child(element, "layer")
+    return layer[1] if layer else ""
+
+
+def getFootprint(element: list, holeType: str):
+    libId = element[1]
+    at = child(element, "at")
+    layer = child(element, "layer")
+    reference = ""
+    # KiCad 6+ uses a Reference property, KiCad 5 an fp_text
+    for prop in children(element, "property"):
+        if len(prop) > 2 and prop[1] == "Reference":
+            reference = prop[2]
+    for text in children(element, "fp_text"):
+        if len(text) > 2 and text[1] == "reference":
+            reference = text[2]
+    x, y = getFootprintCenter(element, float(at[1]), float(at[2]), float(at[3]) if len(at) > 3 else 0)
+    return KicadFootprint(reference, libId, holeType, x, y, layer[1] if layer else "")
+
+
+def getEdgePoints(element: list):
+    if getLayer(element) != "Edge.Cuts":
+        return []
+    return getGraphicPoints(element)
+
+
+# Points that bound a board or footprint graphic (gr_* or fp_*)
+def getGraphicPoints(element: list):
+    if element[0] in ("gr_circle", "fp_circle"):
+        centerX, centerY = map(float, child(element, "center")[1:3])
+        endX, endY = map(float, child(element, "end")[1:3])
+        radius = ((endX - centerX) ** 2 + (endY - centerY) ** 2) ** 0.5
+        return [(centerX - radius, centerY - radius), (centerX + radius, centerY + radius)]
+    points = [point for name in ["start", "mid", "end"] for point in children(element, name)]
+    pts = child(element, "pts")
+    if pts:
+        points += children(pts, "xy")
+    return [(float(point[1]), float(point[2])) for point in points]
+
+
+def readKicadBoard(file, chunkSize: int = CHUNK_SIZE):
+    board = KicadBoard()
+    edgePoints: list[tuple[float, float]] = []
+    buffer = ""
+    atEnd = False
+
+    while not atEnd:
+        chunk = file.read(chunkSize)
+        atEnd = not chunk
+        buffer += chunk
+        # Element starts are only searched for in complete lines
+        endPos = len(buffer) if atEnd else buffer.rfind("\n") + 1
+        pos = 0
+        while True:
+            match = ELEMENT_START.search(buffer, pos, endPos)
+            if not match:
+                pos = max(pos, endPos)
+                break
+            kind, head = match.groups()
+            holeType = None
+            if kind in ("footprint", "module"):
+                holeType = getFootprintHoleType(unquote(head or ""))
+                if not holeType:
+                    pos = match.end()
+                    continue
+            try:
+                element, pos = parseElement(buffer, match.start(1) - 1)
+            except IncompleteElement:
+                if atEnd:
+                    raise ValueError(f"unexpected end of file in {kind}") from None
+                # Parse it again once the next chunk is in
+                pos = match.start()
+                break
+            if holeType:
+                board.add(getFootprint(element, holeType))
+            else:
+                edgePoints += getEdgePoints(element)
+        buffer = buffer[pos:]
+
+    if edgePoints:
+        xs = [x for x, _ in edgePoints]
+        ys = [y for _, y in edgePoints]
+        board.edges = (min(xs), min(ys), max(xs), max(ys))
+    return board
+
+
+# Raises ValueError (or OSError) for invalid or missing files
+def loadKicadBoard(path: str):
+    with open(path, encoding="utf-8") as file:
+        try:
+            return readKicadBoard(file)
+        except (IndexError, TypeError) as err:
+            # Footprints or board edges without the expected children
+            raise ValueError(f"malformed board file ({err})") from None
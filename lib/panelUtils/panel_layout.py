@@ -0,0 +1,207 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from .panel_holes import Hole, HoleMap, loadHoleMap
+
+if TYPE_CHECKING:
+    from .panel_options import PanelOptions
+
+# Panel layout, computed without any adsk dependencies so it can be generated, cached and validated outside
+# of Fusion. All values are in cm, relative to the anchor point at the origin, with the panel in the XY plane.
+# generatePanelComponent, the preview and any other output path translate this plan into Fusion calls.
+
+
+@dataclass(frozen=True, slots=True)
+class Rect:
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+    @property
+    def width(self):
+        return self.x1 - self.x0
+
+    @property
+    def length(self):
+        return self.y1 - self.y0
+
+    @property
+    def corners(self):
+        return {
+            "top-left": (self.x0, self.y1),
+            "top-right": (self.x1, self.y1),
+            "bottom-left": (self.x0, self.y0),
+            "bottom-right": (self.x1, self.y0),
+        }
+
+    @property
+    def bounds(self):
+        return (self.x0, self.y0, self.x1, self.y1)
+
+    @property
+    def center(self):
+        return ((self.x0 + self.x1) / 2, (self.y0 + self.y1) / 2)
+
+    def inset(self, offset: float):
+        return Rect(self.x0 + offset, self.y0 + offset, self.x1 - offset, self.y1 - offset)
+
+
+@dataclass(frozen=True, slots=True)
+class Slot:
+    # Panel corner the slot is positioned relative to, eg. "top-left"
+    corner: str
+    startX: float
+    startY: float
+    endX: float
+    endY: float
+    diameter: float
+
+    @property
+    def radius(self):
+        return self.diameter / 2
+
+    # Leftmost and rightmost slot center x, regardless of which corner the slot starts from
+    @property
+    def minX(self):
+        return min(self.startX, self.endX)
+
+    @property
+    def maxX(self):
+        return max(self.startX, self.endX)
+
+    @property
+    def bounds(self):
+        return (self.minX - self.radius, self.startY - self.radius, self.maxX + self.radius, self.startY + self.radius)
+
+
+@dataclass(frozen=True, slots=True)
+class PanelLayout:
+    anchorPoint: str
+    supportType: str
+    panel: Rect
+    # Distance from the top and bottom panel edges to the max PCB extents
+    railLength: float
+    # Area between the rails, within which anything extruded from the bottom must fit
+    supportArea: Rect
+    # Inside of the shell walls, when supportType is "shell"
+    shellInner: Rect | None
+    slots: tuple[Slot, ...]
+    # Component holes from the hole map, if any, relative to the anchor point like everything else
+    holes: tuple[Hole, ...] = ()
+    # Outline of the PCB the holes were imported from, centered in the support area, if known
+    pcb: Rect | None = None
+
+    @property
+    def problems(self):
+        problems: list[str] = []
+        if self.panel.width <= 0 or self.panel.length <= 0:
+            problems.append("Panel has no area")
+        if self.supportArea.length <= 0:
+            problems.append("Max PCB length leaves no room between the rails")
+        if self.shellInner and (self.shellInner.width <= 0 or self.shellInner.length <= 0):
+            problems.append("Shell walls are too thick for the panel")
+        for slot in self.slots:
+            if slot.minX - slot.radius < self.panel.x0 or slot.maxX + slot.radius > self.panel.x1:
+                problems.append(f"Mounting slot at {slot.corner} doesn't fit within the panel width")
+        if self.pcb and self.pcb.length > self.supportArea.length:
+            problems.append("PCB is longer than the format's max PCB length")
+        if self.pcb and self.pcb.width > self.panel.width:
+            problems.append("PCB is wider than the panel")
+        for hole in self.holes:
+            extentX, extentY = hole.extents
+            for x, y in hole.centers:
+                if x - extentX < self.panel.x0 or x + extentX > self.panel.x1 or y - extentY < self.panel.y0 or y + extentY > self.panel.y1:
+                    problems.append(f"{hole.type.capitalize()} hole at {x * 10:g}, {y * 10:g} mm doesn't fit within the panel")
+                    # One problem per hole map entry is enough, grids can have dozens of holes
+                    break
+        return problems
+
+
+def getPanelLayout(opts: "PanelOptions"):
+    return computePanelLayout(
+        opts.anchorPoint,
+        opts.supportType,
+        opts.widthInHp,
+        opts.width,
+        opts.panelLength,
+        opts.maxPcbLength,
+        opts.supportShellWallThickness,
+        opts.slotDiameter,
+        opts.slotLength,
+        opts.slotOffsetX,
+        opts.slotOffsetY,
+        # Raises for missing or invalid hole map files, see panel_plan.py
+        loadHoleMap(opts.holeMapFile) if opts.holeMapFile else None,
+    )
+
+
+@lru_cache(maxsize=1024)
+def computePanelLayout(
+    anchorPoint: str,
+    supportType: str,
+    widthInHp: int,
+    width: float,
+    panelLength: float,
+    maxPcbLength: float,
+    supportShellWallThickness: float,
+    slotDiameter: float,
+    slotLength: float,
+    slotOffsetX: float,
+    slotOffsetY: float,
+    holeMap: HoleMap | None = None,
+):
+    anchorPointVertical, anchorPointHorizontal = anchorPoint.split("-")
+    match anchorPointVertical:
+        case "top":
+            panelStartY = -panelLength
+        case "middle":
+            panelStartY = -panelLength / 2
+        case "bottom":
+            panelStartY = 0
+        case _:
+            raise ValueError("Invalid anchorPoint value")
+
+    match anchorPointHorizontal:
+        case "left":
+            panelStartX = 0
+        case "center":
+            panelStartX = -width / 2
+        case "right":
+            panelStartX = -width
+        case _:
+            raise ValueError("Invalid anchorPoint value")
+
+    panel = Rect(panelStartX, panelStartY, panelStartX + width, panelStartY + panelLength)
+
+    railLength = (panelLength - maxPcbLength) / 2
+    supportArea = Rect(panel.x0, panel.y0 + railLength, panel.x1, panel.y1 - railLength)
+    shellInner = supportArea.inset(supportShellWallThickness) if supportType == "shell" else None
+
+    # Screw holes, only on the left for narrow panels
+    slotCorners = [("top-left", -1, 1), ("bottom-left", 1, 1)]
+    if widthInHp >= 6:
+        slotCorners += [("top-right", -1, -1), ("bottom-right", 1, -1)]
+
+    corners = panel.corners
+    slots = []
+    for corner, yOffsetDirection, xOffsetDirection in slotCorners:
+        cornerX, cornerY = corners[corner]
+        startX = cornerX + xOffsetDirection * slotOffsetX
+        startY = cornerY + yOffsetDirection * slotOffsetY
+        endX = startX + xOffsetDirection * slotLength
+        slots.append(Slot(corner, startX, startY, endX, startY, slotDiameter))
+
+    holes: tuple[Hole, ...] = ()
+    pcb = None
+    if holeMap:
+        holes = holeMap.holes
+        # Imported boards sit in the middle of the PCB area between the rails
+        if holeMap.origin == "pcb":
+            centerX, centerY = supportArea.center
+            holes = tuple(hole.translated(centerX, centerY) for hole in holes)
+            if holeMap.pcbSize:
+                pcbWidth, pcbLength = holeMap.pcbSize
+                pcb = Rect(centerX - pcbWidth / 2, centerY - pcbLength / 2, centerX + pcbWidth / 2, centerY + pcbLength / 2)
+
+    return PanelLayout(anchorPoint, supportType, panel, railLength, supportArea, shellInner, tuple(slots), holes, pcb)
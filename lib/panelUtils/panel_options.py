@@ -1,6 +1,8 @@
 import adsk.core
 import adsk.fusion
 from ..generalUtils.persist_utils import Persistable
+from ..generalUtils.value_utils import Units
+from .panel_formats import getFormatRegistry
 
 app = adsk.core.Application.get()
 
@@ -19,31 +21,15 @@ class PanelOptions(Persistable):
         "solid": "Solid (good for larger blanks)",
         "shell": "Shell (leaves space for components)",
     }
-    __formatData = {
-        "__defaults": {
-            "hpWidth": 0.508,
-            "slotDiameter": 0.35,
-            "slotLength": 0.14,
-            "slotOffsetY": 0.3,
-            "slotOffsetX": 0.6,
-        },
-        "3u_eurorack": {
-            "name": "3U Eurorack",
-            "panelLength": 12.85,
-            "maxPcbLength": 11.0,
-        },
-        "1u_intellijel": {
-            "name": "1U (Intellijel)",
-            "panelLength": 3.965,
-            "maxPcbLength": 2.25,
-        },
-        "1u_pulplogic": {
-            "name": "1U Tile (Pulp Logic)",
-            "panelLength": 4.318,
-            "maxPcbLength": 2.87,
-            "slotOffsetX": 0.433,
-        },
-    }
+    # Version 0 defaults files, saved before they were versioned, have the same keys and need no migration
+    schemaVersion = 1
+
+    # Options that don't affect the generated geometry
+    __nonGeometryKeys = {"parametricPreview", "instanceIdenticalPanels"}
+
+    # Reverse name -> id indexes for the Fusion UI dropdowns, format names are indexed by the format registry
+    __anchorPointIdsByName = {name: id for id, name in __anchorPoints.items()}
+    __supportTypeIdsByName = {name: id for id, name in __supportTypes.items()}
 
     def __init__(self, persistFile: str):
         Persistable.__init__(
@@ -53,31 +39,79 @@ class PanelOptions(Persistable):
                 "formatId": "3u_eurorack",
                 "widthInHp": 6,
                 "sketchOnly": False,
+                "bakedOutput": False,
+                "parametricPreview": False,
+                "instanceIdenticalPanels": True,
                 "panelHeight": 0.2,
                 "anchorPoint": "top-left",
                 "supportType": "none",
                 "supportSolidHeight": 0.2,
                 "supportShellHeight": 0.9,
                 "supportShellWallThickness": 0.1,
+                "holeMapFile": "",
             },
         )
         self.formatId: str
         self.widthInHp: int
         self.sketchOnly: bool
+        # A single history-free body instead of a sketch and features, see bakePanelComponent
+        self.bakedOutput: bool
+        self.parametricPreview: bool
+        self.instanceIdenticalPanels: bool
         self.panelHeight: float
         self.anchorPoint: str
         self.supportType: str
         self.supportSolidHeight: float
         self.supportShellHeight: float
         self.supportShellWallThickness: float
+        # JSON or CSV file of component holes to cut, see panel_holes.py
+        self.holeMapFile: str
 
     def restoreDefaults(self):
         super().restoreDefaults()
-        self.ensureDefaultKeyIsValid("formatId", self.__formatData)
+        # Picks up added or changed format files, without re-parsing unchanged ones
+        self.ensureDefaultKeyIsValid("formatId", getFormatRegistry(refresh=True).formats)
         self.ensureDefaultKeyIsValid("anchorPoint", self.__anchorPoints)
         self.ensureDefaultKeyIsValid("supportType", self.__supportTypes)
 
+    # Problems with the IDs in stored options (eg. a panel's or a preset's) that this version doesn't know, eg. from a
+    # removed format file. Unlike defaults, these can't quietly be replaced, so they're checked before being applied.
+    def getUnknownIdProblems(self, data: dict):
+        validIds = {
+            "format": ("formatId", self.formatIds),
+            "anchor point": ("anchorPoint", self.__anchorPoints),
+            "support type": ("supportType", self.__supportTypes),
+        }
+        return [
+            f'unknown {label} "{data[key]}"'
+            for label, (key, ids) in validIds.items()
+            if key in data and (not isinstance(data[key], str) or data[key] not in ids)
+        ]
+
+    # Sketch only panels have no body to bake
+    @property
+    def isBaked(self):
+        return self.bakedOutput and not self.sketchOnly
+
+    @property
+    def panelName(self):
+        return "{} {} HP Panel".format(self.formatName, self.widthInHp)
+
+    # Every option that affects the generated geometry, which is what presets store
+    @property
+    def geometryOptions(self):
+        return {key: getattr(self, key) for key in self._defaults if key not in self.__nonGeometryKeys}
+
+    # Hashable snapshot of every option that affects the generated geometry
+    @property
+    def fingerprint(self):
+        return tuple(self.geometryOptions.items())
+
     # anchorPoint getters and setters by name for the Fusion UI
+    @property
+    def anchorPointIds(self):
+        return self.__anchorPoints.keys()
+
     @property
     def anchorPointNames(self):
         return self.__anchorPoints.values()
@@ -87,13 +121,17 @@ class PanelOptions(Persistable):
         return self.__anchorPoints[self.anchorPoint]
 
     def getIdForAnchorPointName(self, name: str):
-        return next(key for key, value in self.__anchorPoints.items() if value == name)
+        return self.__anchorPointIdsByName[name]
 
     @anchorPointName.setter
     def anchorPointName(self, name: str):
         self.anchorPoint = self.getIdForAnchorPointName(name)
 
     # supportType getters and setters by name for the Fusion UI
+    @property
+    def supportTypeIds(self):
+        return self.__supportTypes.keys()
+
     @property
     def supportTypeNames(self):
         return self.__supportTypes.values()
@@ -103,63 +141,69 @@ class PanelOptions(Persistable):
         return self.__supportTypes[self.supportType]
 
     def getIdForSupportTypeName(self, name: str):
-        return next(key for key, value in self.__supportTypes.items() if value == name)
+        return self.__supportTypeIdsByName[name]
 
     @supportTypeName.setter
     def supportTypeName(self, name: str):
         self.supportType = self.getIdForSupportTypeName(name)
 
     # formatId getters and setters by name for the Fusion UI
+    @property
+    def formatIds(self):
+        return getFormatRegistry().formats.keys()
+
     @property
     def formatNames(self):
-        return [obj["name"] for obj in self.__formatData.values() if "name" in obj]
+        return getFormatRegistry().idsByName.keys()
 
     @property
     def formatName(self):
-        return self.__formatData[self.formatId]["name"]
+        return self.format.name
 
     def getIdForFormatName(self, name: str):
-        return next(key for key, value in self.__formatData.items() if "name" in value and value["name"] == name)
+        return getFormatRegistry().idsByName[name]
+
+    def getFormatByName(self, name: str):
+        registry = getFormatRegistry()
+        return registry.formats[registry.idsByName[name]]
 
     @formatName.setter
     def formatName(self, name: str):
         self.formatId = self.getIdForFormatName(name)
 
     # Format data getters
-    def __formatValue(self, key: str):
-        return (self.__formatData["__defaults"] | self.__formatData[self.formatId])[key]
+    @property
+    def format(self):
+        return getFormatRegistry().formats[self.formatId]
 
     @property
     def width(self):
-        return self.__formatValue("hpWidth") * self.widthInHp
+        return self.format.hpWidth * self.widthInHp
 
-    @property
-    def widthAsExpression(self):
+    def getWidthExpression(self, units: Units):
         # Ensure value is specified as HP * hpWidth in the user's default units for easy adjustments later
-        design = adsk.fusion.Design.cast(app.activeProduct)
-        unitsMgr = design.fusionUnitsManager
-        return "{} * {}".format(self.widthInHp, unitsMgr.formatValue(self.__formatValue("hpWidth")))
+        return "{} * {}".format(self.widthInHp, units.expression(self.format.hpWidth))
 
     @property
     def panelLength(self):
-        return self.__formatValue("panelLength")
+        return self.format.panelLength
 
     @property
     def maxPcbLength(self):
-        return self.__formatValue("maxPcbLength")
+        return self.format.maxPcbLength
 
     @property
     def slotDiameter(self):
-        return self.__formatValue("slotDiameter")
+        return self.format.slotDiameter
 
     @property
     def slotLength(self):
-        return self.__formatValue("slotLength")
+        return self.format.slotLength
 
     @property
     def slotOffsetY(self):
-        return self.__formatValue("slotOffsetY")
+        return self.format.slotOffsetY
 
     @property
     def slotOffsetX(self):
-        return self.__formatValue("slotOffsetX")
+        return self.format.slotOffsetX
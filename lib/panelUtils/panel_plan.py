@@ -0,0 +1,64 @@
+import copy
+from dataclasses import dataclass, field
+from .panel_batch import parseBatchSpecs
+from .panel_layout import PanelLayout, getPanelLayout
+from .panel_options import PanelOptions
+
+# Everything about the current dialog state that can be worked out without the Fusion API: the layout, its
+# validation and the parsed batch specs. Plans are pure Python, so they can be computed on a background thread
+# (see panel_command.py), leaving only the unavoidable adsk calls for the main thread.
+
+
+@dataclass
+class PanelPlan:
+    # Identifies the dialog state the plan was computed from
+    key: tuple
+    opts: PanelOptions
+    layout: PanelLayout | None = None
+    batchPanels: list[PanelOptions] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def isValid(self):
+        return not self.problems
+
+
+def getPlanKey(opts: PanelOptions, batchSpecs: str):
+    return (opts.fingerprint, batchSpecs)
+
+
+# opts must be a snapshot that isn't changed while the plan is computed, see snapshotOptions
+def computePanelPlan(opts: PanelOptions, batchSpecs: str, presets: dict[str, dict]):
+    plan = PanelPlan(getPlanKey(opts, batchSpecs), opts)
+    try:
+        addPlanDetails(plan, batchSpecs, presets)
+    except Exception as err:
+        # A bug, but the plan must not look valid (and a plan computed on the worker thread must not get lost)
+        plan.problems.append(f"Unable to plan panels: {err!r}")
+    return plan
+
+
+def addPlanDetails(plan: PanelPlan, batchSpecs: str, presets: dict[str, dict]):
+    opts = plan.opts
+    try:
+        plan.batchPanels = parseBatchSpecs(batchSpecs, opts, presets)
+    except ValueError as err:
+        plan.problems.append(str(err))
+        return
+
+    for panelOpts in plan.batchPanels or [opts]:
+        try:
+            layout = getPanelLayout(panelOpts)
+        except OSError:
+            plan.problems.append(f"{panelOpts.panelName}: Unable to read hole map {panelOpts.holeMapFile}")
+            continue
+        except ValueError as err:
+            plan.problems.append(f"{panelOpts.panelName}: {err}")
+            continue
+        plan.problems += [f"{panelOpts.panelName}: {problem}" for problem in layout.problems]
+        if not plan.batchPanels:
+            plan.layout = layout
+
+
+def snapshotOptions(opts: PanelOptions):
+    return copy.copy(opts)
@@ -0,0 +1,67 @@
+import adsk.core
+import adsk.fusion
+import math
+from .panel_body import buildPanelBody
+from .panel_options import PanelOptions
+from .panel_layout import PanelLayout, Rect, getPanelLayout
+
+app = adsk.core.Application.get()
+
+# The preview is drawn directly from the panel layout, without any sketch, constraint, extrude or
+# timeline work, so it costs the same no matter how wide the panel is. The full parametric panel is
+# only generated when the command is executed.
+
+ARC_SEGMENTS = 8
+OUTLINE_COLOR = (0, 120, 215, 255)
+BODY_COLOR = (180, 180, 180, 255)
+
+
+def drawPanelPreview(graphics: adsk.fusion.CustomGraphicsGroup, opts: PanelOptions, layout: PanelLayout | None = None):
+    layout = layout or getPanelLayout(opts)
+    drawOutline(graphics, layout)
+    if not opts.sketchOnly:
+        drawBody(graphics, opts, layout)
+
+
+def drawOutline(graphics: adsk.fusion.CustomGraphicsGroup, layout: PanelLayout):
+    coords: list[float] = []
+
+    def addPolyline(points: list[tuple[float, float]]):
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            coords.extend([ax, ay, 0, bx, by, 0])
+
+    def addRectangle(rect: Rect):
+        addPolyline([(rect.x0, rect.y0), (rect.x1, rect.y0), (rect.x1, rect.y1), (rect.x0, rect.y1), (rect.x0, rect.y0)])
+
+    addRectangle(layout.panel)
+    if layout.supportType != "none":
+        addRectangle(layout.supportArea)
+    if layout.shellInner:
+        addRectangle(layout.shellInner)
+    if layout.pcb:
+        addRectangle(layout.pcb)
+
+    angles = [math.pi * i / ARC_SEGMENTS for i in range(ARC_SEGMENTS + 1)]
+    for slot in layout.slots:
+        startX, endX, y, radius = slot.minX, slot.maxX, slot.startY, slot.radius
+        startArc = [(startX - radius * math.sin(a), y + radius * math.cos(a)) for a in angles]
+        endArc = [(endX + radius * math.sin(a), y - radius * math.cos(a)) for a in angles]
+        addPolyline(startArc + endArc + startArc[:1])
+
+    circleAngles = [2 * math.pi * i / (2 * ARC_SEGMENTS) for i in range(2 * ARC_SEGMENTS + 1)]
+    for hole in layout.holes:
+        extentX, extentY = hole.extents
+        for x, y in hole.centers:
+            if hole.isRect:
+                addRectangle(Rect(x - extentX, y - extentY, x + extentX, y + extentY))
+            else:
+                addPolyline([(x + extentX * math.cos(a), y + extentX * math.sin(a)) for a in circleAngles])
+
+    lines = graphics.addLines(adsk.fusion.CustomGraphicsCoordinates.create(coords), list(range(len(coords) // 3)), False)
+    lines.weight = 2
+    lines.color = adsk.fusion.CustomGraphicsSolidColorEffect.create(adsk.core.Color.create(*OUTLINE_COLOR))
+
+
+def drawBody(graphics: adsk.fusion.CustomGraphicsGroup, opts: PanelOptions, layout: PanelLayout):
+    graphicsBody = graphics.addBRepBody(buildPanelBody(opts, layout))
+    graphicsBody.color = adsk.fusion.CustomGraphicsSolidColorEffect.create(adsk.core.Color.create(*BODY_COLOR))